@@ -1,9 +1,52 @@
+from django.core.paginator import EmptyPage
+from django.core.paginator import Paginator as DjangoPaginator
+from django.utils.functional import cached_property
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import (
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
+)
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
+from baserow.core.db import get_estimated_or_exact_count
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    """
+    A paginator that only counts the rows exactly if there aren't too many of them,
+    otherwise the planner estimate is used. Because the estimate can be lower than
+    the actual number of rows, pages after the estimated last page are still
+    fetched.
+    """
+
+    count_is_exact = True
+
+    @cached_property
+    def count(self):
+        count, self.count_is_exact = get_estimated_or_exact_count(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_is_exact or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_is_exact:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
     # Please keep the default page size in sync with the default prop pageSize in
@@ -11,10 +54,26 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, estimate_count=False, *args, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param estimate_count: Indicates whether the count can be estimated if the
+            queryset contains a lot of rows. The response will then also contain
+            whether the count is exact.
+        """
+
         self.limit_page_size = limit_page_size
+        self.estimate_count = estimate_count
+        if estimate_count:
+            self.django_paginator_class = EstimatedCountPaginator
         super().__init__(*args, **kwargs)
 
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.estimate_count:
+            response.data["count_is_exact"] = self.page.paginator.count_is_exact
+        return response
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -39,3 +98,38 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    count_is_exact = True
+
+    def __init__(self, estimate_count=False, *args, **kwargs):
+        """
+        :param estimate_count: Indicates whether the count can be estimated if the
+            queryset contains a lot of rows. The response will then also contain
+            whether the count is exact.
+        """
+
+        self.estimate_count = estimate_count
+        super().__init__(*args, **kwargs)
+
+    def get_count(self, queryset):
+        if not self.estimate_count:
+            return super().get_count(queryset)
+
+        count, self.count_is_exact = get_estimated_or_exact_count(queryset)
+        return count
+
+    def paginate_queryset(self, queryset, request, view=None):
+        results = super().paginate_queryset(queryset, request, view)
+        # The estimated count can be lower than the actual number of rows, so the
+        # rows must be fetched even if the offset is higher than the count.
+        if results == [] and not self.count_is_exact:
+            results = list(queryset[self.offset : self.offset + self.limit])
+        return results
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.estimate_count:
+            response.data["count_is_exact"] = self.count_is_exact
+        return response
@@ -167,6 +167,7 @@ BASEROW_ROLE_USAGE_QUEUE = os.getenv("BASEROW_GROUP_STORAGE_USAGE_QUEUE", "expor
 CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
     "baserow.contrib.database.export.tasks.run_export_job": {"queue": "export"},
+    "baserow.contrib.database.export.tasks.run_export_job_shard": {"queue": "export"},
     "baserow.contrib.database.export.tasks.clean_up_old_jobs": {"queue": "export"},
     "baserow.core.trash.tasks.mark_old_trash_for_permanent_deletion": {
         "queue": "export"
@@ -342,6 +343,13 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
 
+# When enabled, cached view aggregations like counts, sums, minimums and maximums are
+# updated using only the changed rows instead of being recomputed over all the rows
+# the next time they're requested.
+INCREMENTAL_VIEW_AGGREGATIONS_ENABLED = (
+    os.getenv("BASEROW_INCREMENTAL_VIEW_AGGREGATIONS_ENABLED", "false") == "true"
+)
+
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
 # going to be any relations between the application schema and the user schema.
@@ -803,6 +811,11 @@ ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
+# When an estimated count is requested while listing rows, querysets that are
+# expected to contain fewer rows than this are still counted exactly.
+BASEROW_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("BASEROW_ESTIMATED_COUNT_THRESHOLD", 100000)
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 
@@ -838,6 +851,12 @@ BASEROW_OPENAI_UPLOADED_FILE_SIZE_LIMIT_MB = int(
 EXPORT_FILES_DIRECTORY = "export_files"
 EXPORT_CLEANUP_INTERVAL_MINUTES = 5
 EXPORT_FILE_EXPIRE_MINUTES = 60
+# When the id range of an exported table or view spans at least
+# `EXPORT_SHARD_MIN_ROWS` rows, the export is split into this many id ranges which
+# are exported concurrently by separate celery tasks and zipped together. A value of
+# 1 exports all the rows in a single file.
+EXPORT_SHARD_COUNT = int(os.getenv("BASEROW_EXPORT_SHARD_COUNT", "1"))
+EXPORT_SHARD_MIN_ROWS = int(os.getenv("BASEROW_EXPORT_SHARD_MIN_ROWS", "1000000"))
 
 # The interval in minutes that the mentions cleanup job should run. This job will
 # remove mentions that are no longer used.
@@ -1023,6 +1042,22 @@ BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST = [
 BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS = int(
     os.getenv("BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS", "10")
 )
+# When enabled, the calls of an event are sent concurrently by a single task that
+# reuses keep-alive connections, instead of one task per webhook call.
+BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED = (
+    os.getenv("BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED", "false") == "true"
+)
+BASEROW_WEBHOOKS_POOLED_DISPATCH_MAX_WORKERS = int(
+    os.getenv("BASEROW_WEBHOOKS_POOLED_DISPATCH_MAX_WORKERS", 8)
+)
+# If set, the pooled dispatcher waits this many seconds after the first event and
+# merges the events of the same webhook triggered in the meantime into one call.
+BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS = float(
+    os.getenv("BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS", 0)
+)
+BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS = int(
+    os.getenv("BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS", 100)
+)
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -1062,6 +1097,22 @@ BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
 BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
     os.getenv("BASEROW_ROW_HISTORY_RETENTION_DAYS", 180)
 )
+# The history of updates changing at least this many rows is written in the
+# background, after the update has been committed. Set it to 0 to always write the
+# history while updating the rows.
+BASEROW_ROW_HISTORY_ASYNC_MIN_ROWS = int(
+    os.getenv("BASEROW_ROW_HISTORY_ASYNC_MIN_ROWS", 200)
+)
+# The number of row history entries written per transaction when they're written
+# asynchronously. Set it to 0 to write all the entries in a single transaction.
+BASEROW_ROW_HISTORY_WRITE_BATCH_SIZE = int(
+    os.getenv("BASEROW_ROW_HISTORY_WRITE_BATCH_SIZE", 1000)
+)
+# The number of outdated entries deleted per transaction by the cleanup job. Set it
+# to 0 to delete all the outdated entries in a single transaction.
+BASEROW_ROW_HISTORY_CLEANUP_BATCH_SIZE = int(
+    os.getenv("BASEROW_ROW_HISTORY_CLEANUP_BATCH_SIZE", 10000)
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
@@ -1163,6 +1214,33 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of built table models, and the maximum total number of fields
+# of those models, that each process keeps in memory. The process local model cache
+# is disabled by default, set the size to for example 128 to enable it.
+BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE = int(
+    os.getenv("BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE", 0)
+)
+BASEROW_LOCAL_MODEL_CACHE_MAX_FIELDS = int(
+    os.getenv("BASEROW_LOCAL_MODEL_CACHE_MAX_FIELDS", 20000)
+)
+# The maximum number of specific fields and field dependants that each process keeps
+# in memory, so that row operations don't have to fetch them again. The shared field
+# cache is disabled by default, set the size to for example 1000 to enable it.
+BASEROW_SHARED_FIELD_CACHE_MAX_SIZE = int(
+    os.getenv("BASEROW_SHARED_FIELD_CACHE_MAX_SIZE", 0)
+)
+# The number of seconds the users that are permitted to receive a realtime event about
+# an object are cached. The cache is invalidated when the members, teams or roles of
+# the workspace change. Set it to 0 to disable the cache.
+BASEROW_PERMITTED_USERS_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_PERMITTED_USERS_CACHE_TIMEOUT", 60 * 60)
+)
+# The number of seconds the computed roles of a user in a workspace are cached. The
+# cache is invalidated when the members, teams or roles of the workspace change. Set
+# it to 0 to disable the cache.
+BASEROW_PERMISSIONS_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_PERMISSIONS_CACHE_TIMEOUT", 60 * 60)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1194,6 +1272,14 @@ USE_PG_FULLTEXT_SEARCH = str_to_bool(
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# When all the tsvector cells of a table with at least
+# `TSV_UPDATE_PARALLEL_MIN_ROWS` rows must be updated, the update is split into this
+# many id ranges which are updated concurrently by separate celery tasks. A value of
+# 1 updates all the rows in a single task.
+TSV_UPDATE_PARALLEL_WORKERS = int(os.getenv("BASEROW_TSV_UPDATE_PARALLEL_WORKERS", "1"))
+TSV_UPDATE_PARALLEL_MIN_ROWS = int(
+    os.getenv("BASEROW_TSV_UPDATE_PARALLEL_MIN_ROWS", "100000")
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
@@ -1209,6 +1295,21 @@ BASEROW_BUILDER_DOMAINS = (
     BASEROW_BUILDER_DOMAINS.split(",") if BASEROW_BUILDER_DOMAINS is not None else []
 )
 
+# The maximum number of threads used to concurrently dispatch the data sources of a
+# builder page that don't depend on each other. Every thread uses its own database
+# connection. If 1, then the data sources are dispatched one after another.
+BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS", 4)
+)
+
+# The number of seconds the results of the data sources of the published builders are
+# cached and shared between the visitors. The cached results are invalidated when the
+# rows, fields or views of the database they read from change. If 0, then the results
+# aren't cached.
+BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT", 0)
+)
+
 # Indicates whether we are running the tests or not. Set to True in the test.py settings
 # file used by pytest.ini
 TESTS = False
@@ -58,6 +58,13 @@ AUTO_INDEX_VIEW_ENABLED = False
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
+# The default cache isn't cleared between the tests, so the permission caches are
+# only enabled by the tests that use them.
+BASEROW_PERMITTED_USERS_CACHE_TIMEOUT = 0
+BASEROW_PERMISSIONS_CACHE_TIMEOUT = 0
+# The worker threads don't see the data created inside the test transaction, so the
+# data sources are dispatched one after another unless a test enables the threads.
+BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS = 1
 
 # Ensure the tests never run with the concurrent middleware unless they add it in to
 # prevent failures caused by the middleware itself
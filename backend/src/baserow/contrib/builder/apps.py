@@ -293,9 +293,13 @@ class BuilderConfig(AppConfig):
 
         connect_to_domain_pre_delete_signal()
 
-        from .data_sources.receivers import connect_to_data_source_pre_delete_signal
+        from .data_sources.receivers import (
+            connect_to_data_source_pre_delete_signal,
+            connect_to_database_change_signals,
+        )
 
         connect_to_data_source_pre_delete_signal()
+        connect_to_database_change_signals()
 
         # The signals must always be imported last because they use the registries
         # which need to be filled first.
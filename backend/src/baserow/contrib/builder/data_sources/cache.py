@@ -0,0 +1,186 @@
+"""
+Caches the results of the data sources of the published builders between the
+requests, so that the visitors of a published application don't all run the same
+queries.
+
+The results are cached in the default Django cache. A cache key contains the
+configuration of the service, the resolved values of its formulas, the requested range
+and the role of the visitor, so that visitors that would get the same result share the
+cache entry. It also contains the data version of the database the service reads
+from. That version changes when the rows, fields or views of any table of the
+database change, which invalidates all the cached results of the database at once. The
+whole database is invalidated because the formula, lookup and link row fields make the
+rows of a table depend on the other tables of the database.
+"""
+
+import hashlib
+import json
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from opentelemetry import metrics
+
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+
+if TYPE_CHECKING:
+    from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+        BuilderDispatchContext,
+    )
+    from baserow.contrib.builder.data_sources.models import DataSource
+
+meter = metrics.get_meter(__name__)
+
+public_data_source_cache_hits = meter.create_counter(
+    "baserow.builder.public_data_source_cache.hits",
+    unit="1",
+    description="The number of public data source dispatches served from the cache.",
+)
+public_data_source_cache_misses = meter.create_counter(
+    "baserow.builder.public_data_source_cache.misses",
+    unit="1",
+    description="The number of public data source dispatches that weren't cached "
+    "and had to be dispatched.",
+)
+
+
+def get_database_data_version_cache_key(database_id: int) -> str:
+    return f"builder_data_source_database_version__{database_id}"
+
+
+def get_database_data_version(database_id: int) -> str:
+    """
+    Returns the current data version of the database, creating one if it doesn't
+    exist yet.
+    """
+
+    cache_key = get_database_data_version_cache_key(database_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # If another process created a version in the meantime, then `add` doesn't
+        # overwrite it and that one must be used.
+        cache.add(cache_key, str(uuid.uuid4()), timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def invalidate_database_data_sources_cache(database_id: int):
+    """
+    Changes the data version of the database once the current transaction commits,
+    so that the cached data source results reading from it are dispatched again
+    using the committed data.
+    """
+
+    if settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT <= 0:
+        return
+
+    cache_key = get_database_data_version_cache_key(database_id)
+    transaction.on_commit(lambda: cache.set(cache_key, str(uuid.uuid4()), timeout=None))
+
+
+def get_public_data_source_cache_key(
+    data_source: "DataSource", dispatch_context: "BuilderDispatchContext"
+) -> Optional[str]:
+    """
+    Returns the key the result of the data source is cached with for the provided
+    dispatch context, or None if the result can't be shared with other requests.
+    Only the data sources of published builders reading from a table are cached.
+    The published builders are copies that can't be edited, so the filters and
+    sorts of their services never change.
+
+    :param data_source: The data source that is going to be dispatched.
+    :param dispatch_context: The context used for the dispatch.
+    :return: The cache key, or None if the result must not be cached.
+    """
+
+    if settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT <= 0:
+        return None
+
+    if dispatch_context.page.builder.workspace_id is not None:
+        return None
+
+    service = data_source.service.specific
+    table = getattr(service, "table", None)
+    if table is None:
+        return None
+
+    service_type = service.get_type()
+    resolved_formulas = []
+    for formula in service_type.formula_generator(service):
+        # Resolving a formula can dispatch the data sources it reads from, which
+        # adds them to the call stack. That must not be reported as a recursion when
+        # the formulas are resolved again during the dispatch.
+        call_stack = set(dispatch_context.call_stack)
+        try:
+            resolved_formulas.append(
+                resolve_formula(
+                    formula, formula_runtime_function_registry, dispatch_context
+                )
+            )
+        except Exception:
+            # The dispatch raises the error, there is nothing to cache.
+            return None
+        finally:
+            dispatch_context.call_stack = call_stack
+
+    user_source_user = getattr(dispatch_context.request, "user_source_user", None)
+    role = (
+        user_source_user.role
+        if user_source_user is not None and user_source_user.is_authenticated
+        else ""
+    )
+
+    key_content = json.dumps(
+        {
+            "service": {
+                field.attname: getattr(service, field.attname)
+                for field in service._meta.concrete_fields
+            },
+            "formulas": resolved_formulas,
+            "range": (
+                dispatch_context.range(service) if service_type.returns_list else None
+            ),
+            "role": role,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    key_hash = hashlib.sha256(key_content.encode()).hexdigest()
+    version = get_database_data_version(table.database_id)
+
+    return f"builder_data_source_result__{service.id}_{version}_{key_hash}"
+
+
+def get_or_dispatch_public_data_source(
+    data_source: "DataSource",
+    dispatch_context: "BuilderDispatchContext",
+    dispatch: Callable[[], Any],
+) -> Any:
+    """
+    Returns the cached result of the data source if it can be shared between the
+    requests and is cached, otherwise dispatches it using the provided callable and
+    caches the result when possible.
+    """
+
+    cache_key = get_public_data_source_cache_key(data_source, dispatch_context)
+    if cache_key is None:
+        return dispatch()
+
+    attributes = {"service_type": data_source.service.specific.get_type().type}
+    result = cache.get(cache_key)
+    if result is not None:
+        public_data_source_cache_hits.add(1, attributes)
+        return result
+
+    public_data_source_cache_misses.add(1, attributes)
+    result = dispatch()
+    cache.set(
+        cache_key,
+        result,
+        timeout=settings.BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT,
+    )
+    return result
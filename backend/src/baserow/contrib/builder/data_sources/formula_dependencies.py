@@ -0,0 +1,54 @@
+from typing import Set
+
+from baserow.contrib.builder.formula_importer import BaserowFormulaImporter
+from baserow.core.formula import BaserowFormula
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.utils import to_path
+
+
+class BaserowFormulaDataSourceIdsExtractor(BaserowFormulaImporter):
+    """
+    This visitor collects the ids of the data sources referenced by the `get()`
+    function calls of a formula, like the `2` of `get('data_source.2.field_25')`,
+    instead of updating their path.
+    """
+
+    def __init__(self):
+        super().__init__({})
+        self.data_source_ids = set()
+
+    def _do_func_import(self, function_argument_expressions, function_name: str):
+        args = [expr.accept(self) for expr in function_argument_expressions]
+
+        if function_name == "get" and isinstance(
+            function_argument_expressions[0], BaserowFormula.StringLiteralContext
+        ):
+            data_provider_name, *path = to_path(args[0][1:-1])
+            if data_provider_name == "data_source" and path:
+                try:
+                    self.data_source_ids.add(int(path[0]))
+                except ValueError:
+                    pass
+
+        return f"{function_name}({','.join(args)})"
+
+
+def get_data_source_ids_from_formula(formula: str) -> Set[int]:
+    """
+    Returns the ids of the data sources the formula reads data from.
+
+    :param formula: The formula to analyse.
+    :return: The referenced data source ids. Empty if the formula can't be parsed,
+        the error is then raised when the formula is resolved.
+    """
+
+    if not formula:
+        return set()
+
+    extractor = BaserowFormulaDataSourceIdsExtractor()
+    try:
+        extractor.visit(get_parse_tree_for_formula(formula))
+    except Exception:  # nosec
+        return set()
+
+    return extractor.data_source_ids
@@ -1,16 +1,26 @@
-from typing import Any, Dict, Iterable, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connections
 from django.db.models import QuerySet
 
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
 )
+from baserow.contrib.builder.data_sources.cache import (
+    get_or_dispatch_public_data_source,
+)
 from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
 )
+from baserow.contrib.builder.data_sources.formula_dependencies import (
+    get_data_source_ids_from_formula,
+)
 from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
@@ -316,11 +326,43 @@ class DataSourceHandler:
 
         data_source.delete()
 
+    def get_data_source_dependencies(
+        self, data_sources: List[DataSource]
+    ) -> Dict[int, Set[int]]:
+        """
+        Finds out which of the given data sources each data source needs to be
+        dispatched, by looking at the data sources referenced by the formulas of
+        its service.
+
+        :param data_sources: The data sources to get the dependencies of.
+        :return: The ids of the data sources each data source depends on, mapped
+            by data source ID. Only the given data sources are taken into account.
+        """
+
+        data_source_ids = {data_source.id for data_source in data_sources}
+        dependencies = {}
+        for data_source in data_sources:
+            dependencies[data_source.id] = set()
+            if not data_source.service_id:
+                continue
+
+            service = data_source.service.specific
+            for formula in service.get_type().formula_generator(service):
+                dependencies[data_source.id] |= get_data_source_ids_from_formula(
+                    formula
+                )
+            dependencies[data_source.id] &= data_source_ids - {data_source.id}
+
+        return dependencies
+
     def dispatch_data_sources(
         self, data_sources, dispatch_context: BuilderDispatchContext
     ):
         """
-        Dispatch the service related to the data_sources.
+        Dispatch the service related to the data_sources. If the
+        `BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS` setting allows it, the
+        data sources that don't depend on each other are dispatched concurrently,
+        the others are dispatched as soon as the data sources they depend on are.
 
         :param data_sources: The data sources to be dispatched.
         :param dispatch_context: The context used for the dispatch.
@@ -329,20 +371,92 @@ class DataSourceHandler:
             result for this data source.
         """
 
-        data_sources_dispatch = {}
-        for data_source in data_sources:
-            # Add the initial call to the call stack
-            dispatch_context.add_call(data_source.id)
-            try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
+        max_workers = min(
+            settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS,
+            len(data_sources),
+        )
+        if max_workers <= 1:
+            return {
+                data_source.id: self._dispatch_data_source_or_exception(
                     data_source, dispatch_context
                 )
-            except Exception as e:
-                data_sources_dispatch[data_source.id] = e
-            # Reset the stack as we are starting a new dispatch
-            dispatch_context.reset_call_stack()
+                for data_source in data_sources
+            }
+
+        dependencies = self.get_data_source_dependencies(data_sources)
+        pending = {data_source.id: data_source for data_source in data_sources}
+        data_sources_dispatch = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while True:
+                for data_source_id, data_source in list(pending.items()):
+                    if dependencies[data_source_id] <= data_sources_dispatch.keys():
+                        del pending[data_source_id]
+                        future = executor.submit(
+                            self._dispatch_data_source_in_thread,
+                            data_source,
+                            dispatch_context,
+                        )
+                        running[future] = data_source_id
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    data_sources_dispatch[running.pop(future)] = future.result()
+
+        # The remaining data sources depend on each other, dispatching them one
+        # after another lets the call stack report the recursion.
+        for data_source_id, data_source in pending.items():
+            data_sources_dispatch[
+                data_source_id
+            ] = self._dispatch_data_source_or_exception(data_source, dispatch_context)
+
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
+
+    def _dispatch_data_source_or_exception(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the data source and returns the exception instead of raising it,
+        so that one failing data source doesn't prevent the others to be dispatched.
+        """
+
+        # Add the initial call to the call stack
+        dispatch_context.add_call(data_source.id)
+        try:
+            result = self.dispatch_data_source(data_source, dispatch_context)
+        except Exception as e:
+            result = e
+        # Reset the stack as we are starting a new dispatch
+        dispatch_context.reset_call_stack()
 
-        return data_sources_dispatch
+        return result
+
+    def _dispatch_data_source_in_thread(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the data source in a worker thread. The thread gets its own call
+        stack, but shares the cache with the other threads so that the results of
+        the data sources it depends on are reused.
+        """
+
+        thread_dispatch_context = copy(dispatch_context)
+        thread_dispatch_context.reset_call_stack()
+        try:
+            return self._dispatch_data_source_or_exception(
+                data_source, thread_dispatch_context
+            )
+        finally:
+            # The database connections are opened per thread, so they must be closed
+            # before the thread is returned to the pool.
+            connections.close_all()
 
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
@@ -363,8 +477,12 @@ class DataSourceHandler:
         if data_source.id not in dispatch_context.cache.setdefault(
             "data_source_contents", {}
         ):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, dispatch_context
+            service_dispatch = get_or_dispatch_public_data_source(
+                data_source,
+                dispatch_context,
+                lambda: self.service_handler.dispatch_service(
+                    data_source.service.specific, dispatch_context
+                ),
             )
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
@@ -1,6 +1,13 @@
 from django.db.models.signals import pre_delete
 
+from baserow.contrib.builder.data_sources.cache import (
+    invalidate_database_data_sources_cache,
+)
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
+from baserow.contrib.database.views import signals as view_signals
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 
@@ -19,3 +26,66 @@ def before_data_source_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_data_source_pre_delete_signal():
     pre_delete.connect(before_data_source_permanently_deleted, DataSource)
+
+
+def table_data_changed(sender, table, **kwargs):
+    """
+    Invalidates the cached public data source results that could read the rows of
+    the changed table.
+    """
+
+    invalidate_database_data_sources_cache(table.database_id)
+
+
+def field_changed(sender, field, **kwargs):
+    invalidate_database_data_sources_cache(field.table.database_id)
+
+
+def view_changed(sender, view, **kwargs):
+    invalidate_database_data_sources_cache(view.table.database_id)
+
+
+def view_refinement_changed(sender, **kwargs):
+    """
+    Called when a filter, filter group or sort of a view changes, which changes the
+    rows of the data sources using that view.
+    """
+
+    for name in ["view_filter", "view_filter_group", "view_sort"]:
+        if name in kwargs:
+            invalidate_database_data_sources_cache(kwargs[name].view.table.database_id)
+
+
+def connect_to_database_change_signals():
+    for signal in [
+        row_signals.rows_created,
+        row_signals.rows_updated,
+        row_signals.rows_deleted,
+        row_signals.row_orders_recalculated,
+        table_signals.table_updated,
+        table_signals.table_deleted,
+    ]:
+        signal.connect(table_data_changed)
+
+    for signal in [
+        field_signals.field_created,
+        field_signals.field_restored,
+        field_signals.field_updated,
+        field_signals.field_deleted,
+    ]:
+        signal.connect(field_changed)
+
+    view_signals.view_updated.connect(view_changed)
+
+    for signal in [
+        view_signals.view_filter_created,
+        view_signals.view_filter_updated,
+        view_signals.view_filter_deleted,
+        view_signals.view_filter_group_created,
+        view_signals.view_filter_group_updated,
+        view_signals.view_filter_group_deleted,
+        view_signals.view_sort_created,
+        view_signals.view_sort_updated,
+        view_signals.view_sort_deleted,
+    ]:
+        signal.connect(view_refinement_changed)
@@ -38,7 +38,10 @@ from baserow.contrib.database.api.views.gallery.serializers import (
     GalleryViewFieldOptionsSerializer,
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_count_response,
+    get_public_view_authorization_token,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FilterFieldNotFound,
@@ -86,6 +89,17 @@ class GalleryViewView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="estimate_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "If provided, then the count is estimated when the view contains "
+                    "a lot of rows, which is much faster for big tables. The "
+                    "response will then contain `count_is_exact`, indicating whether "
+                    "the count is exact."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -279,10 +293,11 @@ class GalleryViewView(APIView):
         if order_by is not None:
             queryset = queryset.order_by_fields_string(order_by, False)
 
+        estimate_count = "estimate_count" in request.GET
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            return get_count_response(queryset, estimate_count)
 
-        paginator = GalleryLimitOffsetPagination()
+        paginator = GalleryLimitOffsetPagination(estimate_count=estimate_count)
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True
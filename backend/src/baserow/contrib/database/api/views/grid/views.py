@@ -2,7 +2,6 @@ from decimal import Decimal
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -15,7 +14,7 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import LimitOffsetPagination, PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
@@ -47,7 +46,10 @@ from baserow.contrib.database.api.views.serializers import (
     FieldOptionsField,
     serialize_group_by_metadata,
 )
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_count_response,
+    get_public_view_authorization_token,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FieldNotInTable,
@@ -115,6 +117,17 @@ class GridViewView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="estimate_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "If provided, then the count is estimated when the view contains "
+                    "a lot of rows, which is much faster for big tables. The "
+                    "response will then contain `count_is_exact`, indicating whether "
+                    "the count is exact."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -351,6 +364,14 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        group_bys = view.viewgroupby_set.all() if view_type.can_group_by else []
+        # If only some fields are requested, then there is no need to select and
+        # enhance the others. The group by fields are always needed to compute the
+        # group by metadata.
+        only_field_ids = None
+        if field_ids is not None:
+            only_field_ids = set(field_ids) | {g.field_id for g in group_bys}
+
         model = view.table.get_model()
         queryset = view_handler.get_queryset(
             view,
@@ -359,6 +380,7 @@ class GridViewView(APIView):
             search=query_params.get("search"),
             search_mode=query_params.get("search_mode"),
             model=model,
+            only_field_ids=only_field_ids,
         )
 
         if order_by is not None:
@@ -367,13 +389,14 @@ class GridViewView(APIView):
         if adhoc_filters.has_any_filters:
             queryset = adhoc_filters.apply_to_queryset(model, queryset)
 
+        estimate_count = "estimate_count" in request.GET
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            return get_count_response(queryset, estimate_count)
 
         if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            paginator = LimitOffsetPagination(estimate_count=estimate_count)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(estimate_count=estimate_count)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -386,10 +409,10 @@ class GridViewView(APIView):
 
         response = paginator.get_paginated_response(serializer.data)
 
-        if view_type.can_group_by and view.viewgroupby_set.all():
+        if group_bys:
             group_by_fields = [
                 model._field_objects[group_by.field_id]["field"]
-                for group_by in view.viewgroupby_set.all()
+                for group_by in group_bys
             ]
             group_by_metadata = view_handler.get_group_by_metadata_in_rows(
                 group_by_fields, page, queryset
@@ -936,6 +959,17 @@ class PublicGridViewRowsView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="estimate_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "If provided, then the count is estimated when the view contains "
+                    "a lot of rows, which is much faster for big tables. The "
+                    "response will then contain `count_is_exact`, indicating whether "
+                    "the count is exact."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -1189,13 +1223,14 @@ class PublicGridViewRowsView(APIView):
             view_type=view_type,
         )
 
+        estimate_count = "estimate_count" in request.GET
         if count:
-            return Response({"count": queryset.count()})
+            return get_count_response(queryset, estimate_count)
 
         if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            paginator = LimitOffsetPagination(estimate_count=estimate_count)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(estimate_count=estimate_count)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -1,8 +1,12 @@
 from typing import Optional
 
 from django.conf import settings
+from django.db.models import QuerySet
 
 from rest_framework.request import Request
+from rest_framework.response import Response
+
+from baserow.core.db import get_estimated_or_exact_count
 
 
 def get_public_view_authorization_token(request: Request) -> Optional[str]:
@@ -19,3 +23,21 @@ def get_public_view_authorization_token(request: Request) -> Optional[str]:
     except (AttributeError, ValueError):
         return None
     return token
+
+
+def get_count_response(queryset: QuerySet, estimate_count: bool = False) -> Response:
+    """
+    Returns the response of a row listing endpoint when only the count is requested.
+
+    :param queryset: The queryset containing the rows that must be counted.
+    :param estimate_count: Indicates whether the count can be estimated if the
+        queryset contains a lot of rows. The response then also contains whether the
+        count is exact.
+    :return: The response containing the count.
+    """
+
+    if not estimate_count:
+        return Response({"count": queryset.count()})
+
+    count, count_is_exact = get_estimated_or_exact_count(queryset)
+    return Response({"count": count, "count_is_exact": count_is_exact})
@@ -1,8 +1,10 @@
+import time
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 from zipfile import ZipFile
 
+from django.core.exceptions import FieldDoesNotExist
 from django.core.files.storage import Storage
 from django.core.management.color import no_style
 from django.db import connection, models
@@ -12,6 +14,10 @@ from django.urls import include, path
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
+from loguru import logger
+from opentelemetry import metrics
+from psycopg2 import sql
+
 from baserow.contrib.database.api.serializers import DatabaseSerializer
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
@@ -19,11 +25,12 @@ from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
-from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.models import FormulaField
+from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.models import Database, Field, View
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.registries import view_type_registry
-from baserow.core.db import specific_queryset
+from baserow.core.db import bulk_copy_insert, specific_queryset
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Application, Workspace
 from baserow.core.registries import (
@@ -32,14 +39,32 @@ from baserow.core.registries import (
     serialization_processor_registry,
 )
 from baserow.core.trash.handler import TrashHandler
-from baserow.core.utils import ChildProgressBuilder, grouper
+from baserow.core.utils import ChildProgressBuilder
 
 from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
 from .db.atomic import read_repeatable_single_database_atomic_transaction
-from .export_serialized import DatabaseExportSerializedStructure
+from .export_serialized import DatabaseExportSerializedStructure, SerializedRowsStream
 from .fields.deferred_foreign_key_updater import DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
-from .table.models import Table
+from .table.models import GeneratedTableModel, Table
+
+EXPORT_ROWS_CHUNK_SIZE = 2000
+# The row fields that are copied as they are when the rows are copied in the database.
+COPIED_ROW_FIELD_NAMES = [
+    "id",
+    "order",
+    "created_on",
+    "updated_on",
+    "created_by",
+    "last_modified_by",
+]
+
+meter = metrics.get_meter(__name__)
+import_rows_per_second_histogram = meter.create_histogram(
+    "baserow.database.import_serialized_rows_per_second",
+    unit="1/s",
+    description="The number of rows per second inserted when importing a table.",
+)
 
 
 class DatabaseApplicationType(ApplicationType):
@@ -93,10 +118,12 @@ class DatabaseApplicationType(ApplicationType):
         for table in tables:
             fields = table.field_set.all()
             serialized_fields = []
+            field_types = []
             for f in fields:
                 field = f.specific
                 field_type = field_type_registry.get_by_model(field)
                 serialized_fields.append(field_type.export_serialized(field))
+                field_types.append(field_type)
 
             table_cache: Dict[str, Any] = {}
             workspace = table.get_root()
@@ -111,28 +138,41 @@ class DatabaseApplicationType(ApplicationType):
                 )
 
             model = table.get_model(fields=fields, add_dependencies=False)
-            serialized_rows = []
-            row_queryset = model.objects.all()
-            if table.created_by_column_added:
-                row_queryset = row_queryset.select_related("created_by")
-            if table.last_modified_by_column_added:
-                row_queryset = row_queryset.select_related("last_modified_by")
-            for row in row_queryset:
-                serialized_row = DatabaseExportSerializedStructure.row(
-                    id=row.id,
-                    order=str(row.order),
-                    created_on=row.created_on.isoformat(),
-                    updated_on=row.updated_on.isoformat(),
-                    created_by=getattr(row, "created_by", None),
-                    last_modified_by=getattr(row, "last_modified_by", None),
-                )
-                for field_object in model._field_objects.values():
-                    field_name = field_object["name"]
-                    field_type = field_object["type"]
-                    serialized_row[field_name] = field_type.get_export_serialized_value(
-                        row, field_name, table_cache, files_zip, storage
+            if import_export_config.stream_rows:
+                serialized_rows = SerializedRowsStream()
+                import_export_config.streams.append(serialized_rows)
+            else:
+                serialized_rows = []
+            # The rows don't have to be serialized if they can be copied in the
+            # database by the import.
+            copy_rows = import_export_config.copy_rows_in_database and (
+                self._can_copy_rows_in_database(field_types)
+            )
+            if not copy_rows:
+                row_queryset = model.objects.all()
+                if table.created_by_column_added:
+                    row_queryset = row_queryset.select_related("created_by")
+                if table.last_modified_by_column_added:
+                    row_queryset = row_queryset.select_related("last_modified_by")
+                # Iterate in chunks so that the row instances are not all in memory.
+                for row in row_queryset.iterator(chunk_size=EXPORT_ROWS_CHUNK_SIZE):
+                    serialized_row = DatabaseExportSerializedStructure.row(
+                        id=row.id,
+                        order=str(row.order),
+                        created_on=row.created_on.isoformat(),
+                        updated_on=row.updated_on.isoformat(),
+                        created_by=getattr(row, "created_by", None),
+                        last_modified_by=getattr(row, "last_modified_by", None),
                     )
-                serialized_rows.append(serialized_row)
+                    for field_object in model._field_objects.values():
+                        field_name = field_object["name"]
+                        field_type = field_object["type"]
+                        serialized_row[
+                            field_name
+                        ] = field_type.get_export_serialized_value(
+                            row, field_name, table_cache, files_zip, storage
+                        )
+                    serialized_rows.append(serialized_row)
 
             structure = DatabaseExportSerializedStructure.table(
                 id=table.id,
@@ -149,9 +189,139 @@ class DatabaseApplicationType(ApplicationType):
                 )
                 if extra_data is not None:
                     structure.update(**extra_data)
+            if copy_rows:
+                structure["copy_rows_from_table_id"] = table.id
             serialized_tables.append(structure)
         return serialized_tables
 
+    def _can_copy_rows_in_database(self, field_types: List[FieldType]) -> bool:
+        """
+        Checks if the rows of a table containing fields of the provided types can
+        be copied in the database. Read only fields of which the data is not kept on
+        duplication are not exported, so they don't prevent copying the rows.
+        """
+
+        return all(
+            field_type.can_copy_values_in_database
+            or (field_type.read_only and not field_type.keep_data_on_duplication)
+            for field_type in field_types
+        )
+
+    def _copy_rows_in_database(
+        self,
+        serialized_table: Dict[str, Any],
+        table_model: Type[GeneratedTableModel],
+        id_mapping: Dict[str, Any],
+        m2m_fields_to_not_import: Set[str],
+    ) -> int:
+        """
+        Copies the rows and the many to many relations of the exported table into the
+        newly created table using `INSERT INTO ... SELECT` queries, remapping the
+        field columns. The row ids are kept, just like when the rows are serialized,
+        and the columns of fields that can't be copied are set to their defaults.
+
+        :param serialized_table: The exported table containing the id of the table
+            to copy the rows from.
+        :param table_model: The model of the newly created table.
+        :param id_mapping: The id mapping containing the new field ids.
+        :param m2m_fields_to_not_import: The names of the many to many fields of
+            which the relations have already been copied by the related field.
+        :return: The number of copied rows.
+        """
+
+        source_table = Table.objects.get(id=serialized_table["copy_rows_from_table_id"])
+        source_model = source_table.get_model(add_dependencies=False)
+        source_field_names = {
+            f'field_{id_mapping["database_fields"][serialized_field["id"]]}': (
+                f'field_{serialized_field["id"]}',
+                field_type_registry.get(serialized_field["type"]),
+            )
+            for serialized_field in serialized_table["fields"]
+        }
+
+        def get_source_field(field):
+            if field.name in source_field_names:
+                source_field_name, field_type = source_field_names[field.name]
+                if field_type.can_copy_values_in_database:
+                    return source_model._meta.get_field(source_field_name)
+            elif field.name in COPIED_ROW_FIELD_NAMES:
+                try:
+                    return source_model._meta.get_field(field.name)
+                except FieldDoesNotExist:
+                    pass
+            return None
+
+        columns, values, params = [], [], []
+        for field in table_model._meta.concrete_fields:
+            columns.append(sql.Identifier(field.column))
+            source_field = get_source_field(field)
+            if source_field is not None:
+                values.append(sql.Identifier(source_field.column))
+            else:
+                values.append(sql.Placeholder())
+                params.append(field.get_db_prep_save(field.get_default(), connection))
+
+        copy_rows_sql = sql.SQL(
+            "INSERT INTO {table} ({columns}) SELECT {values} FROM {source_table} "
+            "WHERE NOT trashed"
+        ).format(
+            table=sql.Identifier(table_model._meta.db_table),
+            columns=sql.SQL(", ").join(columns),
+            values=sql.SQL(", ").join(values),
+            source_table=sql.Identifier(source_model._meta.db_table),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(copy_rows_sql, params)
+            copied_rows_count = cursor.rowcount
+
+        # The formulas that only depend on values of the same row are normally
+        # calculated when the row is inserted, so they must be calculated here. The
+        # other ones are refreshed in the `after_rows_imported` hook.
+        from baserow.contrib.database.formula import FormulaHandler
+
+        formula_updates = {}
+        for field_object in table_model._field_objects.values():
+            field = field_object["field"]
+            if (
+                isinstance(field, FormulaField)
+                and not field.requires_refresh_after_insert
+                and field.error is None
+            ):
+                formula_updates[
+                    field_object["name"]
+                ] = FormulaHandler.baserow_expression_to_update_django_expression(
+                    field.cached_typed_internal_expression, table_model
+                )
+        if copied_rows_count and formula_updates:
+            table_model.objects_and_trash.update(**formula_updates)
+
+        for field in table_model._meta.many_to_many:
+            if field.name in m2m_fields_to_not_import:
+                continue
+            source_field = get_source_field(field)
+            if source_field is None:
+                continue
+            source_through = source_field.remote_field.through
+            through = field.remote_field.through
+            copy_relations_sql = sql.SQL(
+                "INSERT INTO {through} ({column}, {reverse_column}) "
+                "SELECT {source_column}, {source_reverse_column} "
+                "FROM {source_through} WHERE {source_column} IN "
+                "(SELECT id FROM {source_table} WHERE NOT trashed)"
+            ).format(
+                through=sql.Identifier(through._meta.db_table),
+                column=sql.Identifier(field.m2m_column_name()),
+                reverse_column=sql.Identifier(field.m2m_reverse_name()),
+                source_through=sql.Identifier(source_through._meta.db_table),
+                source_column=sql.Identifier(source_field.m2m_column_name()),
+                source_reverse_column=sql.Identifier(source_field.m2m_reverse_name()),
+                source_table=sql.Identifier(source_model._meta.db_table),
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(copy_relations_sql)
+
+        return copied_rows_count
+
     def export_serialized(
         self,
         database: Database,
@@ -455,7 +625,6 @@ class DatabaseApplicationType(ApplicationType):
         already_filled_up_through_table_names = set()
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
-            rows_to_be_inserted = []
             # Holds a mapping where the key is a model, and the value a list of
             # objects that must be inserted. These objects are returned by the
             # `set_import_serialized_value`, and will typically hold m2m relationships.
@@ -471,92 +640,125 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
-            for serialized_row in serialized_table["rows"]:
-                created_on = serialized_row.get("created_on")
-                updated_on = serialized_row.get("updated_on")
-
-                if created_on:
-                    created_on = datetime.fromisoformat(created_on)
-                else:
-                    created_on = timezone.now()
-
-                if updated_on:
-                    updated_on = datetime.fromisoformat(updated_on)
-                else:
-                    updated_on = timezone.now()
-
-                created_by_email = serialized_row.get("created_by", None)
-                created_by = (
-                    user_email_mapping.get(created_by_email, None)
-                    if created_by_email
-                    else None
-                )
+            def rows_to_be_inserted():
+                for serialized_row in serialized_table["rows"]:
+                    created_on = serialized_row.get("created_on")
+                    updated_on = serialized_row.get("updated_on")
 
-                last_modified_by_email = serialized_row.get("last_modified_by", None)
-                last_modified_by = (
-                    user_email_mapping.get(last_modified_by_email, None)
-                    if last_modified_by_email
-                    else None
-                )
+                    if created_on:
+                        created_on = datetime.fromisoformat(created_on)
+                    else:
+                        created_on = timezone.now()
 
-                row_instance = table_model(
-                    id=serialized_row["id"],
-                    order=serialized_row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                    created_by=created_by,
-                    last_modified_by=last_modified_by,
-                )
+                    if updated_on:
+                        updated_on = datetime.fromisoformat(updated_on)
+                    else:
+                        updated_on = timezone.now()
+
+                    created_by_email = serialized_row.get("created_by", None)
+                    created_by = (
+                        user_email_mapping.get(created_by_email, None)
+                        if created_by_email
+                        else None
+                    )
+
+                    last_modified_by_email = serialized_row.get(
+                        "last_modified_by", None
+                    )
+                    last_modified_by = (
+                        user_email_mapping.get(last_modified_by_email, None)
+                        if last_modified_by_email
+                        else None
+                    )
 
-                for serialized_field in serialized_table["fields"]:
-                    field_type = field_type_registry.get(serialized_field["type"])
-                    new_field_id = id_mapping["database_fields"][serialized_field["id"]]
-                    new_field_name = f"field_{new_field_id}"
-                    field_name = f'field_{serialized_field["id"]}'
-
-                    if (
-                        field_name in serialized_row
-                        and new_field_name
-                        not in m2m_fields_to_not_import_as_already_done
-                    ):
-                        related_objects_to_save = (
-                            field_type.set_import_serialized_value(
-                                row_instance,
-                                new_field_name,
-                                serialized_row[field_name],
-                                id_mapping,
-                                table_cache,
-                                files_zip,
-                                storage,
+                    row_instance = table_model(
+                        id=serialized_row["id"],
+                        order=serialized_row["order"],
+                        created_on=created_on,
+                        updated_on=updated_on,
+                        created_by=created_by,
+                        last_modified_by=last_modified_by,
+                    )
+
+                    for serialized_field in serialized_table["fields"]:
+                        field_type = field_type_registry.get(serialized_field["type"])
+                        new_field_id = id_mapping["database_fields"][
+                            serialized_field["id"]
+                        ]
+                        new_field_name = f"field_{new_field_id}"
+                        field_name = f'field_{serialized_field["id"]}'
+
+                        if (
+                            field_name in serialized_row
+                            and new_field_name
+                            not in m2m_fields_to_not_import_as_already_done
+                        ):
+                            related_objects_to_save = (
+                                field_type.set_import_serialized_value(
+                                    row_instance,
+                                    new_field_name,
+                                    serialized_row[field_name],
+                                    id_mapping,
+                                    table_cache,
+                                    files_zip,
+                                    storage,
+                                )
                             )
-                        )
 
-                        if related_objects_to_save is not None:
-                            for additional_object in related_objects_to_save:
-                                additional_objects_to_be_inserted[
-                                    additional_object._meta.model
-                                ].append(additional_object)
+                            if related_objects_to_save is not None:
+                                for additional_object in related_objects_to_save:
+                                    additional_objects_to_be_inserted[
+                                        additional_object._meta.model
+                                    ].append(additional_object)
 
-                rows_to_be_inserted.append(row_instance)
-                progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
-                )
+                    yield row_instance
+                    progress.increment(
+                        state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}"
+                    )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
+            def on_batch_inserted(count):
+                # Every row import can have additional objects that must be
+                # inserted, like for example the m2m relationships. They're
+                # inserted after every batch so that they don't accumulate in memory.
+                # The foreign key constraints are deferred until the end of the
+                # transaction, so the related rows don't have to exist yet.
+                for model, objects in additional_objects_to_be_inserted.items():
+                    bulk_copy_insert(model, objects)
+                additional_objects_to_be_inserted.clear()
                 progress.increment(
-                    len(chunk),
+                    count,
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{serialized_table['id']}",
                 )
 
-            # Every row import can have additional objects that must be inserted,
-            # like for example the m2m relationships. We want to efficiently import
-            # them in bulk here.
-            for model, objects in additional_objects_to_be_inserted.items():
-                model.objects.bulk_create(objects, batch_size=512)
+            start = time.perf_counter()
+            if "copy_rows_from_table_id" in serialized_table:
+                inserted_rows_count = self._copy_rows_in_database(
+                    serialized_table,
+                    table_model,
+                    id_mapping,
+                    m2m_fields_to_not_import_as_already_done,
+                )
+            else:
+                # We want to insert the rows using `COPY` because there could
+                # potentially be hundreds of thousands of rows in there and this will
+                # result in much better performance than `INSERT` statements. The rows
+                # are converted lazily, batch by batch, while they're being inserted.
+                inserted_rows_count = bulk_copy_insert(
+                    table_model,
+                    rows_to_be_inserted(),
+                    on_batch_inserted=on_batch_inserted,
+                )
+
+            duration = time.perf_counter() - start
+            if inserted_rows_count and duration:
+                rows_per_second = inserted_rows_count / duration
+                import_rows_per_second_histogram.record(rows_per_second)
+                logger.info(
+                    "Inserted {count} rows in table {table_id} at {speed:.0f} rows/s",
+                    count=inserted_rows_count,
+                    table_id=serialized_table["_object"].id,
+                    speed=rows_per_second,
+                )
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -1,16 +1,27 @@
 import abc
+import gzip
 import time
-from typing import Any, Callable
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.db.models import BooleanField, F, OrderBy, QuerySet
+from django.db.models.expressions import RawSQL
 
 import unicodecsv as csv
 
 from baserow.contrib.database.export.exceptions import ExportJobCanceledException
+from baserow.contrib.database.export.models import (
+    EXPORT_JOB_EXPORTING_STATUS,
+    ExportJob,
+)
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import get_planner_estimated_count
 
 
 class FileWriter(abc.ABC):
@@ -58,6 +69,21 @@ class FileWriter(abc.ABC):
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
+    @contextmanager
+    def gzip_compressed(self):
+        """
+        Compresses everything that is written to the file within this context using
+        gzip. The data is compressed on the fly, so it's never kept in memory.
+        """
+
+        file = self._file
+        with gzip.GzipFile(fileobj=file, mode="wb") as gzip_file:
+            self._file = gzip_file
+            try:
+                yield
+            finally:
+                self._file = file
+
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
@@ -132,6 +158,190 @@ class PaginatedExportJobFileWriter(FileWriter):
                 self.job.save()
 
 
+class StreamingExportJobFileWriter(PaginatedExportJobFileWriter):
+    """
+    Writes querysets to files without ever counting the rows or paginating using
+    `OFFSET`, which gets slower with every page on large tables. If the queryset is
+    only ordered by the `order` and `id` columns, the rows are fetched in chunks
+    using keyset pagination, which can directly use the (order, id) index of the
+    table. Any other ordering, like the sorts of a view, is streamed using a server
+    side cursor instead. The progress of the job is based on the row estimate of the
+    PostgreSQL planner.
+    """
+
+    CHUNK_SIZE = 2000
+
+    def write_rows(self, queryset, write_row):
+        """
+        Writes the queryset to the file using the provided write_row callback. Checks
+        for cancellation and updates the progress of the job in the same way as the
+        `PaginatedExportJobFileWriter` does.
+
+        :param queryset: The queryset to write to the file.
+        :param write_row: A callable function which takes each row from the queryset in
+            turn and writes to the file.
+        """
+
+        self.last_check = time.perf_counter()
+        estimated_total_rows = get_planner_estimated_count(queryset)
+
+        i = 0
+        previous_row = None
+        for row in self._iterate_rows(queryset):
+            if previous_row is not None:
+                i = i + 1
+                write_row(previous_row, False)
+                self._check_and_update_job(i, max(estimated_total_rows, i + 1))
+            previous_row = row
+
+        # The last row can only be written when we know that there aren't any more
+        # rows, so we always keep one row behind.
+        if previous_row is not None:
+            i = i + 1
+            write_row(previous_row, True)
+            self._check_and_update_job(i, i)
+
+    def _iterate_rows(self, queryset: QuerySet) -> Iterator[Any]:
+        """
+        Yields all the rows of the queryset in the order of the queryset while only
+        keeping at most `CHUNK_SIZE` rows in memory.
+
+        :param queryset: The queryset to iterate over.
+        :return: An iterator yielding every row of the queryset.
+        """
+
+        if self._is_ordered_by_order_and_id(queryset):
+            yield from self._iterate_rows_by_keyset(queryset)
+        else:
+            yield from self._iterate_rows_by_cursor(queryset)
+
+    def _iterate_rows_by_cursor(self, queryset: QuerySet) -> Iterator[Any]:
+        """
+        Yields all the rows of a queryset with an arbitrary ordering using a server
+        side cursor. The rows are fetched in chunks of `CHUNK_SIZE` rows and the
+        multi field prefetches, which are normally only applied when the whole
+        queryset is evaluated, are applied to every chunk.
+
+        :param queryset: The queryset to iterate over.
+        :return: An iterator yielding every row of the queryset.
+        """
+
+        multi_field_prefetches = queryset.get_multi_field_prefetches()
+        iterator = queryset.iterator(chunk_size=self.CHUNK_SIZE)
+        while True:
+            rows = list(islice(iterator, self.CHUNK_SIZE))
+            if not rows:
+                break
+            for prefetch in multi_field_prefetches:
+                prefetch(queryset, rows)
+            yield from rows
+
+    def _iterate_rows_by_keyset(self, queryset: QuerySet) -> Iterator[Any]:
+        """
+        Yields all the rows of a queryset ordered by `order` and `id` by repeatedly
+        selecting the next `CHUNK_SIZE` rows after the last seen (order, id) pair.
+
+        :param queryset: The queryset ordered by `order` and `id`.
+        :return: An iterator yielding every row of the queryset.
+        """
+
+        db_table = queryset.model._meta.db_table
+        last_key: Optional[tuple] = None
+        while True:
+            chunk_queryset = queryset.order_by("order", "id")
+            if last_key is not None:
+                chunk_queryset = chunk_queryset.filter(
+                    RawSQL(
+                        f'("{db_table}"."order", "{db_table}"."id") > (%s, %s)',  # nosec
+                        last_key,
+                        output_field=BooleanField(),
+                    )
+                )
+            rows = list(chunk_queryset[: self.CHUNK_SIZE])
+            yield from rows
+
+            if len(rows) < self.CHUNK_SIZE:
+                break
+            last_key = (rows[-1].order, rows[-1].id)
+
+    @staticmethod
+    def _is_ordered_by_order_and_id(queryset: QuerySet) -> bool:
+        """
+        Checks if the queryset is only ordered ascending by the `order` and `id`
+        columns, either explicitly or via the default ordering of the table model.
+
+        :param queryset: The queryset to check.
+        :return: True if keyset pagination on (order, id) respects the ordering.
+        """
+
+        order_by = queryset.query.order_by
+        if not order_by:
+            return queryset.query.default_ordering and list(
+                queryset.model._meta.ordering
+            ) == ["order", "id"]
+
+        names = []
+        for expression in order_by:
+            if isinstance(expression, str):
+                names.append(expression)
+            elif (
+                isinstance(expression, OrderBy)
+                and not expression.descending
+                and isinstance(expression.expression, F)
+            ):
+                names.append(expression.expression.name)
+            else:
+                return False
+        return names == ["order", "id"]
+
+
+class ShardExportJobFileWriter(StreamingExportJobFileWriter):
+    """
+    Writes the rows of one of the id ranges of a sharded export job. Every shard
+    stores its progress in the cache, so that the progress of the job is the average
+    progress of all its shards. Writing stops when the job isn't exporting anymore,
+    which means that it has been cancelled or that another shard failed.
+    """
+
+    def __init__(self, file, job, shard_index: int, shard_count: int):
+        super().__init__(file, job)
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    @staticmethod
+    def get_progress_cache_key(job, shard_index: int) -> str:
+        return f"export_job_{job.id}_shard_{shard_index}_progress"
+
+    def _check_and_update_job(self, current_row, total_rows):
+        current_time = time.perf_counter()
+        enough_time_has_passed = (
+            current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
+        )
+        if not enough_time_has_passed and current_row != total_rows:
+            return
+
+        self.last_check = current_time
+        self.job.refresh_from_db(fields=["state"])
+        if self.job.state != EXPORT_JOB_EXPORTING_STATUS:
+            raise ExportJobCanceledException()
+
+        keys = [
+            self.get_progress_cache_key(self.job, shard_index)
+            for shard_index in range(self.shard_count)
+        ]
+        cache.set(
+            keys[self.shard_index],
+            current_row / total_rows * 100,
+            timeout=settings.EXPORT_FILE_EXPIRE_MINUTES * 60,
+        )
+        progress_percentage = sum(cache.get_many(keys).values()) / self.shard_count
+        # Only the progress is updated because the other shards can change the job
+        # at the same time.
+        ExportJob.objects.filter(
+            id=self.job.id, state=EXPORT_JOB_EXPORTING_STATUS
+        ).update(progress_percentage=progress_percentage)
+
+
 class QuerysetSerializer(abc.ABC):
     """
     A class knows how to serialize a given queryset and the fields of said queryset to
@@ -1,12 +1,16 @@
+import math
+import shutil
 import uuid
 from io import BytesIO
 from os.path import join
-from typing import Any, BinaryIO, Dict, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.storage import default_storage
 from django.db import transaction
+from django.db.models import F, Max, Min, QuerySet
 from django.utils import timezone
 
 from loguru import logger
@@ -33,7 +37,11 @@ from .exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
-from .file_writer import PaginatedExportJobFileWriter
+from .file_writer import (
+    QuerysetSerializer,
+    ShardExportJobFileWriter,
+    StreamingExportJobFileWriter,
+)
 from .registries import TableExporter, table_exporter_registry
 
 User = get_user_model()
@@ -137,6 +145,8 @@ class ExportHandler:
             context=table,
         )
         try:
+            if _start_sharded_export_if_needed(job):
+                return job
             return _mark_job_as_finished(_open_file_and_run_export(job))
         except ExportJobCanceledException:
             # If the job was canceled then it must not be marked as failed.
@@ -145,6 +155,54 @@ class ExportHandler:
             _mark_job_as_failed(job, e)
             raise e
 
+    @staticmethod
+    def run_export_job_shard(
+        job: ExportJob, shard_index: int, shard_count: int, start_id: int, end_id: int
+    ) -> ExportJob:
+        """
+        Exports the rows with an id between `start_id` and `end_id` of a sharded
+        export job to a separate part file. When the last shard has been exported,
+        all the part files are zipped into the export file of the job and the job
+        is marked as finished. If any of the shards fails, the job is marked as
+        failed and the other shards stop.
+
+        :param job: The sharded job to export a shard of.
+        :param shard_index: The index of the shard that must be exported.
+        :param shard_count: The total number of shards of the job.
+        :param start_id: The id of the first row of the shard.
+        :param end_id: The id of the last row of the shard.
+        :return: The updated job.
+        """
+
+        exporter = table_exporter_registry.get(job.exporter_type)
+        storage_location = ExportHandler.export_file_path(
+            _get_shard_file_name(job, shard_index)
+        )
+        try:
+            serializer = _get_queryset_serializer(job, exporter)
+            serializer.queryset = serializer.queryset.filter(
+                id__gte=start_id, id__lte=end_id
+            )
+            with _create_storage_dir_if_missing_and_open(storage_location) as file:
+                serializer.write_to_file(
+                    ShardExportJobFileWriter(file, job, shard_index, shard_count),
+                    **job.export_options,
+                )
+        except ExportJobCanceledException:
+            # The job has been cancelled or another shard failed.
+            pass
+        except Exception as e:
+            _mark_job_as_failed(job, e)
+            raise e
+        finally:
+            remaining_shards = _decrement_remaining_shards(job)
+            if remaining_shards == 0:
+                job = _combine_export_job_shards(job, exporter, shard_count)
+            elif remaining_shards is None:
+                _fail_untracked_export_job_shard(job, storage_location)
+
+        return job
+
     @staticmethod
     def export_file_path(exported_file_name) -> str:
         """
@@ -274,7 +332,7 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
 
     exporter: TableExporter = table_exporter_registry.get(job.exporter_type)
     exported_file_name = _generate_random_file_name_with_extension(
-        exporter.file_extension
+        exporter.get_file_extension(job.export_options)
     )
     storage_location = ExportHandler.export_file_path(exported_file_name)
     # Store the file name before we even start exporting so if the export fails
@@ -287,16 +345,182 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
     _register_action(job)
 
     with _create_storage_dir_if_missing_and_open(storage_location) as file:
-        queryset_serializer_class = exporter.queryset_serializer_class
-        if job.view is None:
-            serializer = queryset_serializer_class.for_table(job.table)
-        else:
-            serializer = queryset_serializer_class.for_view(job.view)
-
+        serializer = _get_queryset_serializer(job, exporter)
         serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
+            StreamingExportJobFileWriter(file, job), **job.export_options
+        )
+
+    return job
+
+
+def _get_queryset_serializer(
+    job: ExportJob, exporter: TableExporter
+) -> QuerysetSerializer:
+    queryset_serializer_class = exporter.queryset_serializer_class
+    if job.view is None:
+        return queryset_serializer_class.for_table(job.table)
+    else:
+        return queryset_serializer_class.for_view(job.view)
+
+
+def _get_shard_ranges(queryset: QuerySet) -> List[Tuple[int, int]]:
+    """
+    Splits the id range of the provided queryset into `EXPORT_SHARD_COUNT` ranges if
+    it spans at least `EXPORT_SHARD_MIN_ROWS` rows.
+
+    :param queryset: The queryset containing the rows that must be exported.
+    :return: The (start_id, end_id) tuples of the ranges or an empty list if the
+        export must not be sharded.
+    """
+
+    shard_count = settings.EXPORT_SHARD_COUNT
+    if shard_count <= 1:
+        return []
+
+    id_range = queryset.aggregate(min_id=Min("id"), max_id=Max("id"))
+    min_id, max_id = id_range["min_id"], id_range["max_id"]
+    # The id range is an upper bound of the number of rows, which is good enough to
+    # decide and much cheaper to compute than a count on a big table.
+    if min_id is None or max_id - min_id + 1 < settings.EXPORT_SHARD_MIN_ROWS:
+        return []
+
+    range_size = math.ceil((max_id - min_id + 1) / shard_count)
+    return [
+        (start_id, min(start_id + range_size - 1, max_id))
+        for start_id in range(min_id, max_id + 1, range_size)
+    ]
+
+
+def _start_sharded_export_if_needed(job: ExportJob) -> bool:
+    """
+    Splits the export of big tables and views into multiple id ranges which are
+    exported concurrently by separate `run_export_job_shard` tasks. The rows of
+    every range are exported to a separate part file and the part files are zipped
+    together when all the shards have been exported. Within every part file the rows
+    are ordered like the view.
+
+    :param job: The job that must be exported.
+    :return: Whether the export has been split into shards.
+    """
+
+    from baserow.contrib.database.export.tasks import run_export_job_shard
+
+    exporter: TableExporter = table_exporter_registry.get(job.exporter_type)
+    shard_ranges = _get_shard_ranges(_get_queryset_serializer(job, exporter).queryset)
+    if not shard_ranges:
+        return False
+
+    job.exported_file_name = _generate_random_file_name_with_extension(
+        exporter.get_file_extension(job.export_options) + ".zip"
+    )
+    job.state = EXPORT_JOB_EXPORTING_STATUS
+    job.remaining_shards = len(shard_ranges)
+    job.save()
+
+    # TODO: refactor to use the jobs systems
+    _register_action(job)
+
+    for shard_index, (start_id, end_id) in enumerate(shard_ranges):
+        run_export_job_shard.delay(
+            job.id, shard_index, len(shard_ranges), start_id, end_id
+        )
+
+    logger.info(
+        "Split export job {job_id} into {count} shards.",
+        job_id=job.id,
+        count=len(shard_ranges),
+    )
+    return True
+
+
+def _decrement_remaining_shards(job: ExportJob) -> Optional[int]:
+    """
+    Atomically decrements the number of shards of the job that still have to be
+    exported.
+
+    :param job: The sharded job of which a shard has been exported.
+    :return: The number of shards that still have to be exported or None if the
+        shards of the job aren't tracked anymore, for example because the job has
+        been deleted.
+    """
+
+    with transaction.atomic():
+        updated = ExportJob.objects.filter(id=job.id, remaining_shards__gt=0).update(
+            remaining_shards=F("remaining_shards") - 1
+        )
+        if not updated:
+            return None
+        return (
+            ExportJob.objects.filter(id=job.id)
+            .values_list("remaining_shards", flat=True)
+            .get()
         )
 
+
+def _fail_untracked_export_job_shard(job: ExportJob, storage_location: str):
+    """
+    Deletes the part file of a shard whose job doesn't track the remaining shards
+    anymore. The shards of such a job are never combined, so the job is marked as
+    failed if it's still exporting instead of leaving it stuck in that state.
+
+    :param job: The sharded job of which a shard has been exported.
+    :param storage_location: The location of the part file of the shard.
+    """
+
+    default_storage.delete(storage_location)
+    ExportJob.objects.filter(id=job.id, state=EXPORT_JOB_EXPORTING_STATUS).update(
+        state=EXPORT_JOB_FAILED_STATUS,
+        progress_percentage=0.0,
+        error="The remaining shards of the export job couldn't be tracked.",
+    )
+
+
+def _get_shard_file_name(job: ExportJob, shard_index: int) -> str:
+    return f"{job.exported_file_name}.part{shard_index}"
+
+
+def _combine_export_job_shards(
+    job: ExportJob, exporter: TableExporter, shard_count: int
+) -> ExportJob:
+    """
+    Zips the part files of all the shards of the job into the export file of the
+    job and marks the job as finished. The part files are always deleted, also if
+    the job has been cancelled or failed in the meantime.
+
+    :param job: The sharded job of which all the shards have been exported.
+    :param exporter: The exporter used to export the shards.
+    :param shard_count: The total number of shards of the job.
+    :return: The updated job.
+    """
+
+    job.refresh_from_db()
+    part_locations = [
+        ExportHandler.export_file_path(_get_shard_file_name(job, shard_index))
+        for shard_index in range(shard_count)
+    ]
+
+    try:
+        if job.state == EXPORT_JOB_EXPORTING_STATUS:
+            extension = exporter.get_file_extension(job.export_options)
+            storage_location = ExportHandler.export_file_path(job.exported_file_name)
+            with _create_storage_dir_if_missing_and_open(
+                storage_location
+            ) as file, ZipFile(file, "w", ZIP_DEFLATED) as zip_file:
+                for shard_index, part_location in enumerate(part_locations):
+                    with default_storage.open(
+                        part_location, "rb"
+                    ) as part_file, zip_file.open(
+                        f"part-{shard_index + 1}{extension}", "w"
+                    ) as zip_part_file:
+                        shutil.copyfileobj(part_file, zip_part_file)
+            job = _mark_job_as_finished(job)
+    except Exception as e:
+        _mark_job_as_failed(job, e)
+        raise e
+    finally:
+        for part_location in part_locations:
+            default_storage.delete(part_location)
+
     return job
 
 
@@ -46,6 +46,9 @@ class ExportJob(models.Model):
     # export.
     progress_percentage = models.FloatField(default=0.0)
     export_options = JSONField()
+    # The number of shards of a sharded export job that haven't been exported yet.
+    # None if the export job isn't split into shards.
+    remaining_shards = models.PositiveIntegerField(null=True, blank=True)
 
     def is_cancelled_or_expired(self):
         return self.state in [EXPORT_JOB_CANCELLED_STATUS, EXPORT_JOB_EXPIRED_STATUS]
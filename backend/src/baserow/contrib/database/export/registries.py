@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List
 
 from django.contrib.auth import get_user_model
 
@@ -42,6 +42,18 @@ class TableExporter(Instance, ABC):
         :return a file extension starting with a dot.
         """
 
+    def get_file_extension(self, export_options: Dict[str, Any]) -> str:
+        """
+        Returns the file extension of the file generated using the provided export
+        options. This is the `file_extension`, unless the options change the format
+        of the file, like for example when the file is compressed.
+
+        :param export_options: The validated user provided export options.
+        :return a file extension starting with a dot.
+        """
+
+        return self.file_extension
+
     @property
     @abstractmethod
     def can_export_table(self) -> bool:
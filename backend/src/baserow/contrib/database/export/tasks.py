@@ -27,6 +27,26 @@ def run_export_job(self, job_id):
     ExportHandler.run_export_job(job)
 
 
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=EXPORT_SOFT_TIME_LIMIT,
+    time_limit=EXPORT_TIME_LIMIT,
+)
+def run_export_job_shard(self, job_id, shard_index, shard_count, start_id, end_id):
+    """
+    Exports the rows with an id between `start_id` and `end_id` of a sharded export
+    job. The task exporting the last shard combines all the shards into the final
+    export file.
+    """
+
+    from baserow.contrib.database.export.handler import ExportHandler
+    from baserow.contrib.database.export.models import ExportJob
+
+    job = ExportJob.objects.get(id=job_id)
+    ExportHandler.run_export_job_shard(job, shard_index, shard_count, start_id, end_id)
+
+
 # noinspection PyUnusedLocal
 @app.task(
     bind=True,
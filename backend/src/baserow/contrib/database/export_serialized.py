@@ -1,3 +1,43 @@
+import json
+import tempfile
+from typing import Any, Dict, Iterator
+
+# The number of bytes of serialized rows kept in memory before they're written to
+# a temporary file on disk.
+SERIALIZED_ROWS_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+
+
+class SerializedRowsStream:
+    """
+    Can be used instead of the list of serialized rows of a table when the export
+    is directly imported again, like when duplicating or snapshotting. The rows
+    are written as newline delimited JSON to a spooled temporary file, so only a
+    limited amount of them is kept in memory. It supports appending, `len` and
+    iterating, which is everything the import needs, but it can't be serialized
+    to JSON itself.
+    """
+
+    def __init__(self, max_memory_size: int = SERIALIZED_ROWS_MAX_MEMORY_SIZE):
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+        self._count = 0
+
+    def append(self, serialized_row: Dict[str, Any]):
+        self._file.seek(0, 2)
+        self._file.write(json.dumps(serialized_row).encode("utf8") + b"\n")
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        self._file.seek(0)
+        for line in self._file:
+            yield json.loads(line)
+
+    def close(self):
+        self._file.close()
+
+
 class DatabaseExportSerializedStructure:
     @staticmethod
     def database(tables):
@@ -12,7 +12,8 @@ from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
 )
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
-from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.fields.field_cache import FieldCache, shared_field_cache
+from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 
 
 def break_dependencies_for_field(field):
@@ -111,5 +112,43 @@ def rebuild_field_dependencies(
     # All new dependencies will have been removed from current_deps_by_str and so any
     # remaining ones are old dependencies which should no longer exist. Delete them.
     delete_ids = [dep.id for dep in current_deps_by_str.values()]
+    _invalidate_other_tables_of_changed_dependencies(
+        field_instance, new_dependencies, delete_ids
+    )
     FieldDependency.objects.filter(pk__in=delete_ids).delete()
+
     return new_dependencies
+
+
+def _invalidate_other_tables_of_changed_dependencies(
+    field_instance, created_dependencies: List[FieldDependency], deleted_ids: List[int]
+):
+    """
+    The dependants of the fields referenced by the created and deleted dependencies
+    have changed, so the dependants cached for their tables by the
+    `SharedFieldCache` must be invalidated. This is only needed if that cache is
+    used, because invalidating a table also clears its cached models everywhere.
+
+    :param field_instance: The field whose dependencies have been rebuilt.
+    :param created_dependencies: The dependencies that have been created.
+    :param deleted_ids: The ids of the dependencies that are going to be deleted.
+    """
+
+    if not shared_field_cache.enabled:
+        return
+
+    referenced_table_ids = set()
+    for dep in created_dependencies:
+        for referenced_field in [dep.dependency, dep.via]:
+            if referenced_field is not None:
+                referenced_table_ids.add(referenced_field.table_id)
+    if deleted_ids:
+        for dependency_table_id, via_table_id in FieldDependency.objects.filter(
+            pk__in=deleted_ids
+        ).values_list("dependency__table_id", "via__table_id"):
+            referenced_table_ids.update([dependency_table_id, via_table_id])
+
+    referenced_table_ids.discard(None)
+    referenced_table_ids.discard(field_instance.table_id)
+    for table_id in referenced_table_ids:
+        invalidate_table_in_model_cache(table_id)
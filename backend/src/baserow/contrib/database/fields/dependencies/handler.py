@@ -94,6 +94,68 @@ class FieldDependencyHandler:
         if len(field_ids) == 0:
             return []
 
+        shared_cache_key = (
+            "all_dependants",
+            table_id,
+            tuple(sorted(field_ids)),
+            associated_relations_changed,
+        )
+        dependants = field_cache.get_shared(shared_cache_key)
+        if dependants is None:
+            if field_cache.uses_shared_cache:
+                # The version of the table must be known before the dependants are
+                # fetched, so that they're never stored with a newer version.
+                field_cache.get_table_versions([table_id])
+            dependants = cls._get_all_dependants_with_via_path(
+                table_id, field_ids, associated_relations_changed
+            )
+            dependant_table_ids = {table_id}
+            for dependant, via_path_to_starting_table in dependants:
+                dependant_table_ids.add(dependant.table_id)
+                dependant_table_ids.update(
+                    f.table_id for f in via_path_to_starting_table
+                )
+            field_cache.set_shared(shared_cache_key, dependants, dependant_table_ids)
+
+        result: FieldDependants = []
+        for dependant, via_path_to_starting_table in dependants:
+            dependant_field = field_cache.lookup_specific(dependant)
+            if dependant_field is None:
+                # If somehow the dependant is trashed it will be None. We can't really
+                # trigger any updates for it so ignore it.
+                continue
+            dependant_field_type = field_type_registry.get_by_model(dependant_field)
+
+            result.append(
+                (
+                    dependant_field,
+                    dependant_field_type,
+                    [
+                        field_cache.lookup_specific(via_field)
+                        for via_field in via_path_to_starting_table
+                    ]
+                    or None,
+                )
+            )
+
+        return result
+
+    @classmethod
+    def _get_all_dependants_with_via_path(
+        cls,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+    ) -> List[Tuple[Field, List[Field]]]:
+        """
+        Fetches the specific instances of the dependants of the provided fields
+        recursively, together with the link row fields that lead back to the starting
+        table.
+
+        :return: A list containing the specific dependants and the specific link row
+            fields leading back to the starting table.
+        """
+
         query_parameters = {
             "pks": tuple(field_ids),
             "max_depth": settings.MAX_FIELD_REFERENCE_DEPTH,
@@ -231,34 +293,21 @@ class FieldDependencyHandler:
             )
         }
 
-        result: FieldDependants = []
-        for dependency in queryset:
-            dependant = specific_fields[dependency.id]
-            dependant_field = field_cache.lookup_specific(dependant)
-            if dependant_field is None:
-                # If somehow the dependant is trashed it will be None. We can't really
-                # trigger any updates for it so ignore it.
-                continue
-            dependant_field_type = field_type_registry.get_by_model(dependant_field)
-
-            # The first raw query has constructed a path of link row fields that lead
-            # back to the original table so that we can later efficiently update the
-            # correct rows.
-            #
-            # We only want to add via's to the path which are valid joins required to
-            # get from the dependant cell to the dependency. The queryset can return
-            # dependencies with via's for dependants in the same row, which don't need
-            # a join, so we filter those out here.
-            via_path_to_starting_table = [
-                field_cache.lookup_specific(specific_fields[via_id])
-                for via_id in dependency.via_ids
-            ] or None
-
-            result.append(
-                (dependant_field, dependant_field_type, via_path_to_starting_table)
+        # The first raw query has constructed a path of link row fields that lead
+        # back to the original table so that we can later efficiently update the
+        # correct rows.
+        #
+        # We only want to add via's to the path which are valid joins required to
+        # get from the dependant cell to the dependency. The queryset can return
+        # dependencies with via's for dependants in the same row, which don't need
+        # a join, so we filter those out here.
+        return [
+            (
+                specific_fields[dependency.id],
+                [specific_fields[via_id] for via_id in dependency.via_ids],
             )
-
-        return result
+            for dependency in queryset
+        ]
 
     @classmethod
     def get_dependant_fields_with_type(
@@ -1,7 +1,10 @@
+import uuid
 from collections import defaultdict
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
 
+from django.db import connection
 from django.db.models import Expression, Q, Value
+from django.db.models.expressions import RawSQL
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -17,6 +20,12 @@ StartingRowIdsType = Optional[List[int]]
 
 
 class PathBasedUpdateStatementCollector:
+    # The affected row ids of a collector with sub paths are only stored in a
+    # temporary table if it is at least this many link row hops away from the
+    # starting table. Closer to the starting table, recomputing them in the sub
+    # queries is cheaper than creating and dropping a table.
+    MATERIALIZE_AFFECTED_ROWS_FROM_DEPTH = 2
+
     def __init__(
         self,
         table: Table,
@@ -122,58 +131,164 @@ class PathBasedUpdateStatementCollector:
         self,
         field_cache: FieldCache,
         starting_row_ids: StartingRowIdsType = None,
-        path_to_starting_table: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
     ) -> int:
-        updated_rows = 0
-        path_to_starting_table = path_to_starting_table or []
-        if self.connection_here is not None:
-            path_to_starting_table = [self.connection_here] + path_to_starting_table
-        updated_rows += self._execute_pending_update_statements(
+        """
+        Executes the pending update statements of this collector and then of all the
+        sub paths, in order.
+
+        If `starting_row_ids` is provided, only the rows which are connected to the
+        starting rows are updated. Instead of joining back to the starting table via
+        every link row field in the path for every update statement, the ids of the
+        affected rows are computed hop by hop from the ids of the parent collector
+        using only the m2m through table in between. When running in a transaction,
+        the ids of a collector deep in the dependency graph that has sub paths are
+        materialized into a temporary table once, so that the update statements
+        further down the path can reuse them.
+
+        :param field_cache: The field cache used to get the table models.
+        :param starting_row_ids: If set, only rows connected to these rows in the
+            starting table are updated.
+        :param deleted_m2m_rels_per_link_field: Per link row field in the starting
+            table, the ids of the rows that had their connections removed and must
+            be updated as well.
+        :return: The number of updated rows.
+        """
+
+        temporary_tables = []
+        affected_rows = None
+        if starting_row_ids is not None:
+            affected_rows = AffectedRowsQuery(
+                "SELECT unnest(%s::int[])", [list(starting_row_ids)]
+            )
+
+        updated_rows = self._execute_all(
             field_cache,
-            path_to_starting_table,
-            starting_row_ids,
+            starting_row_ids is not None,
+            affected_rows,
+            0,
             deleted_m2m_rels_per_link_field,
+            temporary_tables,
+        )
+
+        if temporary_tables:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "DROP TABLE IF EXISTS "
+                    + ", ".join(f'"{name}"' for name in temporary_tables)
+                )
+
+        return updated_rows
+
+    def _execute_all(
+        self,
+        field_cache: FieldCache,
+        has_starting_row_ids: bool,
+        parent_affected_rows: Optional["AffectedRowsQuery"],
+        depth: int,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+        temporary_tables: List[str],
+    ) -> int:
+        affected_rows = None
+        if parent_affected_rows is not None and not self.connection_is_broken:
+            if depth == 0:
+                affected_rows = parent_affected_rows
+            else:
+                affected_rows = self._get_affected_rows_query(
+                    field_cache,
+                    parent_affected_rows,
+                    deleted_m2m_rels_per_link_field,
+                )
+                if (
+                    self.sub_paths
+                    and depth >= self.MATERIALIZE_AFFECTED_ROWS_FROM_DEPTH
+                ):
+                    affected_rows = self._materialize_affected_rows(
+                        affected_rows, temporary_tables
+                    )
+
+        updated_rows = self._execute_pending_update_statements(
+            field_cache, has_starting_row_ids, affected_rows
         )
 
         for sub_path in self.sub_paths.values():
-            updated_rows += sub_path.execute_all(
-                starting_row_ids=starting_row_ids,
-                path_to_starting_table=path_to_starting_table,
-                field_cache=field_cache,
-                deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+            updated_rows += sub_path._execute_all(
+                field_cache,
+                has_starting_row_ids,
+                affected_rows,
+                depth + 1,
+                deleted_m2m_rels_per_link_field if depth == 0 else None,
+                temporary_tables,
             )
         return updated_rows
 
-    def _execute_pending_update_statements(
+    def _get_affected_rows_query(
         self,
         field_cache: FieldCache,
-        path_to_starting_table: List[LinkRowField],
-        starting_row_ids: StartingRowIdsType,
+        parent_affected_rows: "AffectedRowsQuery",
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+    ) -> "AffectedRowsQuery":
+        """
+        Constructs a query selecting the ids of the rows in this table which are
+        connected to the affected rows of the parent collector via the link row field
+        that connects the two. Only the m2m through table has to be queried for that.
+        """
+
+        model = field_cache.get_model(self.table)
+        m2m_field = model._meta.get_field(self.connection_here.db_column)
+        sql = (
+            f'SELECT "{m2m_field.m2m_column_name()}" '
+            f'FROM "{m2m_field.m2m_db_table()}" '
+            f'WHERE "{m2m_field.m2m_reverse_name()}" IN ({parent_affected_rows.sql})'
+        )
+        params = list(parent_affected_rows.params)
+
+        deleted_row_ids = self._get_rows_connected_to_deleted_m2m_relationships(
+            deleted_m2m_rels_per_link_field
+        )
+        if deleted_row_ids:
+            sql += " UNION SELECT unnest(%s::int[])"
+            params.append(deleted_row_ids)
+
+        return AffectedRowsQuery(sql, params)
+
+    def _materialize_affected_rows(
+        self, affected_rows: "AffectedRowsQuery", temporary_tables: List[str]
+    ) -> "AffectedRowsQuery":
+        """
+        Stores the affected row ids in a temporary table, so that they don't have to
+        be computed again by the update statements of this collector and of all the
+        sub paths. This is only done within a transaction because the temporary
+        table is dropped automatically when the transaction ends, even if something
+        fails in the meantime.
+        """
+
+        if not connection.in_atomic_block:
+            return affected_rows
+
+        name = f"affected_rows_{uuid.uuid4().hex}"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE "{name}" ON COMMIT DROP AS '
+                f"SELECT DISTINCT * FROM ({affected_rows.sql}) AS ids(id)",
+                affected_rows.params,
+            )
+        temporary_tables.append(name)
+        return AffectedRowsQuery(f'SELECT "id" FROM "{name}"', [])
+
+    def _execute_pending_update_statements(
+        self,
+        field_cache: FieldCache,
+        has_starting_row_ids: bool,
+        affected_rows: Optional["AffectedRowsQuery"],
     ) -> int:
         model = field_cache.get_model(self.table)
         qs = model.objects_and_trash
         # If the connection is broken back to the starting table then there is no
         # way to join back to these starting rows. So we just update all cells.
-        if starting_row_ids is not None and not self.connection_is_broken:
-            if len(path_to_starting_table) == 0:
-                path_to_starting_table_id_column = "id"
-            else:
-                path_to_starting_table_id_column = (
-                    "__".join([p.db_column for p in path_to_starting_table]) + "__id"
-                )
-            path_to_starting_table_id_column += "__in"
-
-            filter_for_rows_connected_to_starting_row = Q(
-                **{path_to_starting_table_id_column: starting_row_ids}
-            ) | self._include_rows_connected_to_deleted_m2m_relationships(
-                deleted_m2m_rels_per_link_field,
-                path_to_starting_table,
-            )
-
-            qs = qs.filter(filter_for_rows_connected_to_starting_row)
-        if starting_row_ids is None:
+        if affected_rows is not None:
+            qs = qs.filter(id__in=RawSQL(affected_rows.sql, affected_rows.params))
+        if not has_starting_row_ids:
             # We aren't updating individual rows but instead entire columns, so don't
             # set this per row attribute.
             self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
@@ -203,48 +318,50 @@ class PathBasedUpdateStatementCollector:
             )
         return updated_rows
 
-    def _include_rows_connected_to_deleted_m2m_relationships(
+    def _get_rows_connected_to_deleted_m2m_relationships(
         self,
-        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
-        path_to_starting_table: List[LinkRowField],
-    ):
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+    ) -> List[int]:
         """
         If a row or batch of rows have been updated breaking their link row connections
         with other rows, we need to ensure that those other rows are still updated.
         We can't just join back to the starting row id as that m2m relation has been
         deleted by now. Instead the provided dict contains per link field which rows
-        have had their connections deleted. This method then constructs a Q filter that
-        ensures this UPDATE statement will also update those rows as they need to
-        change their values because a connection has been removed for them.
-
-        :return: A filter including any rows which previously were connected to the
-            starting row.
+        have had their connections deleted. This method returns the ids of the rows in
+        this table, which must be directly connected to the starting table, that
+        previously were connected to the starting rows. Because they are added to the
+        affected rows of this collector, the rows connected to them in the sub paths
+        are updated as well.
+
+        :return: The ids of the rows which previously were connected to the
+            starting rows.
         """
 
-        if deleted_m2m_rels_per_link_field is None or not path_to_starting_table:
-            return Q()
+        if deleted_m2m_rels_per_link_field is None:
+            return []
 
-        # The first link row field in the path will be a link row field not in the
-        # starting table, but which leads to the starting table. However the
+        # The connection here is a link row field not in the starting table, but
+        # which leads to the starting table. However the
         # deleted_m2m_rels_per_link_field is a dictionary per link field of rows in
         # the table it links to which have had their connections removed. Hence we
         # need to use the link row field in the starting table to lookup the deleted
-        # row ids in the table after the starting table.
+        # row ids in this table.
         link_row_field_in_starting_table: int = cast(
-            int, path_to_starting_table[-1].link_row_related_field_id
+            int, self.connection_here.link_row_related_field_id
         )
-        filters = Q()
-        if link_row_field_in_starting_table in deleted_m2m_rels_per_link_field:
-            path_to_table_after_starting_table = "".join(
-                [p.db_column + "__" for p in path_to_starting_table[:-1]]
-            )
+        return list(
+            deleted_m2m_rels_per_link_field.get(link_row_field_in_starting_table, [])
+        )
+
+
+class AffectedRowsQuery(NamedTuple):
+    """
+    A raw SQL query, and its params, selecting the ids of the rows which are
+    affected by an update in a specific table.
+    """
 
-            row_ids = deleted_m2m_rels_per_link_field[link_row_field_in_starting_table]
-            filter_kwargs_forcing_update_for_row_with_deleted_rels = {
-                f"{path_to_table_after_starting_table}id__in": row_ids
-            }
-            filters |= Q(**filter_kwargs_forcing_update_for_row_with_deleted_rels)
-        return filters
+    sql: str
+    params: List
 
 
 class UpdatedField(NamedTuple):
@@ -1,9 +1,102 @@
-from collections import defaultdict
-from typing import Optional, Type
+import copy
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Optional, Type
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
 
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+shared_field_cache_hits_counter = meter.create_counter(
+    "baserow.shared_field_cache.hits",
+    unit="1",
+    description="The number of times a specific field or the dependants of fields "
+    "were found in the process local shared field cache.",
+)
+shared_field_cache_misses_counter = meter.create_counter(
+    "baserow.shared_field_cache.misses",
+    unit="1",
+    description="The number of times a specific field or the dependants of fields "
+    "were not found in the process local shared field cache, or were outdated.",
+)
+
+
+@dataclass
+class SharedFieldCacheEntry:
+    value: Any
+    # The versions of all the tables the value has been computed from, keyed by
+    # table id.
+    table_versions: Dict[int, str]
+
+
+class SharedFieldCache:
+    """
+    A thread safe LRU cache shared by all the operations of a process. It contains
+    specific field instances and the dependants of fields, which otherwise would have
+    to be fetched from the database again by every row operation. Every entry
+    remembers the versions of the tables it has been computed from, and is only used
+    if all those versions still match the ones in the database. Because
+    `invalidate_table_in_model_cache` changes the version of a table, it also
+    invalidates the entries of that table in all the other processes.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, SharedFieldCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            not settings.BASEROW_DISABLE_MODEL_CACHE
+            and settings.BASEROW_SHARED_FIELD_CACHE_MAX_SIZE > 0
+        )
+
+    def get(self, key: Hashable) -> Optional[SharedFieldCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, entry: SharedFieldCacheEntry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > settings.BASEROW_SHARED_FIELD_CACHE_MAX_SIZE:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_table(self, table_id: int):
+        """
+        Removes all the entries that have been computed from the provided table. This
+        only frees the memory early, outdated entries are never used anyway.
+        """
+
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if table_id in entry.table_versions
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+shared_field_cache = SharedFieldCache()
+
 
 class FieldCache:
     """
@@ -13,21 +106,37 @@ class FieldCache:
     return it, otherwise if the field does not exist None will be returned.
 
     Trashed fields are excluded from the cache.
+
+    If `use_shared_cache` is true, then cache misses are first looked up in the
+    process local `SharedFieldCache`, so that repeated operations don't have to fetch
+    the same fields again. This must only be used by operations that don't change
+    any fields, like creating, updating and deleting rows. Every operation gets its
+    own copy of the shared field instances, so attributes it sets on them are never
+    seen by other threads, but the related objects like the table are still shared
+    and must not be changed.
     """
 
     def __init__(
         self,
         existing_cache: Optional["FieldCache"] = None,
         existing_model: Optional[Type[Model]] = None,
+        use_shared_cache: bool = False,
     ):
         if existing_cache is not None:
             self._cached_field_by_name_per_table = (
                 existing_cache._cached_field_by_name_per_table
             )
             self._model_cache = existing_cache._model_cache
+            self._table_versions = existing_cache._table_versions
+            use_shared_cache = use_shared_cache or existing_cache._use_shared_cache
         else:
             self._cached_field_by_name_per_table = defaultdict(dict)
             self._model_cache = {}
+            self._table_versions = {}
+
+        self._use_shared_cache = use_shared_cache
+        self.shared_cache_hits = 0
+        self.shared_cache_misses = 0
 
         if existing_model is not None:
             self.cache_model(existing_model)
@@ -56,6 +165,7 @@ class FieldCache:
     def reset_cache(self):
         self._cached_field_by_name_per_table = defaultdict(dict)
         self._model_cache = {}
+        self._table_versions = {}
 
     def cache_field(self, field):
         if not field.trashed:
@@ -72,18 +182,129 @@ class FieldCache:
             return None
 
     def lookup_specific(self, non_specific_field):
+        table_id = non_specific_field.table_id
         try:
-            return self._cached_field_by_name_per_table[non_specific_field.table_id][
+            return self._cached_field_by_name_per_table[table_id][
                 non_specific_field.name
             ]
         except KeyError:
-            return self.cache_field(non_specific_field)
+            pass
+
+        specific_field = self._lookup_shared_field(table_id, non_specific_field.name)
+        if specific_field is None:
+            specific_field = self.cache_field(non_specific_field)
+            self._store_shared_field(specific_field)
+        return specific_field
 
     def lookup_by_name(self, table, field_name: str):
         try:
             return self._cached_field_by_name_per_table[table.id][field_name]
         except KeyError:
+            pass
+
+        specific_field = self._lookup_shared_field(table.id, field_name)
+        if specific_field is None:
             try:
-                return self.cache_field(table.field_set.get(name=field_name))
+                specific_field = self.cache_field(table.field_set.get(name=field_name))
             except ObjectDoesNotExist:
                 return None
+            self._store_shared_field(specific_field)
+        return specific_field
+
+    def _lookup_shared_field(self, table_id: int, field_name: str):
+        specific_field = self.get_shared(("field", table_id, field_name))
+        if specific_field is not None:
+            specific_field = copy.copy(specific_field)
+            self._cached_field_by_name_per_table[table_id][field_name] = specific_field
+        elif self.uses_shared_cache:
+            # The version of the table must be known before the field is fetched from
+            # the database, otherwise a field that has just been changed by another
+            # process could be stored with the version from before that change.
+            self.get_table_versions([table_id])
+        return specific_field
+
+    def _store_shared_field(self, specific_field):
+        if specific_field is not None:
+            # A copy is stored because the operation that fetched the field can
+            # still set attributes on its own instance.
+            self.set_shared(
+                ("field", specific_field.table_id, specific_field.name),
+                copy.copy(specific_field),
+                [specific_field.table_id],
+            )
+
+    @property
+    def uses_shared_cache(self) -> bool:
+        return self._use_shared_cache and shared_field_cache.enabled
+
+    def get_table_versions(self, table_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Returns the current versions of the provided tables. The versions are fetched
+        once per field cache, so that they only cost a single query per operation.
+        Tables that don't exist anymore are excluded.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        missing_table_ids = [
+            table_id for table_id in table_ids if table_id not in self._table_versions
+        ]
+        if missing_table_ids:
+            versions = dict(
+                Table.objects_and_trash.filter(id__in=missing_table_ids).values_list(
+                    "id", "version"
+                )
+            )
+            for table_id in missing_table_ids:
+                self._table_versions[table_id] = versions.get(table_id)
+
+        return {
+            table_id: self._table_versions[table_id]
+            for table_id in table_ids
+            if self._table_versions[table_id] is not None
+        }
+
+    def get_shared(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored in the shared cache for the provided key if the
+        versions of all the tables it has been computed from are still up to date.
+
+        :param key: The key the value has been stored with.
+        :return: The cached value or None if the shared cache isn't used, or if the
+            value isn't cached or is outdated.
+        """
+
+        if not self.uses_shared_cache:
+            return None
+
+        entry = shared_field_cache.get(key)
+        if entry is not None and entry.table_versions == self.get_table_versions(
+            entry.table_versions.keys()
+        ):
+            self.shared_cache_hits += 1
+            shared_field_cache_hits_counter.add(1)
+            return entry.value
+
+        if entry is not None:
+            shared_field_cache.delete(key)
+        self.shared_cache_misses += 1
+        shared_field_cache_misses_counter.add(1)
+        return None
+
+    def set_shared(self, key: Hashable, value: Any, table_ids: Iterable[int]):
+        """
+        Stores the value in the shared cache, so that other operations can use it as
+        long as the provided tables don't change.
+
+        :param key: The key to store the value with.
+        :param value: The value to store, it must not be changed afterwards.
+        :param table_ids: The ids of all the tables the value has been computed from.
+        """
+
+        if not self.uses_shared_cache:
+            return
+
+        table_ids = set(table_ids)
+        table_versions = self.get_table_versions(table_ids)
+        if len(table_versions) == len(table_ids):
+            shared_field_cache.set(key, SharedFieldCacheEntry(value, table_versions))
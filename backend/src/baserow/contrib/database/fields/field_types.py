@@ -266,6 +266,27 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
         self.validator(value)
         return value
 
+    def prepare_value_for_db_in_bulk(
+        self, instance, values_by_row, continue_on_error=False
+    ):
+        # The validator is only constructed once for all the values instead of once
+        # per value.
+        validator = self.validator
+        for row_index, value in values_by_row.items():
+            if value == "" or value is None:
+                values_by_row[row_index] = ""
+                continue
+
+            try:
+                validator(value)
+            except Exception as e:
+                if continue_on_error:
+                    values_by_row[row_index] = e
+                else:
+                    raise
+
+        return values_by_row
+
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
         validators = kwargs.pop("validators", None) or []
@@ -367,6 +388,7 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
     model_class = TextField
+    can_copy_values_in_database = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
@@ -413,6 +435,7 @@ class TextFieldType(CollationSortMixin, FieldType):
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_copy_values_in_database = True
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
 
@@ -489,6 +512,7 @@ class LongTextFieldType(CollationSortMixin, FieldType):
 class URLFieldType(CollationSortMixin, TextFieldMatchingRegexFieldType):
     type = "url"
     model_class = URLField
+    can_copy_values_in_database = True
     _can_group_by = True
 
     @property
@@ -511,6 +535,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_copy_values_in_database = True
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
     serializer_field_overrides = {
@@ -661,6 +686,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_copy_values_in_database = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
@@ -782,6 +808,7 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_copy_values_in_database = True
     _can_group_by = True
 
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
@@ -830,6 +857,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_copy_values_in_database = True
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -1003,6 +1031,40 @@ class DateFieldType(FieldType):
             code="invalid",
         )
 
+    def prepare_value_for_db_in_bulk(
+        self, instance, values_by_row, continue_on_error=False
+    ):
+        """
+        Imported or pasted rows often contain the same date many times, so every
+        distinct string is only parsed once and the result is reused for the other
+        rows containing the same string.
+        """
+
+        prepared_strings = {}
+        for row_index, value in values_by_row.items():
+            try:
+                if not isinstance(value, str):
+                    prepared = self.prepare_value_for_db(instance, value)
+                elif value in prepared_strings:
+                    prepared = prepared_strings[value]
+                else:
+                    try:
+                        prepared = self.prepare_value_for_db(instance, value)
+                    except ValidationError as e:
+                        prepared = e
+                    prepared_strings[value] = prepared
+
+                if isinstance(prepared, Exception):
+                    raise prepared
+                values_by_row[row_index] = prepared
+            except Exception as e:
+                if continue_on_error:
+                    values_by_row[row_index] = e
+                else:
+                    raise
+
+        return values_by_row
+
     def get_export_value(self, value, field_object, rich_value=False):
         if value is None:
             return value if rich_value else ""
@@ -1328,6 +1390,7 @@ class CreatedOnFieldType(CreatedOnLastModifiedBaseFieldType):
 class LastModifiedByFieldType(ReadOnlyFieldType):
     type = "last_modified_by"
     model_class = LastModifiedByField
+    can_copy_values_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     update_always = True
@@ -1534,6 +1597,7 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
 class CreatedByFieldType(ReadOnlyFieldType):
     type = "created_by"
     model_class = CreatedByField
+    can_copy_values_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
 
@@ -1739,6 +1803,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
 class DurationFieldType(FieldType):
     type = "duration"
     model_class = DurationField
+    can_copy_values_in_database = True
     allowed_fields = ["duration_format"]
     serializer_field_names = ["duration_format"]
     _can_group_by = True
@@ -1898,6 +1963,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 
     type = "link_row"
     model_class = LinkRowField
+    can_copy_values_in_database = True
     allowed_fields = [
         "link_row_table_id",
         "link_row_related_field",
@@ -3092,6 +3158,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
     type = "email"
     model_class = EmailField
+    can_copy_values_in_database = True
 
     @property
     def regex(self):
@@ -4267,6 +4334,7 @@ class PhoneNumberFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 
     type = "phone_number"
     model_class = PhoneNumberField
+    can_copy_values_in_database = True
 
     MAX_PHONE_NUMBER_LENGTH = 100
 
@@ -5687,6 +5755,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     type = "uuid"
     model_class = UUIDField
+    can_copy_values_in_database = True
     can_get_unique_values = False
     can_be_in_form_view = False
     keep_data_on_duplication = True
@@ -5994,6 +6063,7 @@ class PasswordFieldType(FieldType):
 
     type = "password"
     model_class = PasswordField
+    can_copy_values_in_database = True
     can_be_in_form_view = True
     keep_data_on_duplication = True
     _can_order_by = False
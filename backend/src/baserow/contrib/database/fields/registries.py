@@ -147,6 +147,15 @@ class FieldType(
     inside of the import process.
     """
 
+    can_copy_values_in_database = False
+    """
+    Set this to True if the values of this field can be copied as they are, with an
+    `INSERT INTO ... SELECT` query, when a table is duplicated within the same
+    database. This is only possible if exporting and importing the serialized value
+    doesn't transform it, like remapping the ids of related objects or copying files.
+    For many to many fields, the relations are copied in the through table.
+    """
+
     is_many_to_many_field = False
     """
     Set this to True if the underlying database field is a ManyToManyField. This
@@ -1,6 +1,9 @@
 import json
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
 
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.db import transaction
 
 from rest_framework import serializers
@@ -94,13 +97,48 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The file starts with a JSON
+        header line containing the number of rows followed by one JSON array per row,
+        so that the rows can be read one by one when the job runs.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
-        )
-        job.data_file.save(None, data_file)
+        data = values["data"]
+        with tempfile.TemporaryFile() as data_file:
+            header = {"row_count": len(data)} if data is not None else None
+            data_file.write(json.dumps(header).encode("utf8") + b"\n")
+            for row in data or []:
+                data_file.write(json.dumps(row, ensure_ascii=False).encode("utf8"))
+                data_file.write(b"\n")
+            data_file.seek(0)
+            job.data_file.save(None, File(data_file))
+
+    @contextmanager
+    def open_data_file(
+        self, job: FileImportJob
+    ) -> Iterator[Tuple[int, Optional[Iterator[List[Any]]]]]:
+        """
+        Opens the data file of the job and returns the number of rows and an iterator
+        reading the rows one by one from the file. Data files created before the
+        header line was introduced contain a single JSON array with all the rows. If
+        no data has been provided, `None` is returned instead of the iterator.
+
+        :param job: The job for which the data file must be opened.
+        :return: The number of rows and the rows iterator.
+        """
+
+        with job.data_file.open("rb") as fin:
+            # The file is opened in binary mode so that it's only split on newlines,
+            # which are always escaped inside the JSON values.
+            lines = iter(fin)
+            header = json.loads(next(lines, b"null"))
+            if header is None:
+                yield 0, None
+            elif isinstance(header, list):
+                yield len(header), iter(header)
+            else:
+                yield header["row_count"], (
+                    json.loads(line) for line in lines if line.strip()
+                )
 
     def before_delete(self, job):
         """
@@ -133,30 +171,33 @@ class FileImportJobType(JobType):
         creation of the table.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
-
-        if job.table is None:
-            new_table, error_report = action_type_registry.get_by_type(
-                CreateTableActionType
-            ).do(
-                job.user,
-                job.database,
-                name=job.name,
-                data=data,
-                first_row_header=job.first_row_header,
-                progress=progress,
-            )
-
-            job.table = new_table
-            job.save(update_fields=("table",))
-        else:
-            _, error_report = action_type_registry.get_by_type(ImportRowsActionType).do(
-                job.user,
-                table=job.table,
-                data=data,
-                progress=progress,
-            )
+        with self.open_data_file(job) as (row_count, data):
+            if job.table is None:
+                # The initial table data must be normalized as a whole to create the
+                # fields and is limited by `INITIAL_TABLE_DATA_LIMIT`.
+                new_table, error_report = action_type_registry.get_by_type(
+                    CreateTableActionType
+                ).do(
+                    job.user,
+                    job.database,
+                    name=job.name,
+                    data=list(data) if data is not None else None,
+                    first_row_header=job.first_row_header,
+                    progress=progress,
+                )
+
+                job.table = new_table
+                job.save(update_fields=("table",))
+            else:
+                _, error_report = action_type_registry.get_by_type(
+                    ImportRowsActionType
+                ).do(
+                    job.user,
+                    table=job.table,
+                    data=data,
+                    progress=progress,
+                    row_count=row_count,
+                )
 
         def after_commit():
             """
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.13 on 2026-10-17 23:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The row history table can be very large, so the index is created concurrently
+    # to not block writing new entries while the migration runs.
+    atomic = False
+
+    dependencies = [
+        ("database", "0159_linkrowfield_link_row_limit_selection_view"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="rowhistory",
+            index=models.Index(
+                fields=["action_timestamp"], name="database_ro_action__6ea699_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-18 00:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0160_rowhistory_action_timestamp_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="remaining_shards",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
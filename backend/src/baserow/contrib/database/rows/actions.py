@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -218,28 +218,39 @@ class ImportRowsActionType(UndoableActionType):
         cls,
         user: AbstractUser,
         table: Table,
-        data=List[List[Any]],
+        data=Iterable[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
         This action is supposed to handle bigger row amount than the createRowsAction,
         it generates an import error report and allow to track the progress.
         Undoing this action trashes the rows and redoing restores them all.
-        The new rows are appended to the existing rows.
+        The new rows are appended to the existing rows. Only the ids of the created
+        rows are kept in memory, so the data can be streamed from a file.
         See the baserow.contrib.database.rows.handler.RowHandler.import_rows
         for more information.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterable of rows values for rows that need to be
+            created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :param row_count: The number of rows in the data, needed to track the
+            progress if the data is an iterable without length.
+        :return: The ids of the created rows and the error report.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
+        row_ids = []
+        _, error_report = RowHandler().import_rows(
+            user,
+            table,
+            data,
+            progress=progress,
+            row_count=row_count,
+            on_rows_created=lambda rows: row_ids.extend(row.id for row in rows),
         )
 
         workspace = table.database.workspace
@@ -248,13 +259,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return row_ids, error_report
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
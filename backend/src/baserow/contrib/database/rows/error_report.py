@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, TypeVar
+from typing import Any, Dict, TypeVar
 
 from django.conf import settings
 
@@ -10,21 +10,17 @@ RowIndex = TypeVar("RowIndex", bound=int)
 class RowErrorReport:
     def __init__(
         self,
-        rows: List[Dict[str, Any]],
         error_limit: int = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT,
     ):
         """
         The RowErrorReport is a helper to track rows errors and generate a report at
-        the end.
+        the end. Only the errors are kept in memory, so that the rows can be
+        processed chunk by chunk.
 
-        :param rows: the rows list.
         :param error_limit: if the error limit is exceeded, an exception is raised.
         """
 
-        self._indexed_rows = {
-            index: {"row": row, "error": None} for index, row in enumerate(rows)
-        }
-        self._rows = rows
+        self._errors = {}
         self.error_count = 0
         self.error_limit = error_limit
 
@@ -42,34 +38,14 @@ class RowErrorReport:
         if self.error_count > self.error_limit:
             raise ReportMaxErrorCountExceeded(self.to_dict())
 
-        self._indexed_rows[row_index]["error"] = error
+        self._errors[row_index] = error
 
-    def update_row(self, row_index: RowIndex, new_row: Dict[str, Any]):
-        self._indexed_rows[row_index]["row"] = new_row
-
-    def get_valid_rows_and_mapping(
-        self,
-    ) -> Tuple[List[Dict[str, Any]], Dict[RowIndex, RowIndex]]:
-        """
-        Returns rows without error and the corresponding mapping for
-        new original -> original index
-        """
-
-        valid_rows = []
-        mapping = {}
-        for index, _ in enumerate(self._rows):
-            if not self._indexed_rows[index]["error"]:
-                mapping[len(valid_rows)] = index
-                valid_rows.append(self._indexed_rows[index]["row"])
-        return valid_rows, mapping
+    def has_error(self, row_index: RowIndex) -> bool:
+        return row_index in self._errors
 
     def to_dict(self) -> Dict[RowIndex, Dict[str, Any]]:
         """
-        Generates the report as a dict.
+        Generates the report as a dict ordered by row index.
         """
 
-        report = {}
-        for index, _ in enumerate(self._rows):
-            if self._indexed_rows[index]["error"]:
-                report[index] = self._indexed_rows[index]["error"]
-        return report
+        return dict(sorted(self._errors.items()))
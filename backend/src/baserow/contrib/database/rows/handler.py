@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -11,6 +12,7 @@ from typing import (
     NewType,
     Optional,
     Set,
+    Sized,
     Tuple,
     Type,
     Union,
@@ -257,20 +259,19 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             passed in.
         """
 
-        field_ids = {}
+        fields_by_name = {field["name"]: field for field in fields.values()}
         prepared_values_by_field = defaultdict(dict)
 
-        # organize values by field name
+        # organize values by field name, only looking at the fields that are
+        # actually provided instead of at every field of the table for every row.
         for index, row_value in enumerate(row_values):
-            for field_id, field in fields.items():
-                field_name = field["name"]
-                field_ids[field_name] = field_id
-                if field_name in row_value:
-                    prepared_values_by_field[field_name][index] = row_value[field_name]
+            for field_name, value in row_value.items():
+                if field_name in fields_by_name:
+                    prepared_values_by_field[field_name][index] = value
 
         # bulk-prepare values per field
         for field_name, batch_values in prepared_values_by_field.items():
-            field = fields[field_ids[field_name]]
+            field = fields_by_name[field_name]
             field_type = field["type"]
             prepared_values_by_field[
                 field_name
@@ -284,16 +285,18 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         prepared_rows = []
         failing_rows = {}
         for index, row_value in enumerate(row_values):
-            new_values = deepcopy(row_value)
+            # A shallow copy is enough because the prepared values replace the
+            # original values instead of modifying them.
+            new_values = dict(row_value)
             row_errors = {}
-            for field_id, field in fields.items():
-                field_name = field["name"]
-                if field_name in row_value:
-                    prepared_value = prepared_values_by_field[field_name][index]
-                    if isinstance(prepared_value, Exception):
-                        row_errors[field_name] = [prepared_value]
-                    else:
-                        new_values[field_name] = prepared_value
+            for field_name in row_value:
+                if field_name not in fields_by_name:
+                    continue
+                prepared_value = prepared_values_by_field[field_name][index]
+                if isinstance(prepared_value, Exception):
+                    row_errors[field_name] = [prepared_value]
+                else:
+                    new_values[field_name] = prepared_value
             if not row_errors:
                 prepared_rows.append(new_values)
             else:
@@ -783,7 +786,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         fields = []
         update_collector = FieldUpdateCollector(table, starting_row_ids=[instance.id])
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         field_ids = []
         for field_object in model._field_objects.values():
@@ -1002,7 +1005,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             starting_row_ids=[row.id],
             deleted_m2m_rels_per_link_field=m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
         )
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         dependant_fields = []
         for (
@@ -1158,7 +1161,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         update_collector = FieldUpdateCollector(
             table, starting_row_ids=[row.id for row in inserted_rows]
         )
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         field_ids = []
         for field_object in model._field_objects.values():
@@ -1286,6 +1289,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1294,6 +1298,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1309,7 +1314,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1333,6 +1339,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        skip_search_update: bool = False,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates rows by batch and generates an error report instead of failing on first
@@ -1343,6 +1350,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
         :param model: Optional model to prevent recomputing table model.
+        :param skip_search_update: If True the search columns are not updated, the
+            caller is then responsible for it.
         :return: The created rows and the error report.
         """
 
@@ -1382,7 +1391,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
             all_created_rows += created_rows
 
-        SearchHandler.field_value_updated_or_created(table)
+        if not skip_search_update:
+            SearchHandler.field_value_updated_or_created(table)
 
         return all_created_rows, report
 
@@ -1390,10 +1400,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         self,
         user: AbstractUser,
         table: Table,
-        data: List[List[Any]],
+        data: Iterable[List[Any]],
         validate: bool = True,
         progress: Optional[Progress] = None,
         send_realtime_update: bool = True,
+        row_count: Optional[int] = None,
+        on_rows_created: Optional[Callable[[List[GeneratedTableModel]], None]] = None,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates new rows for a given table if the user belongs to the related
@@ -1403,14 +1415,25 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         stop the import. Instead an error report is created with the raised
         error for each field of each failing rows.
 
+        The data are validated and created by chunks of `BATCH_SIZE` rows and only
+        the error report is kept in memory, so the data can be a generator reading
+        the rows from a file. Combined with `on_rows_created`, the memory usage
+        doesn't depend on the number of imported rows.
+
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterable of rows values for rows that need to be
+            created.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
         :param send_realtime_update: The parameter passed to the rows_created
             signal indicating if a realtime update should be send.
+        :param row_count: The number of rows in the data. Only needed to track the
+            progress if the data doesn't have a length.
+        :param on_rows_created: If provided, this function is called with the
+            created rows of every chunk instead of collecting all of them, and an
+            empty list of rows is returned.
 
         :return: The created row instances and the error report.
         """
@@ -1423,7 +1446,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             context=table,
         )
 
-        error_report = RowErrorReport(data)
+        error_report = RowErrorReport()
 
         model = table.get_model()
 
@@ -1436,74 +1459,96 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
 
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
+        if row_count is None and isinstance(data, Sized):
+            row_count = len(data)
+
+        validation_sub_progress = None
+        creation_sub_progress = None
+        if progress and row_count is not None:
+            if validate:
+                validation_sub_progress = progress.create_child(50, row_count)
+            creation_sub_progress = progress.create_child(
+                50 if validate else 100, row_count
+            )
+
+        all_created_rows = []
+        for count, chunk in enumerate(grouper(BATCH_SIZE, data)):
+            row_start_index = count * BATCH_SIZE
+
+            valid_rows = []
+            original_row_indexes = []
+            for index, row in enumerate(chunk, start=row_start_index):
+                # Check row length
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                    continue
+
                 new_row = list(row)
                 # Fill incomplete rows with empty values
                 new_row.extend([None] * (len(fields) - len(row)))
 
                 # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
+                valid_rows.append(
                     {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
+                        f"field_{field.id}": value
+                        for field, value in zip(fields, new_row)
+                    }
                 )
-
-        # STEP 1: pre-validate data with serializer
-        if validate:
-            (
+                original_row_indexes.append(index)
+
+            # STEP 1: pre-validate data with serializer
+            if validate:
+                validation_report = self.validate_rows(table, valid_rows, model=model)
+                for index, error in validation_report.items():
+                    error_report.add_error(original_row_indexes[int(index)], error)
+
+                valid_rows_and_indexes = [
+                    (row, original_index)
+                    for row, original_index in zip(valid_rows, original_row_indexes)
+                    if not error_report.has_error(original_index)
+                ]
+                valid_rows = [row for row, _ in valid_rows_and_indexes]
+                original_row_indexes = [index for _, index in valid_rows_and_indexes]
+
+                if validation_sub_progress:
+                    validation_sub_progress.increment(
+                        len(chunk), state=ROW_IMPORT_VALIDATION
+                    )
+
+            # STEP 2: create rows in DB
+            created_rows, creation_report = self.create_rows_by_batch(
+                user,
+                table,
                 valid_rows,
-                original_row_index_mapping,
-            ) = error_report.get_valid_rows_and_mapping()
-
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
-
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
+                model=model,
+                # A single search update is triggered for the whole import at the
+                # end instead of one for every chunk.
+                skip_search_update=True,
             )
 
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
+            # Add errors to global report
+            for index, error in creation_report.items():
+                error_report.add_error(original_row_indexes[int(index)], error)
 
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
+            if creation_sub_progress:
+                creation_sub_progress.increment(len(chunk), state=ROW_IMPORT_CREATION)
 
-        created_rows, creation_report = self.create_rows_by_batch(
-            user, table, valid_rows, progress=creation_sub_progress, model=model
-        )
+            if on_rows_created is not None:
+                on_rows_created(created_rows)
+            else:
+                all_created_rows += created_rows
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+        SearchHandler.field_value_updated_or_created(table)
 
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
             # of rows_created because we might import a lot of rows.
             table_updated.send(self, table=table, user=user, force_table_refresh=True)
 
-        return created_rows, error_report.to_dict()
+        return all_created_rows, error_report.to_dict()
 
     def get_fields_metadata_for_row_history(
         self,
@@ -1770,7 +1815,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             starting_row_ids=row_ids,
             deleted_m2m_rels_per_link_field=m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
         )
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
 
         dependant_fields = []
@@ -1916,7 +1961,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         row.save()
 
         update_collector = FieldUpdateCollector(table, starting_row_ids=[row.id])
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         updated_field_ids = []
         updated_fields = []
@@ -2026,7 +2071,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
 
         update_collector = FieldUpdateCollector(table, starting_row_ids=[row.id])
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         updated_field_ids = []
         updated_fields = []
@@ -2133,7 +2178,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             updated_fields.append(field)
 
         update_collector = FieldUpdateCollector(table, starting_row_ids=row_ids)
-        field_cache = FieldCache()
+        field_cache = FieldCache(use_shared_cache=True)
         field_cache.cache_model(model)
         dependant_fields = []
         for (
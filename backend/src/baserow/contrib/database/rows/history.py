@@ -1,10 +1,13 @@
+import json
 from datetime import datetime
 from typing import Any, Dict, List, NamedTuple, NewType, Optional
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
+from django.db import transaction
 from django.db.models import QuerySet
 from django.dispatch import receiver
+from django.utils.dateparse import parse_datetime
 
 from opentelemetry import trace
 
@@ -14,6 +17,7 @@ from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import change_row_history_registry
 from baserow.contrib.database.rows.signals import rows_history_updated
 from baserow.core.action.signals import ActionCommandType, action_done
+from baserow.core.encoders import JSONEncoderSupportingDataClasses
 from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import baserow_trace
 
@@ -169,7 +173,13 @@ class RowHistoryHandler:
             )
             row_history_entries.append(entry)
 
-        if row_history_entries:
+        if not row_history_entries:
+            return
+
+        async_min_rows = settings.BASEROW_ROW_HISTORY_ASYNC_MIN_ROWS
+        if async_min_rows and len(row_history_entries) >= async_min_rows:
+            cls._write_entries_after_commit(params.table_id, row_history_entries)
+        else:
             row_history_entries = RowHistory.objects.bulk_create(row_history_entries)
             rows_history_updated.send(
                 RowHistoryHandler,
@@ -177,6 +187,107 @@ class RowHistoryHandler:
                 row_history_entries=row_history_entries,
             )
 
+    @classmethod
+    def _write_entries_after_commit(
+        cls, table_id: int, row_history_entries: List[RowHistory]
+    ):
+        """
+        Writes the entries in a background task once the current transaction has
+        been committed, so that big updates don't have to wait for the history to be
+        written. The entries are passed to the task in a compact form, in which the
+        values that are the same for all the entries of the action are only stored
+        once.
+        """
+
+        from baserow.contrib.database.rows.tasks import write_row_history_entries
+
+        first_entry = row_history_entries[0]
+        serialized_entries = json.dumps(
+            {
+                "user_id": first_entry.user_id,
+                "user_name": first_entry.user_name,
+                "action_uuid": first_entry.action_uuid,
+                "action_command_type": first_entry.action_command_type,
+                "action_timestamp": first_entry.action_timestamp.isoformat(),
+                "action_type": first_entry.action_type,
+                "rows": [
+                    [
+                        entry.row_id,
+                        entry.field_names,
+                        entry.fields_metadata,
+                        entry.before_values,
+                        entry.after_values,
+                    ]
+                    for entry in row_history_entries
+                ],
+            },
+            cls=JSONEncoderSupportingDataClasses,
+        )
+
+        transaction.on_commit(
+            lambda: write_row_history_entries.apply_async(
+                (table_id, serialized_entries), compression="zlib"
+            )
+        )
+
+    @classmethod
+    def write_serialized_entries(cls, table_id: int, serialized_entries: str):
+        """
+        Writes the entries serialized by `_write_entries_after_commit` in batches.
+        Every batch is written in its own transaction and the clients are notified
+        about the new entries of a batch as soon as it has been written.
+
+        :param table_id: The id of the table the entries belong to.
+        :param serialized_entries: The compact JSON representation of the entries.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        data = json.loads(serialized_entries)
+        if not Table.objects_and_trash.filter(id=table_id).exists():
+            # The table has been deleted in the meantime, together with its history.
+            return
+
+        action_timestamp = parse_datetime(data["action_timestamp"])
+        row_history_entries = [
+            RowHistory(
+                user_id=data["user_id"],
+                user_name=data["user_name"],
+                table_id=table_id,
+                row_id=row_id,
+                field_names=field_names,
+                fields_metadata=fields_metadata,
+                action_uuid=data["action_uuid"],
+                action_command_type=data["action_command_type"],
+                action_timestamp=action_timestamp,
+                action_type=data["action_type"],
+                before_values=before_values,
+                after_values=after_values,
+            )
+            for (
+                row_id,
+                field_names,
+                fields_metadata,
+                before_values,
+                after_values,
+            ) in data["rows"]
+        ]
+
+        batch_size = settings.BASEROW_ROW_HISTORY_WRITE_BATCH_SIZE
+        if batch_size <= 0:
+            # Batching is disabled, so all the entries are written at once.
+            batch_size = max(len(row_history_entries), 1)
+        for i in range(0, len(row_history_entries), batch_size):
+            with transaction.atomic():
+                batch = RowHistory.objects.bulk_create(
+                    row_history_entries[i : i + batch_size]
+                )
+                rows_history_updated.send(
+                    RowHistoryHandler,
+                    table_id=table_id,
+                    row_history_entries=batch,
+                )
+
     @classmethod
     @baserow_trace(tracer)
     def list_row_history(
@@ -199,15 +310,36 @@ class RowHistoryHandler:
         return queryset
 
     @classmethod
-    def delete_entries_older_than(cls, cutoff: datetime):
+    def delete_entries_older_than(cls, cutoff: datetime) -> int:
         """
         Deletes all row history entries that are older than the given cutoff date.
+        The entries are deleted in chunks of the oldest entries, each in its own
+        transaction, so that the history table is never locked for a long time.
 
         :param cutoff: The date and time before which all entries will be deleted.
+        :return: The number of deleted entries.
         """
 
-        delete_qs = RowHistory.objects.filter(action_timestamp__lt=cutoff)
-        delete_qs._raw_delete(delete_qs.db)
+        batch_size = settings.BASEROW_ROW_HISTORY_CLEANUP_BATCH_SIZE
+        if batch_size <= 0:
+            # Batching is disabled, so all the entries are deleted at once.
+            with transaction.atomic():
+                delete_qs = RowHistory.objects.filter(action_timestamp__lt=cutoff)
+                return delete_qs._raw_delete(delete_qs.db)
+
+        deleted_count = 0
+        while True:
+            oldest_ids = (
+                RowHistory.objects.filter(action_timestamp__lt=cutoff)
+                .order_by("action_timestamp")
+                .values("id")[:batch_size]
+            )
+            with transaction.atomic():
+                delete_qs = RowHistory.objects.filter(id__in=oldest_ids)
+                batch_deleted_count = delete_qs._raw_delete(delete_qs.db)
+            deleted_count += batch_deleted_count
+            if batch_deleted_count < batch_size:
+                return deleted_count
 
 
 ROW_HISTORY_ACTIONS = {
@@ -59,4 +59,8 @@ class RowHistory(models.Model):
 
     class Meta:
         ordering = ("-action_timestamp", "-id")
-        indexes = [models.Index(fields=["table", "row_id", "-action_timestamp", "-id"])]
+        indexes = [
+            models.Index(fields=["table", "row_id", "-action_timestamp", "-id"]),
+            # Used to delete the entries older than the retention period in chunks.
+            models.Index(fields=["action_timestamp"]),
+        ]
@@ -20,6 +20,17 @@ def clean_up_row_history_entries(self):
     RowHistoryHandler.delete_entries_older_than(cutoff_datetime)
 
 
+@app.task(bind=True, queue="export")
+def write_row_history_entries(self, table_id: int, serialized_entries: str):
+    """
+    Writes the row history entries of a big update in the background.
+    """
+
+    from .history import RowHistoryHandler
+
+    RowHistoryHandler.write_serialized_entries(table_id, serialized_entries)
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     every = timedelta(minutes=settings.BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES)
@@ -11,6 +11,8 @@ from .signals import rows_created, rows_deleted, rows_updated
 
 
 class RowsEventType(WebhookEventType):
+    mergeable_payload_keys = ["items"]
+
     def get_row_serializer(self, webhook, model):
         return get_row_serializer_class(
             model,
@@ -49,6 +51,7 @@ class RowCreatedEventType(RowsCreatedEventType):
     type = "row.created"
     signal = rows_created
     should_trigger_when_all_event_types_selected = False
+    mergeable_payload_keys = []
 
     def get_payload(self, *args, **kwargs):
         payload = super().get_payload(*args, **kwargs)
@@ -61,6 +64,7 @@ class RowCreatedEventType(RowsCreatedEventType):
 class RowsUpdatedEventType(RowsEventType):
     type = "rows.updated"
     signal = rows_updated
+    mergeable_payload_keys = ["items", "old_items"]
 
     def get_payload(
         self, event_id, webhook, model, table, rows, before_return, **kwargs
@@ -100,6 +104,7 @@ class RowUpdatedEventType(RowsUpdatedEventType):
     type = "row.updated"
     signal = rows_updated
     should_trigger_when_all_event_types_selected = False
+    mergeable_payload_keys = []
 
     def get_payload(
         self, event_id, webhook, model, table, rows, before_return, **kwargs
@@ -118,6 +123,7 @@ class RowUpdatedEventType(RowsUpdatedEventType):
 class RowsDeletedEventType(WebhookEventType):
     type = "rows.deleted"
     signal = rows_deleted
+    mergeable_payload_keys = ["row_ids"]
 
     def get_payload(self, event_id, webhook, rows, **kwargs):
         payload = super().get_payload(event_id, webhook, **kwargs)
@@ -145,6 +151,7 @@ class RowDeletedEventType(RowsDeletedEventType):
     type = "row.deleted"
     signal = rows_deleted
     should_trigger_when_all_event_types_selected = False
+    mergeable_payload_keys = []
 
     def get_payload(self, event_id, webhook, rows, **kwargs):
         payload = super().get_payload(event_id, webhook, rows, **kwargs)
@@ -1,5 +1,7 @@
 import math
+import time
 import traceback
+import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
 
@@ -8,11 +10,11 @@ from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVector
 from django.core.cache import cache
 from django.db import connection, transaction
-from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
+from django.db.models import Expression, Func, Max, Min, Q, QuerySet, TextField, Value
 from django.utils.encoding import force_str
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from psycopg2 import sql
 from redis.exceptions import LockNotOwnedError
 
@@ -39,6 +41,17 @@ if TYPE_CHECKING:
     from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+tsv_update_chunk_duration_histogram = meter.create_histogram(
+    "baserow.search.tsv_update_chunk_duration",
+    unit="s",
+    description="The time it took to update the tsvector cells of a chunk of rows.",
+)
+tsv_update_rows_counter = meter.create_counter(
+    "baserow.search.tsv_update_rows",
+    unit="1",
+    description="The number of rows updated by the parallel tsvector updates.",
+)
 
 
 class SearchModes(str, Enum):
@@ -453,6 +466,15 @@ class SearchHandler(
         if update_tsvectors_for_changed_rows_only:
             qs = qs.filter(Q(**{f"{ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME}": True}))
 
+        # Nobody is waiting for the progress if no progress builder is provided, so
+        # a full update of a big table can be handed over to multiple workers.
+        if (
+            not update_tsvectors_for_changed_rows_only
+            and progress_builder is None
+            and cls.fan_out_tsvector_update(table, qs, field_ids_to_restrict_update_to)
+        ):
+            return
+
         collected_vectors = cls._collect_search_vectors(
             model, qs, field_ids_to_restrict_update_to
         )
@@ -508,6 +530,281 @@ class SearchHandler(
             )
             cursor.execute(query)  # type: ignore
 
+    @classmethod
+    def get_parallel_update_progress_key(cls, table, run_id: str, start_id: int):
+        return f"_update_tsvector_columns_parallel_{table.id}_{run_id}_{start_id}"
+
+    @classmethod
+    def get_parallel_update_remaining_key(cls, table, run_id: str):
+        return f"_update_tsvector_columns_parallel_{table.id}_{run_id}_remaining"
+
+    @classmethod
+    def get_parallel_update_finished_key(cls, table, run_id: str, start_id: int):
+        return (
+            f"_update_tsvector_columns_parallel_{table.id}_{run_id}_{start_id}_finished"
+        )
+
+    @classmethod
+    def get_parallel_update_lock_key(cls, table, run_id: str, start_id: int):
+        return (
+            f"{cls.get_update_changed_rows_only_lock_key(table)}_{run_id}"
+            f"_range_{start_id}"
+        )
+
+    @classmethod
+    def fan_out_tsvector_update(
+        cls,
+        table: "Table",
+        qs: QuerySet,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Splits the id range of the provided queryset into
+        `TSV_UPDATE_PARALLEL_WORKERS` ranges and schedules a task per range that
+        updates the tsvector cells of the rows in that range. Nothing is scheduled if
+        parallel updates are disabled or if the table doesn't have enough rows.
+
+        :param table: The table which we're going to update.
+        :param qs: The queryset containing the rows that must be updated.
+        :param field_ids_to_restrict_update_to: If provided only the fields matching the
+            provided ids will have their tsv columns updated.
+        :return: Whether the update has been scheduled.
+        """
+
+        workers = settings.TSV_UPDATE_PARALLEL_WORKERS
+        if workers <= 1:
+            return False
+
+        id_range = qs.aggregate(min_id=Min("id"), max_id=Max("id"))
+        min_id, max_id = id_range["min_id"], id_range["max_id"]
+        # The id range is an upper bound of the number of rows, which is good enough
+        # to decide and much cheaper to compute than a count on a big table.
+        if (
+            min_id is None
+            or max_id - min_id + 1 < settings.TSV_UPDATE_PARALLEL_MIN_ROWS
+        ):
+            return False
+
+        from baserow.contrib.database.search.tasks import (
+            async_update_tsvector_columns_in_range,
+        )
+
+        range_size = math.ceil((max_id - min_id + 1) / workers)
+        ranges = [
+            (start_id, min(start_id + range_size - 1, max_id))
+            for start_id in range(min_id, max_id + 1, range_size)
+        ]
+        run_id = str(uuid.uuid4())
+        cache.set(
+            cls.get_parallel_update_remaining_key(table, run_id),
+            len(ranges),
+            timeout=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT * 2,
+        )
+
+        def schedule():
+            for start_id, end_id in ranges:
+                async_update_tsvector_columns_in_range.delay(
+                    table.id,
+                    run_id,
+                    start_id,
+                    end_id,
+                    field_ids_to_restrict_update_to=field_ids_to_restrict_update_to,
+                )
+
+        transaction.on_commit(schedule)
+        logger.info(
+            "Split the tsv update of table {table_id} into {count} ranges of "
+            "{range_size} ids.",
+            table_id=table.id,
+            count=len(ranges),
+            range_size=range_size,
+        )
+        return True
+
+    @classmethod
+    def update_tsvector_columns_in_range(
+        cls,
+        table: "Table",
+        run_id: str,
+        start_id: int,
+        end_id: int,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> Optional[int]:
+        """
+        Updates the tsvector cells of the rows having an id between the provided
+        `start_id` and `end_id` in chunks of `TSV_UPDATE_CHUNK_SIZE` rows. This is
+        one of the ranges scheduled by `fan_out_tsvector_update`. The last updated id
+        is stored after every chunk, so if the task is executed again, it continues
+        where it stopped. When the last range of the run has finished, the rows that
+        changed in the meantime are updated.
+
+        :param table: The table which we're going to update.
+        :param run_id: The unique id of the parallel update this range belongs to.
+        :param start_id: The first row id of the range.
+        :param end_id: The last row id of the range.
+        :param field_ids_to_restrict_update_to: If provided only the fields matching the
+            provided ids will have their tsv columns updated.
+        :return: The number of updated rows or `None` if the range of this run is
+            already being updated by another worker.
+        """
+
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(
+                cls.get_parallel_update_lock_key(table, run_id, start_id),
+                timeout=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+            )
+            # Another worker is already updating this range of the same run because
+            # the task has been delivered twice. That worker finishes the range.
+            if not cache_lock.acquire(blocking=False):
+                return None
+
+        total_updated = None
+        try:
+            total_updated = cls._update_tsvector_columns_in_range(
+                table, run_id, start_id, end_id, field_ids_to_restrict_update_to
+            )
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    # If the lock release fails, it might be because of the timeout,
+                    # and it's been stolen, so we don't really care.
+                    pass
+
+            # The range is always marked as finished, also if it failed, otherwise
+            # the run would never complete.
+            cls._finish_parallel_update_range(
+                table, run_id, start_id, field_ids_to_restrict_update_to
+            )
+
+        return total_updated
+
+    @classmethod
+    def _finish_parallel_update_range(
+        cls,
+        table: "Table",
+        run_id: str,
+        start_id: int,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ):
+        """
+        Decrements the number of remaining ranges of the run once per range. When the
+        last range has finished, the table is vacuumed and the rows that changed
+        during the run are updated.
+        """
+
+        timeout = settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT * 2
+        if not cache.add(
+            cls.get_parallel_update_finished_key(table, run_id, start_id),
+            True,
+            timeout=timeout,
+        ):
+            # The range has already been counted by an earlier delivery of the task.
+            return
+
+        try:
+            remaining = cache.decr(cls.get_parallel_update_remaining_key(table, run_id))
+        except ValueError:
+            # The key has expired, so the other ranges can't be tracked anymore.
+            remaining = None
+
+        if remaining == 0:
+            cache.delete(cls.get_parallel_update_remaining_key(table, run_id))
+            if settings.AUTO_VACUUM_AFTER_SEARCH_UPDATE and not settings.TESTS:
+                cls.vacuum_table(table)
+            logger.info(
+                "Finished the parallel tsv update of table {table_id} with optional "
+                "field filter of {field_ids}.",
+                table_id=table.id,
+                field_ids=field_ids_to_restrict_update_to or "no fields",
+            )
+            # Rows that have been changed while the ranges were being updated might
+            # have been skipped, so they're updated now.
+            cls._trigger_async_tsvector_task_if_needed(
+                table, update_tsvs_for_changed_rows_only=True
+            )
+
+    @classmethod
+    def _update_tsvector_columns_in_range(
+        cls,
+        table: "Table",
+        run_id: str,
+        start_id: int,
+        end_id: int,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> int:
+        model = table.get_model()
+        qs = model.objects.filter(id__gte=start_id, id__lte=end_id)
+        collected_vectors = cls._collect_search_vectors(
+            model, qs, field_ids_to_restrict_update_to
+        )
+        set_background_updated_false = field_ids_to_restrict_update_to is None
+        update_query = {
+            cv.field_tsv_db_column: cv.search_vector for cv in collected_vectors
+        }
+        if set_background_updated_false:
+            update_query[ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME] = Value(False)
+
+        progress_key = cls.get_parallel_update_progress_key(table, run_id, start_id)
+        last_id = cache.get(progress_key, start_id - 1)
+        total_updated = 0
+
+        try:
+            while True:
+                chunk_start = time.perf_counter()
+                with transaction.atomic():
+                    next_ids = list(
+                        qs.filter(id__gt=last_id)
+                        .order_by("id")
+                        .values_list("id", flat=True)[: settings.TSV_UPDATE_CHUNK_SIZE]
+                    )
+                    if not next_ids:
+                        break
+                    next_chunk = qs.filter(id__in=next_ids).select_for_update(
+                        of=("self",)
+                    )
+                    updated = next_chunk.update(**update_query)
+                last_id = next_ids[-1]
+                cache.set(
+                    progress_key,
+                    last_id,
+                    timeout=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT * 2,
+                )
+                total_updated += updated
+                tsv_update_chunk_duration_histogram.record(
+                    time.perf_counter() - chunk_start
+                )
+                tsv_update_rows_counter.add(updated)
+        except Exception as e:
+            logger.error(
+                "Failed to update the search vectors of rows {start_id} to {end_id} "
+                "because of {e}. Attempting to do per field updates one by one "
+                "instead...",
+                start_id=start_id,
+                end_id=end_id,
+                e=str(e),
+            )
+            exception_capturer(e)
+            cls.try_slower_but_best_effort_tsv_update(
+                collected_vectors,
+                qs.filter(id__gt=last_id),
+                set_background_updated_false,
+                False,
+            )
+
+        cache.delete(progress_key)
+        logger.debug(
+            "Updated {count} rows with ids {start_id} to {end_id} in table "
+            "{table_id}'s tsvs.",
+            count=total_updated,
+            start_id=start_id,
+            end_id=end_id,
+            table_id=table.id,
+        )
+        return total_updated
+
     @classmethod
     def split_update_into_chunks_by_ranges(
         cls,
@@ -40,3 +40,38 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    queue="export",
+    time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+)
+def async_update_tsvector_columns_in_range(
+    table_id: int,
+    run_id: str,
+    start_id: int,
+    end_id: int,
+    field_ids_to_restrict_update_to: Optional[List[int]] = None,
+):
+    """
+    Responsible for updating the `tsvector` columns of the rows in one of the id
+    ranges of a parallel update of a table.
+
+    :param table_id: The ID of the table we'd like to update the tsvectors for.
+    :param run_id: The unique id of the parallel update the range belongs to.
+    :param start_id: The first row id of the range.
+    :param end_id: The last row id of the range.
+    :param field_ids_to_restrict_update_to: If provided only the fields matching the
+        provided ids will have their tsv columns updated.
+    """
+
+    from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.table.handler import TableHandler
+
+    table = TableHandler().get_table(table_id)
+    try:
+        SearchHandler.update_tsvector_columns_in_range(
+            table, run_id, start_id, end_id, field_ids_to_restrict_update_to
+        )
+    except PostgresFullTextSearchDisabledException:
+        logger.debug(f"Postgres full-text search is disabled.")
@@ -12,22 +12,50 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps a small LRU cache of the fully built model
+classes, so that the field attrs don't have to be unpickled and the model class doesn't
+have to be generated again on every request. An entry is keyed by the table id and
+remembers the versions of the table and of all the tables it has generated a related
+model for. It's only used if all those versions still match the ones in the db, which
+means that invalidating a table via `invalidate_table_in_model_cache` also invalidates
+the built models in all the other processes. The same goes for the specific fields and
+field dependants in the `SharedFieldCache`.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+local_model_cache_hits_counter = meter.create_counter(
+    "baserow.local_model_cache.hits",
+    unit="1",
+    description="The number of times a built table model was found in the process "
+    "local model cache.",
+)
+local_model_cache_misses_counter = meter.create_counter(
+    "baserow.local_model_cache.misses",
+    unit="1",
+    description="The number of times a table model had to be built because it was "
+    "not found in the process local model cache, or because it was outdated.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -53,7 +81,11 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
 
 
 def clear_generated_model_cache():
+    from baserow.contrib.database.fields.field_cache import shared_field_cache
+
     print("Clearing Baserow's internal generated model cache...")
+    local_model_cache.clear()
+    shared_field_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,8 +102,160 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    local_model_cache.delete(table_id)
+    from baserow.contrib.database.fields.field_cache import shared_field_cache
+
+    shared_field_cache.delete_table(table_id)
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+
+
+@dataclass
+class LocalModelCacheEntry:
+    model: Type["GeneratedTableModel"]
+    # The versions of the table and of all the tables related models have been
+    # generated for when the model was built, keyed by table id.
+    table_versions: Dict[int, str]
+    # The table attributes that change the generated model, or its `baserow_table`,
+    # without changing the version of the table.
+    table_flags: Tuple[Any, ...]
+    field_count: int
+
+
+def _get_table_flags(table: "Table") -> Tuple[Any, ...]:
+    return (
+        table.needs_background_update_column_added,
+        table.created_by_column_added,
+        table.last_modified_by_column_added,
+        table.name,
+        table.database_id,
+    )
+
+
+class LocalModelCache:
+    """
+    A thread safe LRU cache of built table models, bounded by the number of models
+    and by the total number of fields of the cached models. The number of fields is
+    used as an approximation of the memory used by a model.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[int, LocalModelCacheEntry]" = OrderedDict()
+        self._field_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            not settings.BASEROW_DISABLE_MODEL_CACHE
+            and settings.BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE > 0
+        )
+
+    def get(self, table_id: int) -> Optional[LocalModelCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(table_id)
+            if entry is not None:
+                self._entries.move_to_end(table_id)
+            return entry
+
+    def set(self, table_id: int, entry: LocalModelCacheEntry):
+        if entry.field_count > settings.BASEROW_LOCAL_MODEL_CACHE_MAX_FIELDS:
+            return
+
+        with self._lock:
+            self._remove(table_id)
+            self._entries[table_id] = entry
+            self._field_count += entry.field_count
+            while self._entries and (
+                len(self._entries) > settings.BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE
+                or self._field_count > settings.BASEROW_LOCAL_MODEL_CACHE_MAX_FIELDS
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, table_id: int):
+        with self._lock:
+            self._remove(table_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._field_count = 0
+
+    def _remove(self, table_id: int):
+        entry = self._entries.pop(table_id, None)
+        if entry is not None:
+            self._field_count -= entry.field_count
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_model_cache = LocalModelCache()
+
+
+def get_locally_cached_model(
+    table: "Table",
+) -> Tuple[Optional[Type["GeneratedTableModel"]], bool]:
+    """
+    Returns the built model of the table from the process local cache if the versions
+    of the table and of its related tables still match the ones in the database. The
+    version of the provided table instance is refreshed as a side effect, using the
+    same single query that checks the related tables.
+
+    :param table: The table to get the model for.
+    :return: The cached model or None if it's not cached or outdated, and whether
+        the version of the table has been refreshed.
+    """
+
+    from baserow.contrib.database.table.models import Table
+
+    entry = local_model_cache.get(table.id)
+    if entry is None or entry.table_flags != _get_table_flags(table):
+        local_model_cache_misses_counter.add(1)
+        return None, False
+
+    current_versions = dict(
+        Table.objects_and_trash.filter(id__in=entry.table_versions.keys()).values_list(
+            "id", "version"
+        )
+    )
+    if table.id not in current_versions:
+        local_model_cache.delete(table.id)
+        local_model_cache_misses_counter.add(1)
+        return None, False
+
+    table.version = current_versions[table.id]
+    if current_versions != entry.table_versions:
+        local_model_cache.delete(table.id)
+        local_model_cache_misses_counter.add(1)
+        return None, True
+
+    local_model_cache_hits_counter.add(1)
+    return entry.model, True
+
+
+def set_locally_cached_model(table: "Table", model: Type["GeneratedTableModel"]):
+    """
+    Stores the built model of the table in the process local cache, along with the
+    versions of the table and of all the tables that related models have been
+    generated for.
+    """
+
+    table_versions = {table.id: table.version}
+    for related_model in model.baserow_models.values():
+        related_table = getattr(related_model, "baserow_table", None)
+        if related_table is not None:
+            table_versions[related_table.id] = related_table.version
+
+    local_model_cache.set(
+        table.id,
+        LocalModelCacheEntry(
+            model=model,
+            table_versions=table_versions,
+            table_flags=_get_table_flags(table),
+            field_count=len(model._field_objects) + len(model._trashed_field_objects),
+        ),
+    )
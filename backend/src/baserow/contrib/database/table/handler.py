@@ -815,72 +815,78 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         database_type = application_type_registry.get_by_model(database)
 
         config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            stream_rows=True,
+            copy_rows_in_database=True,
         )
 
-        serialized_tables = database_type.export_tables_serialized([table], config)
-
-        # Set a unique name for the table to import back as a new one.
-        exported_table = serialized_tables[0]
-        exported_table["name"] = self.find_unused_table_name(database, table.name)
-        exported_table["order"] = Table.get_last_order(database)
-
-        # It can happen that a field, filter, etc has a reference to a field in
-        # another table. This can result in an error because that field id is not in
-        # the field mapping. Therefore, we're fetching all the related field ids in
-        # the table and add those to the mapping. The key and value is the same
-        # because those field ids haven't changed.
-        all_table_dependency_field_ids = FieldDependency.objects.filter(
-            Q(dependant__table_id=table.id) & ~Q(dependency__table_id=table.id)
-        ).values_list("dependency_id", flat=True)
-        all_table_dependency_field_ids = {
-            field_id: field_id for field_id in all_table_dependency_field_ids
-        }
-
-        # It can happen that a field has a reference to another view. We would
-        # therefore need to construct a mapping that contains all the existing views,
-        # and they will remain the same
-        all_database_views_ids = View.objects.filter(
-            table__database_id=table.database_id
-        ).values_list("id")
-        all_database_view_ids = {
-            view_id[0]: view_id[0] for view_id in all_database_views_ids
-        }
-
-        id_mapping: Dict[str, Any] = {
-            "database_tables": {},
-            "database_fields": all_table_dependency_field_ids,
-            "database_views": all_database_view_ids,
-            # The properties below must be kept in sync with
-            # `src/baserow/contrib/database/views/registries.py::import_serialized`
-            "database_view_filters": {},
-            "database_view_filter_groups": {},
-            "database_view_sortings": {},
-            "database_view_group_bys": {},
-            "database_view_decorations": {},
-            # We have to create the `database_field_select_options` because that's
-            # otherwise not created later on.
-            "database_field_select_options": {},
-        }
-
-        link_fields_to_import_to_existing_tables = (
-            self._create_related_link_fields_in_existing_tables_to_import(
-                exported_table, id_mapping
+        try:
+            serialized_tables = database_type.export_tables_serialized([table], config)
+
+            # Set a unique name for the table to import back as a new one.
+            exported_table = serialized_tables[0]
+            exported_table["name"] = self.find_unused_table_name(database, table.name)
+            exported_table["order"] = Table.get_last_order(database)
+
+            # It can happen that a field, filter, etc has a reference to a field in
+            # another table. This can result in an error because that field id is not in
+            # the field mapping. Therefore, we're fetching all the related field ids in
+            # the table and add those to the mapping. The key and value is the same
+            # because those field ids haven't changed.
+            all_table_dependency_field_ids = FieldDependency.objects.filter(
+                Q(dependant__table_id=table.id) & ~Q(dependency__table_id=table.id)
+            ).values_list("dependency_id", flat=True)
+            all_table_dependency_field_ids = {
+                field_id: field_id for field_id in all_table_dependency_field_ids
+            }
+
+            # It can happen that a field has a reference to another view. We would
+            # therefore need to construct a mapping that contains all the existing
+            # views, and they will remain the same
+            all_database_views_ids = View.objects.filter(
+                table__database_id=table.database_id
+            ).values_list("id")
+            all_database_view_ids = {
+                view_id[0]: view_id[0] for view_id in all_database_views_ids
+            }
+
+            id_mapping: Dict[str, Any] = {
+                "database_tables": {},
+                "database_fields": all_table_dependency_field_ids,
+                "database_views": all_database_view_ids,
+                # The properties below must be kept in sync with
+                # `src/baserow/contrib/database/views/registries.py::import_serialized`
+                "database_view_filters": {},
+                "database_view_filter_groups": {},
+                "database_view_sortings": {},
+                "database_view_group_bys": {},
+                "database_view_decorations": {},
+                # We have to create the `database_field_select_options` because that's
+                # otherwise not created later on.
+                "database_field_select_options": {},
+            }
+
+            link_fields_to_import_to_existing_tables = (
+                self._create_related_link_fields_in_existing_tables_to_import(
+                    exported_table, id_mapping
+                )
             )
-        )
-        progress.increment(by=export_progress)
-
-        print(id_mapping)
-        imported_tables = database_type.import_tables_serialized(
-            database,
-            [exported_table],
-            id_mapping,
-            config,
-            external_table_fields_to_import=link_fields_to_import_to_existing_tables,
-            progress_builder=progress.create_child_builder(
-                represents_progress=import_progress
-            ),
-        )
+            progress.increment(by=export_progress)
+
+            print(id_mapping)
+            imported_tables = database_type.import_tables_serialized(
+                database,
+                [exported_table],
+                id_mapping,
+                config,
+                external_table_fields_to_import=link_fields_to_import_to_existing_tables,
+                progress_builder=progress.create_child_builder(
+                    represents_progress=import_progress
+                ),
+            )
+        finally:
+            config.close_streams()
 
         new_table_clone = imported_tables[0]
 
@@ -40,7 +40,10 @@ from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
     get_cached_model_field_attrs,
+    get_locally_cached_model,
+    local_model_cache,
     set_cached_model_field_attrs,
+    set_locally_cached_model,
 )
 from baserow.contrib.database.table.constants import (
     CREATED_BY_COLUMN_NAME,
@@ -160,7 +163,7 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         with cachalot_enabled():
             return super().count()
 
-    def enhance_by_fields(self):
+    def enhance_by_fields(self, only_field_ids: Optional[Iterable[int]] = None):
         """
         Enhances the queryset based on the `enhance_queryset_in_bulk` for each unique
         field type used in the table. This one will eventually call the
@@ -168,18 +171,50 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         field adds the `prefetch_related` to prevent N queries per row. This helper
         should only be used when multiple rows are going to be fetched.
 
+        :param only_field_ids: If provided, then only the fields with these ids are
+            enhanced. This avoids prefetching and annotating the values of fields
+            that are not going to be serialized anyway.
         :return: The enhanced queryset.
         :rtype: QuerySet
         """
 
+        if only_field_ids is not None:
+            only_field_ids = set(only_field_ids)
+
         by_type = defaultdict(list)
-        for field_object in self.model._field_objects.values():
+        for field_id, field_object in self.model._field_objects.items():
+            if only_field_ids is not None and field_id not in only_field_ids:
+                continue
             field_type = field_object["type"]
             by_type[field_type].append(field_object)
         for field_type, field_objects in by_type.items():
             self = field_type.enhance_queryset_in_bulk(self, field_objects)
         return self
 
+    def only_fields(self, field_ids: Iterable[int]):
+        """
+        Only selects the columns of the fields with the provided ids and the columns
+        that are needed for every row. The columns of all the other fields are
+        deferred, which makes a big difference for wide tables when only a few
+        fields are serialized. Note that accessing the value of a deferred field
+        results in an additional query per row.
+
+        :param field_ids: The ids of the fields whose values must be selected.
+        :return: The queryset selecting only the columns of the provided fields.
+        :rtype: QuerySet
+        """
+
+        field_names = ["id", "order"]
+        for field_id in field_ids:
+            field_object = self.model._field_objects.get(field_id)
+            if field_object is None:
+                continue
+            model_field = self.model._meta.get_field(field_object["name"])
+            # Many to many relationships don't have a column in the table.
+            if model_field.concrete and not model_field.many_to_many:
+                field_names.append(field_object["name"])
+        return self.only(*field_names)
+
     def search_all_fields(
         self,
         search: str,
@@ -972,6 +1007,29 @@ class Table(
         :rtype: Model
         """
 
+        use_local_cache = (
+            use_cache
+            and len(fields or []) == 0
+            and field_ids is None
+            and field_names is None
+            and add_dependencies is True
+            and attribute_names is False
+            and manytomany_models is None
+            and app_label is None
+            and managed is False
+            and force_add_tsvectors is False
+            and local_model_cache.enabled
+        )
+        version_refreshed = False
+        if use_local_cache:
+            model, version_refreshed = get_locally_cached_model(self)
+            if model is not None:
+                # The cached model is shared by all the threads of the process, so
+                # its `baserow_table` is the instance it has been built with and not
+                # `self`. It's only used if both have the same version and
+                # attributes that matter for the model.
+                return model
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1051,7 +1109,8 @@ class Table(
         )
 
         if use_cache:
-            self.refresh_from_db(fields=["version"])
+            if not version_refreshed:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1131,6 +1190,9 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if use_local_cache:
+            set_locally_cached_model(self, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
@@ -113,6 +113,13 @@ class FieldAggregationNotSupported(Exception):
     """Raised when the view type does not support field aggregation."""
 
 
+class AggregationCannotBeUpdatedIncrementally(Exception):
+    """
+    Raised when a cached aggregation value can't be updated using only the values
+    of the changed rows, and must be recomputed completely instead.
+    """
+
+
 class AggregationTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get an aggregation type that does not exist."""
 
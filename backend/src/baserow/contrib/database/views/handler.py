@@ -14,7 +14,8 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
 from django.db.models.expressions import F, OrderBy
 from django.db.models.query import QuerySet
 
@@ -25,15 +26,17 @@ from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import (
     AdvancedFilterBuilder,
     FilterBuilder,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import SearchModes
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
@@ -99,9 +102,11 @@ from baserow.core.utils import (
     set_allowed_attrs,
     set_allowed_m2m_fields,
     split_attrs_and_m2m_fields,
+    split_comma_separated_string,
 )
 
 from .exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
@@ -187,6 +192,20 @@ class UpdatedViewWithChangedAttributes:
     new_view_attributes: Dict[str, Any]
 
 
+@dataclasses.dataclass
+class IncrementalViewAggregation:
+    """
+    A cached aggregation value of a view that can be updated using only the
+    aggregated values of the rows that have changed.
+    """
+
+    view: View
+    field: Field
+    aggregation_type: str
+    version: int
+    removed_value: Any = None
+
+
 class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
     @classmethod
     def does_index_exist(cls, index_name: str) -> bool:
@@ -2558,6 +2577,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         apply_sorts: bool = True,
         apply_filters: bool = True,
         search_mode: Optional[SearchModes] = None,
+        only_field_ids: Optional[Iterable[int]] = None,
     ) -> QuerySet:
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -2578,13 +2598,18 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param apply_sorts: Whether to apply view sorts to the resulting queryset.
         :param apply_filters: Whether to apply view filters to the resulting queryset.
         :param search_mode: The type of search to perform if a search term is provided.
+        :param only_field_ids: If provided, then only the values of the fields with
+            these ids are selected and enhanced. Filters, sorts and search still work
+            on all the fields of the model.
         :return: The appropriate queryset for the provided view.
         """
 
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(only_field_ids)
+        if only_field_ids is not None:
+            queryset = queryset.only_fields(only_field_ids)
 
         view_type = view_type_registry.get_by_model(view.specific_class)
         if view_type.can_filter and apply_filters:
@@ -2858,6 +2883,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchModes] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        restrict_to_row_ids: Optional[Iterable[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2879,6 +2905,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param restrict_to_row_ids: Only aggregate the rows with these ids, for
+            example to incrementally update a cached aggregation value.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -2901,6 +2929,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             adhoc_filters = AdHocFilters()
 
         queryset = model.objects.all().enhance_by_fields()
+        if restrict_to_row_ids is not None:
+            queryset = queryset.filter(id__in=restrict_to_row_ids)
 
         view_type = view_type_registry.get_by_model(view.specific_class)
 
@@ -2959,6 +2989,287 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset.aggregate(**aggregation_dict)
 
+    def get_aggregations_before_rows_change(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        rows_created: bool = False,
+    ) -> List[IncrementalViewAggregation]:
+        """
+        Collects the cached aggregation values of the views in the table that can be
+        updated incrementally when the provided rows are changed, together with the
+        aggregated values of those rows before the change. The result must be passed
+        into `update_aggregations_after_rows_change` after the rows have been changed.
+
+        :param table: The table where the rows are going to be changed in.
+        :param model: The model of the table including all fields.
+        :param row_ids: The ids of the rows that are going to be changed.
+        :param rows_created: Indicates that the rows have just been created, in which
+            case there are no values before the change and the version of the cached
+            value has already been incremented by the `field_value_updated` call.
+        :return: The cached aggregations that can be updated incrementally.
+        """
+
+        if not settings.INCREMENTAL_VIEW_AGGREGATIONS_ENABLED:
+            return []
+
+        candidates = []
+        for view_type in view_type_registry.get_all():
+            if not view_type.can_aggregate_field:
+                continue
+            for view, field, aggregation_type_name in view_type.get_table_aggregations(
+                table
+            ):
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                if (
+                    aggregation_type.can_be_updated_incrementally
+                    and field.id in model._field_objects
+                ):
+                    candidates.append((view, field, aggregation_type_name))
+
+        if len(candidates) == 0:
+            return []
+
+        link_dependant_field_ids = self._get_link_dependant_field_ids(table, model)
+        candidates = [
+            candidate
+            for candidate in candidates
+            if candidate[1].id not in link_dependant_field_ids
+        ]
+        if len(candidates) == 0:
+            return []
+
+        cached = cache.get_many(
+            [
+                self._get_aggregation_value_cache_key(view, field.db_column)
+                for view, field, _ in candidates
+            ]
+            + [
+                self._get_aggregation_version_cache_key(view, field.db_column)
+                for view, field, _ in candidates
+            ]
+        )
+        expected_version_increment = 1 if rows_created else 0
+        aggregations = []
+        for view, field, aggregation_type_name in candidates:
+            cached_value = cached.get(
+                self._get_aggregation_value_cache_key(view, field.db_column)
+            )
+            cached_version = cached.get(
+                self._get_aggregation_version_cache_key(view, field.db_column), 1
+            )
+            if (
+                cached_value is not None
+                and cached_value["version"] + expected_version_increment
+                == cached_version
+            ):
+                aggregations.append(
+                    IncrementalViewAggregation(
+                        view=view,
+                        field=field,
+                        aggregation_type=aggregation_type_name,
+                        version=cached_value["version"],
+                    )
+                )
+
+        if not rows_created:
+            for view, view_aggregations in self._group_aggregations_by_view(
+                aggregations
+            ):
+                removed_values = self.get_field_aggregations(
+                    None,
+                    view,
+                    [(a.field, a.aggregation_type) for a in view_aggregations],
+                    model,
+                    skip_perm_check=True,
+                    restrict_to_row_ids=row_ids,
+                )
+                for aggregation in view_aggregations:
+                    aggregation.removed_value = removed_values[
+                        aggregation.field.db_column
+                    ]
+
+        return aggregations
+
+    def _get_link_dependant_field_ids(
+        self, table: Table, model: GeneratedTableModel
+    ) -> Set[int]:
+        """
+        Returns the ids of the fields of the table whose values can change in rows
+        other than the changed ones. That's the case for the link row fields linking
+        to the table itself, because changing a row also changes the related rows,
+        and for all the fields depending on a link row field, directly or via other
+        fields of the table, because the linked table can depend on this table. The
+        aggregations of these fields can't be updated incrementally.
+
+        :param table: The table where the rows are changed in.
+        :param model: The model of the table including all fields.
+        :return: The ids of the fields that must be fully recomputed.
+        """
+
+        link_row_fields = [
+            field_object["field"]
+            for field_object in model._field_objects.values()
+            if isinstance(field_object["field"], LinkRowField)
+        ]
+        if len(link_row_fields) == 0:
+            return set()
+
+        link_row_field_ids = {field.id for field in link_row_fields}
+        unsafe_field_ids = {
+            field.id for field in link_row_fields if field.link_row_table_id == table.id
+        }
+        dependencies = defaultdict(set)
+        for dependant_id, dependency_id, via_id in FieldDependency.objects.filter(
+            dependant_id__in=model._field_objects.keys()
+        ).values_list("dependant_id", "dependency_id", "via_id"):
+            if via_id is not None or dependency_id in link_row_field_ids:
+                unsafe_field_ids.add(dependant_id)
+            elif dependency_id is not None:
+                dependencies[dependant_id].add(dependency_id)
+
+        # Propagate to the fields depending on an unsafe field of the same table.
+        changed = True
+        while changed:
+            changed = False
+            for dependant_id, dependency_ids in dependencies.items():
+                if dependant_id not in unsafe_field_ids and (
+                    dependency_ids & unsafe_field_ids
+                ):
+                    unsafe_field_ids.add(dependant_id)
+                    changed = True
+
+        return unsafe_field_ids
+
+    def update_aggregations_after_rows_change(
+        self,
+        aggregations: List[IncrementalViewAggregation],
+        model: GeneratedTableModel,
+        row_ids: List[int],
+    ):
+        """
+        Computes the new values of the cached aggregations collected by
+        `get_aggregations_before_rows_change` by only aggregating the changed rows,
+        and stores them in the cache once the transaction commits. A new value is
+        only stored if the cached value was invalidated exactly once, by the change
+        of these rows, so that concurrent changes always result in a full
+        recomputation.
+
+        :param aggregations: The aggregations returned by
+            `get_aggregations_before_rows_change`.
+        :param model: The model of the table including all fields.
+        :param row_ids: The ids of the rows that have been changed.
+        """
+
+        if len(aggregations) == 0:
+            return
+
+        cached = cache.get_many(
+            [
+                self._get_aggregation_value_cache_key(a.view, a.field.db_column)
+                for a in aggregations
+            ]
+        )
+        new_values = []
+        for view, view_aggregations in self._group_aggregations_by_view(aggregations):
+            added_values = self.get_field_aggregations(
+                None,
+                view,
+                [(a.field, a.aggregation_type) for a in view_aggregations],
+                model,
+                skip_perm_check=True,
+                restrict_to_row_ids=row_ids,
+            )
+            for aggregation in view_aggregations:
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(
+                        view, aggregation.field.db_column
+                    )
+                )
+                if cached_value is None or cached_value["version"] != (
+                    aggregation.version
+                ):
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation.aggregation_type
+                )
+                try:
+                    value = aggregation_type.update_value_incrementally(
+                        cached_value["value"],
+                        aggregation.removed_value,
+                        added_values[aggregation.field.db_column],
+                    )
+                except AggregationCannotBeUpdatedIncrementally:
+                    continue
+                new_values.append((aggregation, value))
+
+        if len(new_values) > 0:
+            transaction.on_commit(
+                lambda: self._store_incrementally_updated_aggregations(new_values)
+            )
+
+    def _store_incrementally_updated_aggregations(
+        self, new_values: List[Tuple[IncrementalViewAggregation, Any]]
+    ):
+        """
+        Stores the incrementally updated aggregation values in the cache, but only
+        if the version has been incremented exactly once since the previous value
+        was computed.
+
+        :param new_values: A list of tuples containing the aggregation and its new
+            value.
+        """
+
+        cached = cache.get_many(
+            [
+                self._get_aggregation_value_cache_key(a.view, a.field.db_column)
+                for a, _ in new_values
+            ]
+            + [
+                self._get_aggregation_version_cache_key(a.view, a.field.db_column)
+                for a, _ in new_values
+            ]
+        )
+        to_cache = {}
+        for aggregation, value in new_values:
+            value_cache_key = self._get_aggregation_value_cache_key(
+                aggregation.view, aggregation.field.db_column
+            )
+            cached_value = cached.get(value_cache_key)
+            cached_version = cached.get(
+                self._get_aggregation_version_cache_key(
+                    aggregation.view, aggregation.field.db_column
+                ),
+                1,
+            )
+            if (
+                cached_value is not None
+                and cached_value["version"] == aggregation.version
+                and cached_version == aggregation.version + 1
+            ):
+                to_cache[value_cache_key] = {"value": value, "version": cached_version}
+
+        cache.set_many(to_cache)
+
+    def _group_aggregations_by_view(
+        self, aggregations: List[IncrementalViewAggregation]
+    ) -> List[Tuple[View, List[IncrementalViewAggregation]]]:
+        """
+        Groups the provided aggregations by their view, so that the values of all
+        aggregations of a view can be computed in a single query.
+        """
+
+        views = {}
+        by_view = defaultdict(list)
+        for aggregation in aggregations:
+            views[aggregation.view.id] = aggregation.view
+            by_view[aggregation.view.id].append(aggregation)
+        return [(views[view_id], by_view[view_id]) for view_id in views]
+
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
         Rotates the slug of the provided view.
@@ -3315,10 +3626,30 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         field_ids = get_include_exclude_field_ids(
             view.table, include_fields, exclude_fields
         )
+        field_ids = (
+            list(set(field_ids) & set(visible_field_ids))
+            if field_ids
+            else visible_field_ids
+        )
+
+        # The values of the group by fields are needed to compute the group by
+        # metadata, so they must be selected even if they're not included.
+        group_by_field_ids = set()
+        if view_type.can_group_by and group_by:
+            group_by_field_ids = {
+                get_field_id_from_field_key(field_string, False)
+                for field_string in split_comma_separated_string(group_by)
+            }
 
         # We have to still make a model with all fields as the public rows should still
-        # be filtered by hidden fields.
-        queryset = table_model.objects.all().enhance_by_fields()
+        # be filtered by hidden fields. Only the values of the fields that are
+        # returned are selected and enhanced though.
+        selected_field_ids = set(field_ids) | group_by_field_ids
+        queryset = (
+            table_model.objects.all()
+            .enhance_by_fields(selected_field_ids)
+            .only_fields(selected_field_ids)
+        )
         queryset = self.apply_filters(view, queryset)
 
         if view_type.can_group_by:
@@ -3349,12 +3680,6 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search, visible_field_ids, search_mode=search_mode
             )
 
-        field_ids = (
-            list(set(field_ids) & set(visible_field_ids))
-            if field_ids
-            else visible_field_ids
-        )
-
         return queryset, field_ids, visible_field_options
 
     def get_group_by_metadata_in_rows(
@@ -3492,6 +3817,7 @@ class CachingPublicViewRowChecker:
             .prefetch_related("viewfilter_set", "filter_groups")
             .all()
         )
+        self._model = model
         self._updated_field_ids = updated_field_ids
         self._views_with_filters = []
         self._always_visible_views = []
@@ -3539,18 +3865,12 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
-
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view({row.id})
+        views = [
+            view
+            for view, _, _ in self._views_with_filters
+            if row.id in visible_row_ids_per_view[view.id]
+        ]
         return views + self._always_visible_views
 
     def get_public_views_where_rows_are_visible(self, rows) -> List[PublicViewRows]:
@@ -3570,25 +3890,13 @@ class CachingPublicViewRowChecker:
         """
 
         visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
-
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view(
+            {row.id for row in rows}
+        )
+        for view, _, _ in self._views_with_filters:
+            visible_ids = visible_row_ids_per_view[view.id]
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3597,15 +3905,76 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_visible_row_ids_per_view(self, row_ids: Set[int]) -> Dict[int, Set[int]]:
+        """
+        Figures out which of the provided rows are visible in every public view with
+        filters. The results of views which can be cached are taken from the cache if
+        all the rows have been checked before. All the other views are checked
+        together in a single query, no matter how many views there are.
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        :param row_ids: The ids of the rows to check.
+        :return: A dict containing the view id as key and the set of row ids which
+            are visible in the view as value.
+        """
+
+        visible_row_ids_per_view = {}
+        views_to_check = []
+        for view, filter_qs, can_use_cache in self._views_with_filters:
+            view_cache = self._view_row_check_cache[view.id]
+            if can_use_cache and all(row_id in view_cache for row_id in row_ids):
+                visible_row_ids_per_view[view.id] = {
+                    row_id for row_id in row_ids if view_cache[row_id]
+                }
+            else:
+                views_to_check.append((view, filter_qs, can_use_cache))
+
+        if len(views_to_check) == 0:
+            return visible_row_ids_per_view
+
+        checked_row_ids_per_view = self._check_rows_visible_in_views(
+            [(view, filter_qs) for view, filter_qs, _ in views_to_check], row_ids
         )
+        for view, _, can_use_cache in views_to_check:
+            visible_ids = checked_row_ids_per_view[view.id]
+            visible_row_ids_per_view[view.id] = visible_ids
+            if can_use_cache:
+                for row_id in row_ids:
+                    self._view_row_check_cache[view.id][row_id] = row_id in visible_ids
+
+        return visible_row_ids_per_view
+
+    def _check_rows_visible_in_views(
+        self, views_and_filter_qs: List[Tuple[View, QuerySet]], row_ids: Set[int]
+    ) -> Dict[int, Set[int]]:
+        """
+        Checks in which of the provided views the rows are visible using one single
+        query. For every view a boolean column is annotated, containing an `EXISTS`
+        subquery with the filters of that view, so that the number of queries stays
+        the same regardless of the number of public views in the table.
+
+        :param views_and_filter_qs: A list of tuples containing the view and the
+            queryset with the filters of that view applied.
+        :param row_ids: The ids of the rows to check.
+        :return: A dict containing the view id as key and the set of row ids which
+            are visible in the view as value.
+        """
+
+        visible_row_ids_per_view = {view.id: set() for view, _ in views_and_filter_qs}
+        annotations = {
+            f"visible_in_view_{view.id}": Exists(filter_qs.filter(id=OuterRef("id")))
+            for view, filter_qs in views_and_filter_qs
+        }
+        queryset = (
+            self._model.objects_and_trash.filter(id__in=row_ids)
+            .order_by()
+            .annotate(**annotations)
+            .values_list("id", *annotations.keys())
+        )
+        for row_id, *visible_in_views in queryset:
+            for (view, _), visible in zip(views_and_filter_qs, visible_in_views):
+                if visible:
+                    visible_row_ids_per_view[view.id].add(row_id)
+        return visible_row_ids_per_view
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
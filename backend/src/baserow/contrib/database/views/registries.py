@@ -43,6 +43,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
     AggregationTypeAlreadyRegistered,
     AggregationTypeDoesNotExist,
     DecoratorTypeAlreadyRegistered,
@@ -658,6 +659,21 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_table_aggregations(
+        self, table: "Table"
+    ) -> Iterable[Tuple["View", django_models.Field, str]]:
+        """
+        Should return the aggregations of all the views of this type in the provided
+        table.
+
+        returns a list of tuple (View, Field, aggregation_type)
+        """
+
+        raise NotImplementedError(
+            "If the view supports field aggregation it must implement "
+            "`get_table_aggregations` method."
+        )
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -1010,6 +1026,35 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    can_be_updated_incrementally = False
+    """
+    Indicates whether a cached value of this aggregation can be updated using only
+    the aggregated values of the rows that have changed. If True, the
+    `update_value_incrementally` method must be implemented.
+    """
+
+    def update_value_incrementally(
+        self, value: Any, removed_value: Any, added_value: Any
+    ) -> Any:
+        """
+        Computes the new aggregation value based on the previous value of the full
+        view and the aggregated values of the changed rows before and after the
+        change. A row that has been deleted only appears in the `removed_value`,
+        a row that has been created only in the `added_value` and an updated row in
+        both.
+
+        :param value: The previous aggregation value of the whole view.
+        :param removed_value: The aggregation value of the changed rows before the
+            change.
+        :param added_value: The aggregation value of the changed rows after the
+            change.
+        :raises AggregationCannotBeUpdatedIncrementally: When the new value can't be
+            determined without recomputing the aggregation over all the rows.
+        :return: The new aggregation value of the whole view.
+        """
+
+        raise AggregationCannotBeUpdatedIncrementally()
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -2,6 +2,7 @@ from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
 
 from .models import GalleryView
 
@@ -89,3 +90,39 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+@receiver([row_signals.before_rows_update, row_signals.before_rows_delete])
+def before_rows_change_collect_aggregations(sender, rows, user, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_aggregations_before_rows_change(
+        table, model, [row.id for row in rows]
+    )
+
+
+@receiver([row_signals.rows_updated, row_signals.rows_deleted])
+def rows_changed_update_aggregations(
+    sender, rows, user, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    aggregations = dict(before_return).get(before_rows_change_collect_aggregations)
+    if aggregations:
+        ViewHandler().update_aggregations_after_rows_change(
+            aggregations, model, [row.id for row in rows]
+        )
+
+
+@receiver(row_signals.rows_created)
+def rows_created_update_aggregations(
+    sender, rows, before, user, table, model, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    row_ids = [row.id for row in rows]
+    aggregations = handler.get_aggregations_before_rows_change(
+        table, model, row_ids, rows_created=True
+    )
+    handler.update_aggregations_after_rows_change(aggregations, model, row_ids)
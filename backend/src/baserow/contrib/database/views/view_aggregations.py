@@ -52,6 +52,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import AggregationCannotBeUpdatedIncrementally
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation
 
@@ -78,6 +79,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -129,6 +131,9 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def update_value_incrementally(self, value, removed_value, added_value):
+        return value - (removed_value or 0) + (added_value or 0)
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -202,6 +207,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -220,6 +226,15 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def update_value_incrementally(self, value, removed_value, added_value):
+        if removed_value is not None and (value is None or removed_value <= value):
+            # One of the removed values could have been the minimum, so the next
+            # smallest value can only be found by recomputing.
+            raise AggregationCannotBeUpdatedIncrementally()
+
+        values = [v for v in [value, added_value] if v is not None]
+        return min(values) if values else None
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -227,6 +242,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -246,6 +262,15 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def update_value_incrementally(self, value, removed_value, added_value):
+        if removed_value is not None and (value is None or removed_value >= value):
+            # One of the removed values could have been the maximum, so the next
+            # largest value can only be found by recomputing.
+            raise AggregationCannotBeUpdatedIncrementally()
+
+        values = [v for v in [value, added_value] if v is not None]
+        return max(values) if values else None
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -253,6 +278,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -266,6 +292,21 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def update_value_incrementally(self, value, removed_value, added_value):
+        if removed_value is not None:
+            if value is None:
+                raise AggregationCannotBeUpdatedIncrementally()
+            value = value - removed_value
+            if not value:
+                # The sum is `None` instead of zero if there aren't any values left,
+                # which can't be determined without recomputing.
+                raise AggregationCannotBeUpdatedIncrementally()
+
+        if added_value is not None:
+            value = added_value if value is None else value + added_value
+
+        return value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
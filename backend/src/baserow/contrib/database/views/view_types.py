@@ -260,6 +260,24 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_table_aggregations(self, table):
+        """
+        Returns the (GridView, Field, aggregation_type) list computed from the field
+        options of all the grid views in the specified table.
+        """
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(
+                grid_view__table=table, grid_view__trashed=False
+            )
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+        return [
+            (option.grid_view, option.field, option.aggregation_raw_type)
+            for option in field_options
+        ]
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
@@ -0,0 +1,277 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from loguru import logger
+from opentelemetry import metrics
+from redis.exceptions import LockNotOwnedError
+from requests import PreparedRequest, RequestException, Response, Session
+
+from .validators import get_webhook_session_class
+
+meter = metrics.get_meter(__name__)
+webhook_calls_dispatched_counter = meter.create_counter(
+    "baserow.webhooks.calls_dispatched",
+    unit="1",
+    description="The number of webhook calls sent by the pooled dispatcher.",
+)
+webhook_events_coalesced_counter = meter.create_counter(
+    "baserow.webhooks.events_coalesced",
+    unit="1",
+    description="The number of webhook events merged into a batched payload.",
+)
+webhook_call_duration_histogram = meter.create_histogram(
+    "baserow.webhooks.call_duration",
+    unit="s",
+    description="The time it took the target of a webhook to respond.",
+)
+
+# One session per process and per address validation mode. A session keeps a
+# keep-alive connection pool per host, so consecutive calls to the same endpoint
+# don't have to open a new connection and do a new TLS handshake every time.
+_sessions: Dict[bool, Session] = {}
+
+
+def get_webhook_session() -> Session:
+    """
+    Returns the process wide session that must be used to make pooled webhook calls.
+    Cookies are never stored because the same session is used to call the
+    webhooks of all users.
+    """
+
+    allow_private_address = settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True
+    if allow_private_address not in _sessions:
+        session = get_webhook_session_class()()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _sessions[allow_private_address] = session
+    return _sessions[allow_private_address]
+
+
+def get_coalesce_buffer_cache_key(webhook_id: int) -> str:
+    return f"webhook_coalesce_buffer_{webhook_id}"
+
+
+def get_coalesce_lock_cache_key(webhook_id: int) -> str:
+    return f"webhook_coalesce_lock_{webhook_id}"
+
+
+def enqueue_webhook_calls(calls: List[dict]):
+    """
+    Schedules the provided webhook calls using the pooled dispatcher. If a coalesce
+    window is configured, the calls are buffered per webhook and sent together when
+    the window has passed. Otherwise, all calls are sent concurrently by a single
+    task.
+
+    :param calls: The calls that must be made. Every call is a dict containing the
+        keyword arguments of the `call_webhook` task.
+    """
+
+    from .tasks import dispatch_webhook_calls, flush_coalesced_webhook_calls
+
+    if settings.BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS <= 0:
+        dispatch_webhook_calls.delay(calls=calls)
+        return
+
+    for call in calls:
+        webhook_id = call["webhook_id"]
+        pending_count = _add_to_coalesce_buffer(webhook_id, call)
+        if pending_count >= settings.BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS:
+            flush_coalesced_webhook_calls.delay(webhook_id=webhook_id)
+        elif pending_count == 1:
+            # The first event in the buffer starts the window. All the events that
+            # arrive before the countdown expires will be sent along with it.
+            flush_coalesced_webhook_calls.apply_async(
+                kwargs={"webhook_id": webhook_id},
+                countdown=settings.BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS,
+            )
+
+
+def _with_coalesce_lock(webhook_id: int, func):
+    if not hasattr(cache, "lock"):
+        return func()
+
+    cache_lock = cache.lock(get_coalesce_lock_cache_key(webhook_id), timeout=10)
+    cache_lock.acquire()
+    try:
+        return func()
+    finally:
+        try:
+            cache_lock.release()
+        except LockNotOwnedError:
+            # If the lock release fails, it might be because of the timeout
+            # and it's been stolen so we don't really care.
+            pass
+
+
+def _add_to_coalesce_buffer(webhook_id: int, call: dict) -> int:
+    cache_key = get_coalesce_buffer_cache_key(webhook_id)
+    # Keep the buffered events long enough to survive a busy queue, but make sure
+    # they eventually expire if the flush task is lost.
+    timeout = settings.BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS + 60 * 60
+
+    def add():
+        pending = cache.get(cache_key, [])
+        pending.append(call)
+        cache.set(cache_key, pending, timeout=timeout)
+        return len(pending)
+
+    return _with_coalesce_lock(webhook_id, add)
+
+
+def pop_coalesced_webhook_calls(webhook_id: int) -> List[dict]:
+    """
+    Removes and returns all the calls that are waiting in the coalesce buffer of
+    the provided webhook.
+    """
+
+    cache_key = get_coalesce_buffer_cache_key(webhook_id)
+
+    def pop():
+        pending = cache.get(cache_key, [])
+        cache.delete(cache_key)
+        return pending
+
+    return _with_coalesce_lock(webhook_id, pop)
+
+
+def merge_webhook_calls(calls: List[dict]) -> List[dict]:
+    """
+    Merges consecutive calls with the same event type into one call with a batched
+    payload if the event type supports it. The order of the events is respected and
+    no more than `BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS` events are merged together.
+
+    :param calls: The calls of a single webhook in the order they were triggered.
+    :return: The calls that must be made.
+    """
+
+    from .handler import WebhookHandler
+    from .registries import webhook_event_type_registry
+
+    merged_calls = []
+    max_events = max(settings.BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS, 1)
+    for event_type, group in groupby(calls, key=lambda c: c["event_type"]):
+        group = list(group)
+        event_type_instance = webhook_event_type_registry.get(event_type)
+        for i in range(0, len(group), max_events):
+            chunk = group[i : i + max_events]
+            payload = None
+            if len(chunk) > 1:
+                payload = event_type_instance.merge_payloads(
+                    [call["payload"] for call in chunk]
+                )
+
+            if payload is None:
+                merged_calls.extend(chunk)
+                continue
+
+            event_id = str(uuid.uuid4())
+            payload["event_id"] = event_id
+            headers = {
+                **chunk[-1]["headers"],
+                **WebhookHandler().get_headers(event_type, event_id),
+            }
+            merged_calls.append(
+                {
+                    **chunk[-1],
+                    "event_id": event_id,
+                    "headers": headers,
+                    "payload": payload,
+                }
+            )
+            webhook_events_coalesced_counter.add(len(chunk))
+
+    return merged_calls
+
+
+WebhookCallResult = Tuple[
+    Optional[PreparedRequest], Optional[Response], str, float, bool
+]
+
+
+def _make_webhook_call(session: Session, call: dict) -> WebhookCallResult:
+    from advocate import UnacceptableAddressException
+
+    from .handler import WebhookHandler
+
+    request = None
+    response = None
+    success = False
+    error = ""
+    start = time.perf_counter()
+
+    try:
+        request, response = WebhookHandler().make_request(
+            call["method"], call["url"], call["headers"], call["payload"], session
+        )
+        success = response.ok
+    except RequestException as exception:
+        request = exception.request
+        response = exception.response
+        error = str(exception)
+    except UnacceptableAddressException as exception:
+        error = f"UnacceptableAddressException: {exception}"
+
+    return request, response, error, time.perf_counter() - start, success
+
+
+def send_webhook_calls(calls: List[dict]):
+    """
+    Sends the provided webhook calls concurrently using the pooled session. The
+    result of every call is stored afterwards. Failed calls are handed over to the
+    `call_webhook` task, so that the usual retry and deactivation rules apply.
+
+    :param calls: The calls that must be made. Every call is a dict containing the
+        keyword arguments of the `call_webhook` task.
+    """
+
+    from .handler import WebhookHandler
+    from .tasks import call_webhook
+
+    if not calls:
+        return
+
+    session = get_webhook_session()
+    max_workers = max(
+        min(len(calls), settings.BASEROW_WEBHOOKS_POOLED_DISPATCH_MAX_WORKERS), 1
+    )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(lambda call: _make_webhook_call(session, call), calls)
+        )
+    duration = time.perf_counter() - start
+
+    handler = WebhookHandler()
+    for call, (request, response, error, call_duration, success) in zip(calls, results):
+        webhook_call_duration_histogram.record(call_duration)
+        recorded = handler.store_webhook_call_result(
+            call["webhook_id"],
+            call["event_id"],
+            call["event_type"],
+            call["url"],
+            request,
+            response,
+            error,
+            success,
+        )
+        if recorded and not success and settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL:
+            call_webhook.apply_async(kwargs=call, countdown=1, retries=1)
+
+    webhook_calls_dispatched_counter.add(len(calls))
+    latencies = sorted(result[3] for result in results)
+    logger.debug(
+        "Dispatched {count} webhook calls in {duration:.3f}s ({throughput:.1f}/s, "
+        "median latency {median:.3f}s, max latency {max:.3f}s).",
+        count=len(calls),
+        duration=duration,
+        throughput=len(calls) / duration if duration else 0,
+        median=latencies[len(latencies) // 2],
+        max=latencies[-1],
+    )
@@ -1,13 +1,15 @@
 import json
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
+from django.utils import timezone
 
-from requests import PreparedRequest, Response
+from requests import PreparedRequest, Response, Session
 
 from baserow.contrib.database.table.models import Table
 from baserow.core.handler import CoreHandler
@@ -319,8 +321,13 @@ class WebhookHandler:
         webhook.delete()
 
     def make_request(
-        self, method: str, url: str, headers: dict, payload: dict
-    ) -> Response:
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        payload: dict,
+        session: Optional[Session] = None,
+    ) -> Tuple[PreparedRequest, Response]:
         """
         Makes a request to the provided URL with the provided settings. In production
         mode, the advocate library is used so that the internal network can't be
@@ -331,10 +338,12 @@ class WebhookHandler:
         :param headers: The headers that must be sent. The key is the name and the
             value the value.
         :param payload: The JSON pay as dict that must be sent.
+        :param session: An optional session that must be used to make the request.
+            This allows reusing keep-alive connections across multiple calls.
         :return: The request and response as the tuple (request, response)
         """
 
-        request = get_webhook_request_function()
+        request = get_webhook_request_function() if session is None else session.request
 
         response = request(
             method,
@@ -353,6 +362,110 @@ class WebhookHandler:
 
         return first_request, response
 
+    def register_webhook_call(
+        self,
+        webhook: TableWebhook,
+        event_id: str,
+        event_type: str,
+        url: str,
+        request: Optional[PreparedRequest],
+        response: Optional[Response],
+        error: str,
+        success: bool,
+    ):
+        """
+        Stores the result of a webhook call in the call log and updates the failed
+        triggers of the webhook accordingly. The webhook is deactivated if it has
+        failed too many times in a row.
+
+        :param webhook: The webhook that has been called. It's expected to be locked
+            for update.
+        :param event_id: The unique event id of the call.
+        :param event_type: The event type related to the call.
+        :param url: The URL that was called.
+        :param request: The request that was made, if any.
+        :param response: The response that was received, if any.
+        :param error: The error message if the request could not be made.
+        :param success: Indicates whether the call has been successful.
+        """
+
+        TableWebhookCall.objects.update_or_create(
+            event_id=event_id,
+            event_type=event_type,
+            webhook=webhook,
+            defaults={
+                "called_time": timezone.now(),
+                "called_url": url,
+                "request": self.format_request(request)
+                if request is not None
+                else None,
+                "response": self.format_response(response)
+                if response is not None
+                else None,
+                "response_status": response.status_code
+                if response is not None
+                else None,
+                "error": error,
+            },
+        )
+        self.clean_webhook_calls(webhook)
+
+        if success and webhook.failed_triggers != 0:
+            # If the call was successful and failed triggers had been increased in
+            # the past, we can safely reset it to 0 again to prevent deactivation of
+            # the webhook.
+            webhook.failed_triggers = 0
+            webhook.save()
+        elif not success and (
+            webhook.failed_triggers
+            < settings.BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES
+        ):
+            # If the task has reached the maximum amount of failed calls, we're going to
+            # give up and increase the total failed triggers of the webhook if we're
+            # still operating within the limits of the max consecutive trigger failures.
+            webhook.failed_triggers += 1
+            webhook.save()
+        elif not success:
+            # If webhook has reached the maximum amount of failed triggers,
+            # we're going to deactivate it because we can reasonable assume that the
+            # target doesn't listen anymore. At this point we've tried 8 * 10 times.
+            # The user can manually activate it again when it's fixed.
+            webhook.active = False
+            webhook.save()
+
+    def store_webhook_call_result(
+        self,
+        webhook_id: int,
+        event_id: str,
+        event_type: str,
+        url: str,
+        request: Optional[PreparedRequest],
+        response: Optional[Response],
+        error: str,
+        success: bool,
+    ) -> bool:
+        """
+        Locks the webhook and registers the result of a call that has been made
+        outside of a transaction. See `register_webhook_call` for the parameters.
+
+        :return: False if the webhook doesn't exist anymore and nothing has been
+            stored.
+        """
+
+        with transaction.atomic():
+            try:
+                webhook = TableWebhook.objects.select_for_update(of=("self",)).get(
+                    id=webhook_id
+                )
+            except TableWebhook.DoesNotExist:
+                return False
+
+            self.register_webhook_call(
+                webhook, event_id, event_type, url, request, response, error, success
+            )
+
+        return True
+
     def get_headers(self, event_type: str, event_id: str):
         """Returns the default headers that must be added to every request."""
 
@@ -1,5 +1,7 @@
 import uuid
+from typing import List, Optional
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.dispatch.dispatcher import Signal
@@ -7,6 +9,7 @@ from django.dispatch.dispatcher import Signal
 from baserow.contrib.database.table.models import Table
 from baserow.core.registry import Instance, ModelRegistryMixin, Registry
 
+from .dispatcher import enqueue_webhook_calls
 from .tasks import call_webhook
 
 
@@ -25,6 +28,12 @@ class WebhookEventType(Instance):
 
     signal = None
     should_trigger_when_all_event_types_selected = True
+    mergeable_payload_keys = []
+    """
+    The keys of the payload containing lists that can be concatenated when multiple
+    events of this type are coalesced into one batched call. If empty, the events
+    are never merged.
+    """
 
     def __init__(self):
         if not isinstance(self.signal, Signal):
@@ -76,6 +85,28 @@ class WebhookEventType(Instance):
             "event_type": self.type,
         }
 
+    def merge_payloads(self, payloads: List[dict]) -> Optional[dict]:
+        """
+        Merges the payloads of multiple events of this type, triggered for the same
+        webhook, into one batched payload. The list values of the
+        `mergeable_payload_keys` are concatenated, the rest of the payload is taken
+        from the first event.
+
+        :param payloads: The payloads that must be merged, in the order in which
+            the events were triggered.
+        :return: The merged payload or None if the payloads can't be merged.
+        """
+
+        if not self.mergeable_payload_keys:
+            return None
+
+        merged_payload = dict(payloads[0])
+        for key in self.mergeable_payload_keys:
+            merged_payload[key] = [
+                value for payload in payloads for value in payload[key]
+            ]
+        return merged_payload
+
     def get_table_object(self, **kwargs: dict) -> Table:
         """
         By default we expect the `table` instance to be in the payload of the signal.
@@ -124,20 +155,32 @@ class WebhookEventType(Instance):
         webhook_handler = WebhookHandler()
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
+        calls = []
         for webhook in webhooks:
             payload = self.get_payload(event_id, webhook, **kwargs)
             headers = webhook.header_dict
             headers.update(**webhook_handler.get_headers(self.type, event_id))
-            call_webhook.delay(
-                webhook_id=webhook.id,
-                event_id=str(event_id),
-                event_type=self.type,
-                method=webhook.request_method,
-                url=webhook.url,
-                headers=headers,
-                payload=payload,
+            calls.append(
+                dict(
+                    webhook_id=webhook.id,
+                    event_id=str(event_id),
+                    event_type=self.type,
+                    method=webhook.request_method,
+                    url=webhook.url,
+                    headers=headers,
+                    payload=payload,
+                )
             )
 
+        if not calls:
+            return
+
+        if settings.BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED:
+            enqueue_webhook_calls(calls)
+        else:
+            for call in calls:
+                call_webhook.delay(**call)
+
 
 class WebhookEventTypeRegistry(ModelRegistryMixin, Registry):
     name = "webhook_event"
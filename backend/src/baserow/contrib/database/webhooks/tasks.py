@@ -1,3 +1,5 @@
+from typing import List
+
 from django.conf import settings
 from django.db import transaction
 
@@ -36,13 +38,11 @@ def call_webhook(
     :param payload: The JSON serializable payload that must be used as request body.
     """
 
-    from django.utils import timezone
-
     from advocate import UnacceptableAddressException
     from requests import RequestException
 
     from .handler import WebhookHandler
-    from .models import TableWebhook, TableWebhookCall
+    from .models import TableWebhook
 
     with transaction.atomic():
         handler = WebhookHandler()
@@ -71,49 +71,9 @@ def call_webhook(
         except UnacceptableAddressException as exception:
             error = f"UnacceptableAddressException: {exception}"
 
-        TableWebhookCall.objects.update_or_create(
-            event_id=event_id,
-            event_type=event_type,
-            webhook=webhook,
-            defaults={
-                "called_time": timezone.now(),
-                "called_url": url,
-                "request": handler.format_request(request)
-                if request is not None
-                else None,
-                "response": handler.format_response(response)
-                if response is not None
-                else None,
-                "response_status": response.status_code
-                if response is not None
-                else None,
-                "error": error,
-            },
+        handler.register_webhook_call(
+            webhook, event_id, event_type, url, request, response, error, success
         )
-        handler.clean_webhook_calls(webhook)
-
-        if success and webhook.failed_triggers != 0:
-            # If the call was successful and failed triggers had been increased in
-            # the past, we can safely reset it to 0 again to prevent deactivation of
-            # the webhook.
-            webhook.failed_triggers = 0
-            webhook.save()
-        elif not success and (
-            webhook.failed_triggers
-            < settings.BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES
-        ):
-            # If the task has reached the maximum amount of failed calls, we're going to
-            # give up and increase the total failed triggers of the webhook if we're
-            # still operating within the limits of the max consecutive trigger failures.
-            webhook.failed_triggers += 1
-            webhook.save()
-        elif not success:
-            # If webhook has reached the maximum amount of failed triggers,
-            # we're going to deactivate it because we can reasonable assume that the
-            # target doesn't listen anymore. At this point we've tried 8 * 10 times.
-            # The user can manually activate it again when it's fixed.
-            webhook.active = False
-            webhook.save()
 
     # This part must be outside of the transaction block, otherwise it could cause
     # the transaction to rollback when the retry exception is raised, and we don't want
@@ -125,3 +85,39 @@ def call_webhook(
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
         self.retry(countdown=2**self.request.retries)
+
+
+@app.task(bind=True, queue="export")
+def dispatch_webhook_calls(self, calls: List[dict]):
+    """
+    Sends multiple webhook calls concurrently from one worker, reusing keep-alive
+    connections to the same hosts. Used instead of `call_webhook` when the
+    `BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED` setting is enabled.
+
+    :param calls: The calls that must be made. Every call is a dict containing the
+        keyword arguments of the `call_webhook` task.
+    """
+
+    from .dispatcher import send_webhook_calls
+
+    send_webhook_calls(calls)
+
+
+@app.task(bind=True, queue="export")
+def flush_coalesced_webhook_calls(self, webhook_id: int):
+    """
+    Sends all the calls that have been buffered for the provided webhook during the
+    coalesce window. Consecutive events of the same type are merged into one
+    batched payload where possible.
+
+    :param webhook_id: The id of the webhook of which the buffer must be flushed.
+    """
+
+    from .dispatcher import (
+        merge_webhook_calls,
+        pop_coalesced_webhook_calls,
+        send_webhook_calls,
+    )
+
+    calls = pop_coalesced_webhook_calls(webhook_id)
+    send_webhook_calls(merge_webhook_calls(calls))
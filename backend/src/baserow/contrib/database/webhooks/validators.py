@@ -1,6 +1,6 @@
 from http.client import _is_illegal_header_value, _is_legal_header_name
 from socket import gaierror, timeout
-from typing import Callable
+from typing import Callable, Type
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -12,6 +12,7 @@ from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
 )
+from requests import Session
 
 INVALID_URL_CODE = "invalid_url"
 
@@ -38,6 +39,22 @@ def get_webhook_request_function() -> Callable:
         return baserow_advocate.request
 
 
+def get_webhook_session_class() -> Type[Session]:
+    """
+    Return the appropriate session class based on production environment or
+    settings. Just like `get_webhook_request_function`, the advocate session is
+    used unless private addresses are explicitly allowed.
+    """
+
+    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+        return Session
+    else:
+        addr_validator = get_advocate_address_validator()
+        baserow_advocate = RequestsAPIWrapper(addr_validator)
+
+        return baserow_advocate.Session
+
+
 def get_advocate_address_validator() -> AddrValidator:
     """
     Return Advocate's AddrValidator with the user configurable white and black lists.
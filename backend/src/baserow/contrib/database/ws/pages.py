@@ -21,6 +21,15 @@ from baserow.ws.registries import PageType
 class TablePageType(PageType):
     type = "table"
     parameters = ["table_id"]
+    optional_parameters = ["row_update_format"]
+
+    ROW_UPDATE_FORMAT_FULL = "full"
+    ROW_UPDATE_FORMAT_DELTA = "delta"
+    """
+    Clients subscribing with the `delta` row update format receive a
+    `rows_updated_delta` event containing only the changed field values instead of
+    the `rows_updated` event containing all the values before and after the update.
+    """
 
     def can_add(self, user, web_socket_id, table_id, **kwargs):
         """
@@ -51,6 +60,14 @@ class TablePageType(PageType):
     def get_permission_channel_group_name(self, table_id, **kwargs):
         return f"permissions-table-{table_id}"
 
+    def get_row_updates_delta_group_name(self, table_id):
+        return f"table-{table_id}-row-updates-delta"
+
+    def get_additional_group_names(self, table_id, row_update_format=None, **kwargs):
+        if row_update_format == self.ROW_UPDATE_FORMAT_DELTA:
+            return [self.get_row_updates_delta_group_name(table_id)]
+        return []
+
 
 class PublicViewPageType(PageType):
     type = "view"
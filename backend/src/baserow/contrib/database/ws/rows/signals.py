@@ -12,7 +12,7 @@ from baserow.contrib.database.api.rows.serializers import (
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
-from baserow.ws.registries import page_registry
+from baserow.ws.registries import has_additional_group_subscribers, page_registry
 
 
 @receiver(row_signals.before_rows_update)
@@ -69,22 +69,41 @@ def rows_updated(
 ):
     table_page_type = page_registry.get("table")
     before_rows_values = dict(before_return)[serialize_rows_values]
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def send_rows_updated():
+        # The rows are serialized only once, the delta payload for the clients that
+        # opted in to it is derived from the same serialized values.
+        serialized_rows = get_row_serializer_class(
+            model, RowSerializer, is_response=True
+        )(rows, many=True).data
+        metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
+            user, table, [row.id for row in rows]
+        )
+        alternative_payloads = {}
+        delta_group_name = table_page_type.get_row_updates_delta_group_name(table.id)
+        if has_additional_group_subscribers(delta_group_name):
+            alternative_payloads[
+                delta_group_name
+            ] = RealtimeRowMessages.rows_updated_delta(
+                table_id=table.id,
+                serialized_rows_before_update=before_rows_values,
+                serialized_rows=serialized_rows,
+                metadata=metadata,
+            )
+
+        table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
-                metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
-                    user, table, [row.id for row in rows]
-                ),
+                serialized_rows=serialized_rows,
+                metadata=metadata,
             ),
             getattr(user, "web_socket_id", None),
+            alternative_payloads=alternative_payloads,
             table_id=table.id,
         )
-    )
+
+    transaction.on_commit(send_rows_updated)
 
 
 @receiver(row_signals.rows_ai_values_generation_error)
@@ -216,6 +235,42 @@ class RealtimeRowMessages:
             "metadata": metadata,
         }
 
+    @staticmethod
+    def rows_updated_delta(
+        table_id: int,
+        serialized_rows_before_update: List[Dict[str, Any]],
+        serialized_rows: List[Dict[str, Any]],
+        metadata: Dict[int, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Compact alternative of `rows_updated` containing only the id and the changed
+        values of every row. Rows without changed values are left out.
+        """
+
+        rows_before_update = {row["id"]: row for row in serialized_rows_before_update}
+        rows = []
+        for row in serialized_rows:
+            row_before_update = rows_before_update.get(row["id"], {})
+            changed_values = {
+                key: value
+                for key, value in row.items()
+                if key not in row_before_update or row_before_update[key] != value
+            }
+            if changed_values:
+                rows.append({"id": row["id"], **changed_values})
+
+        changed_row_ids = {row["id"] for row in rows}
+        return {
+            "type": "rows_updated_delta",
+            "table_id": table_id,
+            "rows": rows,
+            "metadata": {
+                row_id: row_metadata
+                for row_id, row_metadata in metadata.items()
+                if row_id in changed_row_ids
+            },
+        }
+
     @staticmethod
     def row_orders_recalculated(table_id: int) -> Dict[str, Any]:
         return {
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
@@ -820,6 +820,18 @@ class LocalBaserowListRowsUserServiceType(
             **kwargs,
         )
 
+    def formula_generator(self, service: ServiceSubClass) -> Generator[str, None, None]:
+        """
+        Yields the formulas of the service, including the `search_query` and the
+        filter values that are formulas.
+        """
+
+        yield from super().formula_generator(service)
+        yield service.search_query
+        yield from service.service_filters.filter(value_is_formula=True).values_list(
+            "value", flat=True
+        )
+
     def dispatch_data(
         self,
         service: LocalBaserowListRows,
@@ -1121,6 +1133,18 @@ class LocalBaserowGetRowUserServiceType(
 
         return resolved_values
 
+    def formula_generator(self, service: ServiceSubClass) -> Generator[str, None, None]:
+        """
+        Yields the formulas of the service, including the `search_query` and the
+        filter values that are formulas.
+        """
+
+        yield from super().formula_generator(service)
+        yield service.search_query
+        yield from service.service_filters.filter(value_is_formula=True).values_list(
+            "value", flat=True
+        )
+
     def dispatch_data(
         self,
         service: LocalBaserowGetRow,
@@ -405,6 +405,7 @@ class CoreConfig(AppConfig):
         plugin_dir.register(DefaultFileStorageHealthCheck)
 
         import baserow.core.integrations.receivers  # noqa: F403, F401
+        import baserow.core.receivers  # noqa: F403, F401
 
 
 # noinspection PyPep8Naming
@@ -0,0 +1,207 @@
+"""
+Cached permission related lookups that are shared between all the processes via the
+default Django cache.
+
+Every workspace has a permissions version stored in the cache. The cached values of a
+workspace include that version in their key, so changing the version, which happens
+when the members, teams or role assignments of the workspace change, invalidates all
+of them at once without having to know their keys. The keys also include the
+permissions version of the whole instance, which changes when something that affects
+all the workspaces changes, like the licenses. The versions are random strings
+instead of counters, so that an evicted version can never make old entries valid
+again.
+"""
+
+import math
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+
+workspace_permissions_cache_hits = meter.create_counter(
+    "baserow.workspace_permissions_cache.hits",
+    unit="1",
+    description="The number of values found in the workspace permissions cache. The "
+    "`cache` attribute contains the name of the cached value.",
+)
+workspace_permissions_cache_misses = meter.create_counter(
+    "baserow.workspace_permissions_cache.misses",
+    unit="1",
+    description="The number of values that had to be computed because they were not "
+    "found in the workspace permissions cache. The `cache` attribute contains the "
+    "name of the cached value.",
+)
+
+
+PERMISSIONS_VERSION_CACHE_KEY = "permissions_version"
+
+
+def get_workspace_permissions_version_cache_key(workspace_id: int) -> str:
+    return f"workspace_permissions_version__{workspace_id}"
+
+
+def _get_or_create_version(
+    cache_key: str, get_timeout: Callable[[], Optional[int]] = lambda: None
+) -> str:
+    version = cache.get(cache_key)
+    if version is None:
+        new_version = str(uuid.uuid4())
+        # If another process created a version in the meantime, then `add` doesn't
+        # overwrite it and that one must be used.
+        cache.add(cache_key, new_version, timeout=get_timeout())
+        # The version might already have been evicted again, in which case the one
+        # that was just created is used.
+        version = cache.get(cache_key, new_version)
+    return version
+
+
+def get_workspace_permissions_version(workspace_id: int) -> str:
+    """
+    Returns the current permissions version of the workspace, creating one if it
+    doesn't exist yet.
+    """
+
+    return _get_or_create_version(
+        get_workspace_permissions_version_cache_key(workspace_id)
+    )
+
+
+def _get_permissions_version_timeout() -> Optional[int]:
+    from baserow.core.registries import plugin_registry
+
+    timeouts = [
+        timeout
+        for timeout in (
+            plugin.get_permissions_version_timeout()
+            for plugin in plugin_registry.get_all()
+        )
+        if timeout is not None
+    ]
+    return max(1, math.ceil(min(timeouts))) if timeouts else None
+
+
+def get_permissions_version() -> str:
+    """
+    Returns the current permissions version of the whole instance, creating one if it
+    doesn't exist yet. A new version expires when a plugin expects the permissions to
+    change by themselves, for example because a license expires.
+    """
+
+    return _get_or_create_version(
+        PERMISSIONS_VERSION_CACHE_KEY, _get_permissions_version_timeout
+    )
+
+
+def invalidate_workspace_permissions(workspace_id: int):
+    """
+    Changes the permissions version of the workspace once the current transaction
+    commits, so that all the cached permission related values of the workspace are
+    computed again using the committed data.
+    """
+
+    cache_key = get_workspace_permissions_version_cache_key(workspace_id)
+    transaction.on_commit(lambda: cache.set(cache_key, str(uuid.uuid4()), timeout=None))
+
+
+def invalidate_all_workspaces_permissions():
+    """
+    Changes the permissions version of the whole instance once the current
+    transaction commits, so that the cached permission related values of all the
+    workspaces are computed again. This must be called when something changes that
+    affects the permissions of every workspace, like the licenses.
+    """
+
+    # Deleting the version is enough because a new random one is created when it's
+    # needed, with the timeout matching the state at that moment.
+    transaction.on_commit(lambda: cache.delete(PERMISSIONS_VERSION_CACHE_KEY))
+
+
+def get_many_from_workspace_permissions_cache(
+    workspace_id: int,
+    cache_name: str,
+    keys: List[str],
+    compute_missing: Callable[[List[str]], Dict[str, Any]],
+    timeout: int,
+) -> Dict[str, Any]:
+    """
+    Returns the values of the provided keys that are cached for the current
+    permissions version of the workspace. The values that are not cached are
+    computed at once using `compute_missing` and then cached.
+
+    :param workspace_id: The workspace the values depend on.
+    :param cache_name: The name of the cached values, used to prefix the keys and to
+        report the hits and misses.
+    :param keys: The keys of the values within the workspace.
+    :param compute_missing: Called with the keys that are not cached and must return
+        a dict containing the values of those keys.
+    :param timeout: The number of seconds the computed values are cached. If 0 then
+        nothing is cached.
+    :return: A dict containing the value of every key.
+    """
+
+    if timeout <= 0:
+        return compute_missing(keys)
+
+    version = (
+        f"{get_permissions_version()}_{get_workspace_permissions_version(workspace_id)}"
+    )
+    cache_keys = {key: f"{cache_name}__{workspace_id}_{version}_{key}" for key in keys}
+    cached = cache.get_many(cache_keys.values())
+
+    values = {}
+    missing_keys = []
+    for key, cache_key in cache_keys.items():
+        if cache_key in cached:
+            values[key] = cached[cache_key]
+        else:
+            missing_keys.append(key)
+
+    attributes = {"cache": cache_name}
+    workspace_permissions_cache_hits.add(len(values), attributes)
+    workspace_permissions_cache_misses.add(len(missing_keys), attributes)
+
+    if missing_keys:
+        computed = compute_missing(missing_keys)
+        cache.set_many(
+            {cache_keys[key]: value for key, value in computed.items()},
+            timeout=timeout,
+        )
+        values.update(computed)
+
+    return values
+
+
+def get_cached_permitted_user_ids(
+    workspace_id: int,
+    operation_name: str,
+    scope_name: str,
+    scope_id: int,
+    compute_user_ids: Callable[[], List[int]],
+) -> List[int]:
+    """
+    Returns the ids of the users of the workspace that are permitted to perform the
+    operation on the scope. They are computed using the provided callable only if
+    they're not cached for the current permissions version of the workspace.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_name: The name of the operation that is checked.
+    :param scope_name: The object scope type name of the scope.
+    :param scope_id: The id of the scope instance.
+    :param compute_user_ids: Computes the permitted user ids if they're not cached.
+    :return: The ids of the permitted users.
+    """
+
+    key = f"{operation_name}_{scope_name}_{scope_id}"
+    return get_many_from_workspace_permissions_cache(
+        workspace_id,
+        "permitted_users",
+        [key],
+        lambda keys: {key: compute_user_ids()},
+        settings.BASEROW_PERMITTED_USERS_CACHE_TIMEOUT,
+    )[key]
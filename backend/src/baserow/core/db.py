@@ -1,5 +1,8 @@
 import contextlib
+import io
+import json
 from collections import defaultdict
+from datetime import date, datetime, time
 from decimal import Decimal
 from functools import cache
 from math import ceil
@@ -13,13 +16,15 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
+from uuid import UUID
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
 from django.db.models import ForeignKey, ManyToManyField, Max, Model, QuerySet
 from django.db.models.functions import Collate
 from django.db.models.sql.query import LOOKUP_SEP
@@ -27,8 +32,9 @@ from django.db.transaction import Atomic, get_connection
 
 from loguru import logger
 from psycopg2 import sql
+from psycopg2.extras import Json
 
-from .utils import find_intermediate_order
+from .utils import find_intermediate_order, grouper
 
 ModelInstance = TypeVar("ModelInstance", bound=object)
 
@@ -341,6 +347,151 @@ def get_highest_order_of_queryset(
     return [last_order + (step * i) for i in range(1, amount + 1)]
 
 
+def get_planner_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows the PostgreSQL planner expects the provided queryset
+    to return, without actually executing it. This is a lot cheaper than a
+    `COUNT(*)` on large tables, but it's only an estimate and can be far off for
+    selective filters or tables that haven't been analyzed recently.
+
+    :param queryset: The queryset to estimate the number of rows for.
+    :return: The estimated number of rows.
+    """
+
+    sql_query, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql_query}", params)  # nosec B608
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_estimated_or_exact_count(
+    queryset: QuerySet, exact_count_threshold: Optional[int] = None
+) -> Tuple[int, bool]:
+    """
+    Returns the planner estimated number of rows of the provided queryset if the
+    estimate is at least `exact_count_threshold`, otherwise the exact count. Counting
+    a few thousand rows is cheap, but an exact count of a queryset spanning millions
+    of rows can take longer than fetching the rows themselves.
+
+    :param queryset: The queryset to count the rows of.
+    :param exact_count_threshold: Below this number of estimated rows, the rows are
+        counted exactly. Defaults to `BASEROW_ESTIMATED_COUNT_THRESHOLD`.
+    :return: A tuple containing the count and whether the count is exact.
+    """
+
+    if exact_count_threshold is None:
+        exact_count_threshold = settings.BASEROW_ESTIMATED_COUNT_THRESHOLD
+
+    # The order doesn't change the number of rows, but it can make the planner
+    # choose a more expensive plan.
+    queryset = queryset.order_by()
+    estimated_count = get_planner_estimated_count(queryset)
+    if estimated_count < exact_count_threshold:
+        return queryset.count(), True
+    return estimated_count, False
+
+
+COPY_BATCH_SIZE = 5000
+_COPY_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _to_copy_text(value: Any) -> str:
+    """
+    Converts a value prepared for the database to the PostgreSQL `COPY` text
+    format.
+
+    :raises TypeError: When the value can't be represented in the text format.
+    """
+
+    if value is None:
+        return "\\N"
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, (int, float, Decimal, UUID)):
+        return str(value)
+    elif isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    elif isinstance(value, str):
+        return value.translate(_COPY_TEXT_ESCAPES)
+    elif isinstance(value, Json):
+        return value.dumps(value.adapted).translate(_COPY_TEXT_ESCAPES)
+    raise TypeError(f"The value {type(value)} is not supported by COPY.")
+
+
+def bulk_copy_insert(
+    model: Type[Model],
+    instances: Iterable[Model],
+    batch_size: int = COPY_BATCH_SIZE,
+    on_batch_inserted: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Inserts the provided unsaved instances using `COPY FROM STDIN`, which avoids the
+    overhead of building and executing large multi row INSERT statements. The
+    instances are consumed per batch, so they can be generated lazily. A batch
+    containing a value that can't be represented in the `COPY` text format is
+    inserted using `bulk_create` instead.
+
+    Just like `bulk_create`, the `save` method isn't called and no signals are
+    sent. The ids of the inserted instances are not set, and if they have been
+    provided, the sequence of the table must be reset afterwards.
+
+    :param model: The model of the instances.
+    :param instances: The instances that must be inserted.
+    :param batch_size: The number of instances sent per `COPY` statement.
+    :param on_batch_inserted: Called with the number of inserted instances after
+        every batch, for example to track the progress.
+    :return: The total number of inserted instances.
+    """
+
+    concrete_fields = model._meta.concrete_fields
+    table_name = model._meta.db_table
+    inserted = 0
+    for batch in grouper(batch_size, instances):
+        # The primary key is only inserted if all the instances have one, otherwise
+        # the database sequence provides it.
+        with_pk = all(instance.pk is not None for instance in batch)
+        fields = [f for f in concrete_fields if with_pk or not f.primary_key]
+
+        try:
+            buffer = io.StringIO()
+            for instance in batch:
+                buffer.write(
+                    "\t".join(
+                        _to_copy_text(
+                            field.get_db_prep_save(
+                                field.pre_save(instance, True), connection
+                            )
+                        )
+                        for field in fields
+                    )
+                )
+                buffer.write("\n")
+        except TypeError:
+            model.objects.bulk_create(batch, batch_size=batch_size)
+        else:
+            buffer.seek(0)
+            copy_sql = sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+                table=sql.Identifier(table_name),
+                columns=sql.SQL(", ").join(
+                    sql.Identifier(field.column) for field in fields
+                ),
+            )
+            with connection.cursor() as cursor:
+                cursor.copy_expert(copy_sql, buffer)
+
+        inserted += len(batch)
+        if on_batch_inserted is not None:
+            on_batch_inserted(len(batch))
+
+    return inserted
+
+
 def recalculate_full_orders(
     model: Optional[Model] = None,
     field="order",
@@ -1478,43 +1478,51 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
         progress.increment(by=start_progress)
 
         duplicate_import_export_config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            stream_rows=True,
+            copy_rows_in_database=True,
         )
-        # export the application
-        specific_application = application.specific
-        application_type = application_type_registry.get_by_model(specific_application)
         try:
-            serialized = application_type.export_serialized(
-                specific_application, duplicate_import_export_config
+            # export the application
+            specific_application = application.specific
+            application_type = application_type_registry.get_by_model(
+                specific_application
             )
-        except OperationalError as e:
-            # Detect if this `OperationalError` is due to us exceeding the
-            # lock count in `max_locks_per_transaction`. If it is, we'll
-            # raise a different exception so that we can catch this scenario.
+            try:
+                serialized = application_type.export_serialized(
+                    specific_application, duplicate_import_export_config
+                )
+            except OperationalError as e:
+                # Detect if this `OperationalError` is due to us exceeding the
+                # lock count in `max_locks_per_transaction`. If it is, we'll
+                # raise a different exception so that we can catch this scenario.
 
-            if is_max_lock_exceeded_exception(e):
-                raise DuplicateApplicationMaxLocksExceededException()
-            raise e
+                if is_max_lock_exceeded_exception(e):
+                    raise DuplicateApplicationMaxLocksExceededException()
+                raise e
 
-        progress.increment(by=export_progress)
+            progress.increment(by=export_progress)
 
-        # Set a new unique name for the new application
-        serialized["name"] = self.find_unused_application_name(
-            workspace.id, serialized["name"]
-        )
-        serialized["order"] = application_type.model_class.get_last_order(workspace)
+            # Set a new unique name for the new application
+            serialized["name"] = self.find_unused_application_name(
+                workspace.id, serialized["name"]
+            )
+            serialized["order"] = application_type.model_class.get_last_order(workspace)
 
-        # import it back as a new application
-        id_mapping: Dict[str, Any] = {}
-        new_application_clone = application_type.import_serialized(
-            workspace,
-            serialized,
-            duplicate_import_export_config,
-            id_mapping,
-            progress_builder=progress.create_child_builder(
-                represents_progress=import_progress
-            ),
-        )
+            # import it back as a new application
+            id_mapping: Dict[str, Any] = {}
+            new_application_clone = application_type.import_serialized(
+                workspace,
+                serialized,
+                duplicate_import_export_config,
+                id_mapping,
+                progress_builder=progress.create_child_builder(
+                    represents_progress=import_progress
+                ),
+            )
+        finally:
+            duplicate_import_export_config.close_streams()
 
         # broadcast the application_created signal
         application_created.send(
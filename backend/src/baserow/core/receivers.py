@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from baserow.core.cache import invalidate_workspace_permissions
+from baserow.core.models import WorkspaceUser
+from baserow.core.signals import permissions_updated
+
+
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+def invalidate_workspace_permissions_when_workspace_user_changed(
+    sender, instance, **kwargs
+):
+    # The model signals are used instead of the workspace user signals because the
+    # workspace users are also created when creating or importing a workspace.
+    invalidate_workspace_permissions(instance.workspace_id)
+
+
+@receiver(permissions_updated)
+def invalidate_workspace_permissions_when_permissions_updated(
+    sender, workspace, **kwargs
+):
+    invalidate_workspace_permissions(workspace.id)
@@ -87,6 +87,39 @@ class ImportExportConfig:
     """
     workspace_for_user_references: "Workspace" = None
 
+    """
+    Whether or not the rows should be exported to a temporary file instead of a list
+    in memory. This should only be enabled when the export is directly imported
+    again in the same process, like when duplicating or snapshotting, because the
+    exported rows can't be serialized to JSON.
+    """
+    stream_rows: bool = False
+
+    """
+    Whether or not the rows can be copied directly in the database with
+    `INSERT INTO ... SELECT` queries instead of being serialized. This should only be
+    enabled when the export is directly imported again in the same database and
+    transaction, like when duplicating or snapshotting, because the rows are then
+    not part of the export but read from the exported tables during the import.
+    """
+    copy_rows_in_database: bool = False
+
+    """
+    The temporary streams, like the streamed rows, created by the export. They must
+    be closed using `close_streams` once the export has been imported to free the
+    memory and disk space they use.
+    """
+    streams: List[Any] = dataclasses.field(default_factory=list)
+
+    def close_streams(self):
+        """
+        Closes all the temporary streams created by the export.
+        """
+
+        for stream in self.streams:
+            stream.close()
+        self.streams = []
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
@@ -149,6 +182,19 @@ class Plugin(APIUrlsInstanceMixin, Instance):
 
         return []
 
+    def get_permissions_version_timeout(self) -> Optional[float]:
+        """
+        Returns the number of seconds after which the permissions of the users can
+        change without anything being changed, for example because a license expires
+        or becomes valid. The cached permission related values are never used for
+        longer than that.
+
+        :return: The number of seconds or None if the permissions never change by
+            themselves.
+        """
+
+        return None
+
     def user_created(
         self,
         user: "AbstractUser",
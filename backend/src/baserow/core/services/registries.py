@@ -1,6 +1,6 @@
 from abc import ABC
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type, TypeVar
 from zipfile import ZipFile
 
 from django.contrib.auth.models import AbstractUser
@@ -8,6 +8,7 @@ from django.core.files.storage import Storage
 
 from rest_framework.exceptions import ValidationError as DRFValidationError
 
+from baserow.core.formula.field import FormulaField
 from baserow.core.integrations.handler import IntegrationHandler
 from baserow.core.registry import (
     CustomFieldsInstanceMixin,
@@ -148,6 +149,20 @@ class ServiceType(
 
         return None
 
+    def formula_generator(self, service: ServiceSubClass) -> Generator[str, None, None]:
+        """
+        Yields all the formulas of the service. It can be used to find out which
+        data the service is going to need when it is dispatched. By default, the
+        values of the `FormulaField` fields of the service are yielded, service
+        types storing formulas elsewhere must yield them too.
+
+        :param service: The service instance we want the formulas of.
+        """
+
+        for field in service._meta.get_fields():
+            if isinstance(field, FormulaField):
+                yield getattr(service, field.name)
+
     def resolve_service_formulas(
         self,
         service: ServiceSubClass,
@@ -384,35 +384,40 @@ class SnapshotHandler:
             include_permission_data=True,
             reduce_disk_space_usage=True,
             workspace_for_user_references=workspace,
+            stream_rows=True,
+            copy_rows_in_database=True,
         )
         try:
-            exported_application = application_type.export_serialized(
-                application, snapshot_import_export_config, None, default_storage
+            try:
+                exported_application = application_type.export_serialized(
+                    application, snapshot_import_export_config, None, default_storage
+                )
+            except OperationalError as e:
+                # Detect if this `OperationalError` is due to us exceeding the
+                # lock count in `max_locks_per_transaction`. If it is, we'll
+                # raise a different exception so that we can catch this scenario.
+                if is_max_lock_exceeded_exception(e):
+                    raise DatabaseSnapshotMaxLocksExceededException()
+                raise e
+
+            progress.increment(by=50)
+            id_mapping = {"import_workspace_id": workspace.id}
+            # Set the `snapshot_from` reverse relation so that after
+            # `ApplicationType.import_serialized` creates the `Application`,
+            # we set the source snapshot so that `get_root()` can be called
+            # on this application.
+            exported_application["snapshot_from"] = snapshot
+            application_type.import_serialized(
+                None,
+                exported_application,
+                snapshot_import_export_config,
+                id_mapping,
+                None,
+                default_storage,
+                progress_builder=progress.create_child_builder(represents_progress=50),
             )
-        except OperationalError as e:
-            # Detect if this `OperationalError` is due to us exceeding the
-            # lock count in `max_locks_per_transaction`. If it is, we'll
-            # raise a different exception so that we can catch this scenario.
-            if is_max_lock_exceeded_exception(e):
-                raise DatabaseSnapshotMaxLocksExceededException()
-            raise e
-
-        progress.increment(by=50)
-        id_mapping = {"import_workspace_id": workspace.id}
-        # Set the `snapshot_from` reverse relation so that after
-        # `ApplicationType.import_serialized` creates the `Application`,
-        # we set the source snapshot so that `get_root()` can be called
-        # on this application.
-        exported_application["snapshot_from"] = snapshot
-        application_type.import_serialized(
-            None,
-            exported_application,
-            snapshot_import_export_config,
-            id_mapping,
-            None,
-            default_storage,
-            progress_builder=progress.create_child_builder(represents_progress=50),
-        )
+        finally:
+            snapshot_import_export_config.close_streams()
 
     def perform_restore(self, snapshot: Snapshot, progress: Progress) -> Application:
         """
@@ -442,22 +447,31 @@ class SnapshotHandler:
         application_type = application_type_registry.get_by_model(application)
 
         restore_snapshot_import_export_config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
-        )
-        exported_application = application_type.export_serialized(
-            application, restore_snapshot_import_export_config, None, default_storage
-        )
-        progress.increment(by=50)
-
-        imported_application = application_type.import_serialized(
-            snapshot.snapshot_from_application.workspace,
-            exported_application,
-            restore_snapshot_import_export_config,
-            {},
-            None,
-            default_storage,
-            progress_builder=progress.create_child_builder(represents_progress=50),
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            stream_rows=True,
+            copy_rows_in_database=True,
         )
+        try:
+            exported_application = application_type.export_serialized(
+                application,
+                restore_snapshot_import_export_config,
+                None,
+                default_storage,
+            )
+            progress.increment(by=50)
+
+            imported_application = application_type.import_serialized(
+                snapshot.snapshot_from_application.workspace,
+                exported_application,
+                restore_snapshot_import_export_config,
+                {},
+                None,
+                default_storage,
+                progress_builder=progress.create_child_builder(represents_progress=50),
+            )
+        finally:
+            restore_snapshot_import_export_config.close_streams()
         imported_application.name = CoreHandler().find_unused_application_name(
             snapshot.snapshot_from_application.workspace, snapshot.name
         )
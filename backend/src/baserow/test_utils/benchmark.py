@@ -0,0 +1,252 @@
+"""
+Helpers to benchmark the hot code paths in the performance tests. Every benchmark
+records the wall time, the number of SQL queries and the peak memory usage of the
+benchmarked block. The results are printed and, if the `BASEROW_BENCHMARK_OUTPUT`
+environment variable contains a file path, appended to that file as JSON lines
+together with the current git commit. Two of those files can be compared with:
+
+    python -m baserow.test_utils.benchmark before.jsonl after.jsonl
+"""
+
+import json
+import os
+import subprocess  # nosec
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Generator, List, Optional
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BENCHMARK_OUTPUT_ENV_VAR = "BASEROW_BENCHMARK_OUTPUT"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    wall_time: float = 0.0
+    query_count: int = 0
+    peak_memory: int = 0
+    commit: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]"
+
+
+def get_current_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(  # nosec
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextmanager
+def benchmark(name: str, **params) -> Generator[BenchmarkResult, None, None]:
+    """
+    Measures the wall time, number of queries and peak memory usage of the code
+    executed in the context. Note that tracing the memory allocations slows down
+    the code, so the wall times should only be compared with other benchmark runs.
+
+    :param name: The name of the benchmark, used to compare results across runs.
+    :param params: The parameters the benchmark ran with, like the number of rows.
+        Only results with the same name and parameters are compared.
+    :return: The result, which is filled in when the context exits.
+    """
+
+    result = BenchmarkResult(name=name, params=params, commit=get_current_commit())
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0]
+
+    try:
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            yield result
+            result.wall_time = time.perf_counter() - start
+        result.query_count = len(captured.captured_queries)
+        result.peak_memory = tracemalloc.get_traced_memory()[1] - memory_before
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    record_benchmark_result(result)
+
+
+@dataclass
+class BenchmarkTable:
+    table: Any
+    model: Any
+    fields: List[Any]
+    value_field: Any
+    link_field: Optional[Any] = None
+
+
+def create_benchmark_tables(
+    data_fixture, user, width: int, row_count: int, link_depth: int
+) -> List[BenchmarkTable]:
+    """
+    Creates a chain of `link_depth + 1` tables containing `row_count` rows each.
+    Every table has a primary text field and `width` text, number and boolean
+    fields. Every table links to the next one in the chain and has a `value`
+    field. The `value` of the last table is a number and the `value` of every
+    other table is the sum of the linked values, so changing a value in the last
+    table updates all the tables. The values are deterministic, so that the
+    results of different runs can be compared.
+
+    :return: The tables, starting with the first one in the chain.
+    """
+
+    from baserow.contrib.database.fields.handler import FieldHandler
+
+    database = data_fixture.create_database_application(user=user)
+    field_types = ["text", "number", "boolean"]
+    benchmark_tables = []
+    for level in range(link_depth, -1, -1):
+        table = data_fixture.create_database_table(
+            user=user, database=database, name=f"Level {level}"
+        )
+        fields = [
+            data_fixture.create_text_field(table=table, name="Name", primary=True)
+        ]
+        for i in range(width):
+            fields.append(
+                FieldHandler().create_field(
+                    user, table, field_types[i % 3], name=f"Field {i}"
+                )
+            )
+
+        link_field = None
+        if benchmark_tables:
+            next_table = benchmark_tables[0]
+            link_field = FieldHandler().create_field(
+                user,
+                table,
+                "link_row",
+                name="Link",
+                link_row_table=next_table.table,
+                has_related_field=False,
+            )
+            value_field = FieldHandler().create_field(
+                user,
+                table,
+                "formula",
+                name="Value",
+                formula="sum(lookup('Link', 'Value'))",
+            )
+        else:
+            value_field = FieldHandler().create_field(
+                user, table, "number", name="Value"
+            )
+
+        model = table.get_model()
+        rows = []
+        for index in range(row_count):
+            values = {fields[0].db_column: f"Row {index}"}
+            for i, row_field in enumerate(fields[1:]):
+                values[row_field.db_column] = [
+                    f"{index}-{i}",
+                    index + i,
+                    index % 2 == 0,
+                ][i % 3]
+            if link_field is None:
+                values[value_field.db_column] = index
+            rows.append(model(order=index + 1, **values))
+        rows = model.objects.bulk_create(rows)
+
+        if link_field is not None:
+            m2m_field = model._meta.get_field(link_field.db_column)
+            through_model = m2m_field.remote_field.through
+            next_row_ids = list(
+                next_table.model.objects.order_by("id").values_list("id", flat=True)
+            )
+            through_model.objects.bulk_create(
+                [
+                    through_model(
+                        **{
+                            f"{m2m_field.m2m_column_name()}": row.id,
+                            f"{m2m_field.m2m_reverse_name()}": next_row_ids[
+                                index % len(next_row_ids)
+                            ],
+                        }
+                    )
+                    for index, row in enumerate(rows)
+                ]
+            )
+
+        benchmark_tables.insert(
+            0, BenchmarkTable(table, model, fields, value_field, link_field)
+        )
+    return benchmark_tables
+
+
+def record_benchmark_result(result: BenchmarkResult):
+    print(
+        f"{result.key}: {result.wall_time:.3f}s, {result.query_count} queries, "
+        f"{result.peak_memory / 1024 / 1024:.1f}MiB peak memory"
+    )
+
+    output = os.getenv(BENCHMARK_OUTPUT_ENV_VAR)
+    if output:
+        with open(output, "a") as f:
+            f.write(json.dumps(asdict(result)) + "\n")
+
+
+def load_benchmark_results(path: str) -> Dict[str, BenchmarkResult]:
+    """
+    Loads the results written to the provided file. If a benchmark ran multiple
+    times, then the last result is used.
+    """
+
+    results = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                result = BenchmarkResult(**json.loads(line))
+                results[result.key] = result
+    return results
+
+
+def compare_benchmark_results(
+    baseline: Dict[str, BenchmarkResult], current: Dict[str, BenchmarkResult]
+) -> List[str]:
+    """
+    Returns a line per benchmark that ran in both runs, containing the relative
+    change of the wall time and peak memory and the change in the number of
+    queries.
+    """
+
+    def relative(before, after):
+        return f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+
+    lines = []
+    for key in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[key], current[key]
+        lines.append(
+            f"{key}: wall time {relative(before.wall_time, after.wall_time)}, "
+            f"queries {before.query_count} -> {after.query_count}, "
+            f"peak memory {relative(before.peak_memory, after.peak_memory)}"
+        )
+    return lines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(f"Usage: python -m {__spec__.name} BEFORE AFTER")
+        sys.exit(1)
+
+    for line in compare_benchmark_results(
+        load_benchmark_results(sys.argv[1]), load_benchmark_results(sys.argv[2])
+    ):
+        print(line)
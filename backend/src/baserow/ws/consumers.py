@@ -1,11 +1,18 @@
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from operator import attrgetter
 from typing import TYPE_CHECKING, Optional
 
+from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
-from baserow.ws.registries import PageType, page_registry
+from baserow.ws.registries import (
+    ADDITIONAL_GROUP_SUBSCRIBERS_CACHE_TIMEOUT,
+    PageType,
+    mark_additional_groups_subscribed,
+    page_registry,
+)
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -37,6 +44,7 @@ class PageScope:
 
     page_type: str
     page_parameters: dict[str, any]
+    additional_group_names: list[str] = field(default_factory=list, compare=False)
 
 
 class SubscribedPages:
@@ -57,6 +65,18 @@ class SubscribedPages:
         if page_scope not in self.pages:
             self.pages.append(page_scope)
 
+    def get(self, page_scope: PageScope) -> Optional[PageScope]:
+        """
+        Returns the subscribed page equal to the provided one, if any.
+
+        :param page_scope: Page to look for.
+        """
+
+        for page in self.pages:
+            if page == page_scope:
+                return page
+        return None
+
     def remove(self, page_scope: PageScope):
         """
         Removes a page from the list of subscribed pages.
@@ -115,6 +135,33 @@ class SubscribedPages:
             for page in self.pages
         )
 
+    def get_additional_group_names(self) -> list[str]:
+        """
+        Returns the names of the additional channel groups of all the subscribed
+        pages.
+        """
+
+        return [
+            group_name
+            for page in self.pages
+            for group_name in page.additional_group_names
+        ]
+
+    def is_in_additional_group(self, group_names: list[str]) -> bool:
+        """
+        Checks whether any of the subscribed pages added the connection to one of
+        the provided additional channel groups.
+
+        :param group_names: The additional channel group names to check.
+        :return: True if the connection is a member of one of the groups.
+        """
+
+        return any(
+            group_name in page.additional_group_names
+            for page in self.pages
+            for group_name in group_names
+        )
+
     def copy(self):
         new = SubscribedPages()
         new.pages = self.pages.copy()
@@ -128,6 +175,8 @@ class SubscribedPages:
 
 
 class CoreConsumer(AsyncJsonWebsocketConsumer):
+    additional_groups_marked_at: Optional[float] = None
+
     async def connect(self):
         await self.accept()
 
@@ -189,11 +238,19 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         parameters = {
             parameter: content.get(parameter) for parameter in page_type.parameters
         }
+        optional_parameters = {
+            parameter: content[parameter]
+            for parameter in page_type.optional_parameters
+            if parameter in content
+        }
 
         return PageContext(
             page_scope=PageScope(
                 page_type=content[page_name_attr],
                 page_parameters=parameters,
+                additional_group_names=page_type.get_additional_group_names(
+                    **parameters, **optional_parameters
+                ),
             ),
             resolved_page_type=page_type,
             user=user,
@@ -216,9 +273,10 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         if not context:
             return
 
-        user, web_socket_id, page_type, parameters = attrgetter(
-            "user", "web_socket_id", "resolved_page_type", "page_scope.page_parameters"
+        user, web_socket_id, page_type, page_scope = attrgetter(
+            "user", "web_socket_id", "resolved_page_type", "page_scope"
         )(context)
+        parameters = page_scope.page_parameters
 
         can_add = await database_sync_to_async(page_type.can_add)(
             user, web_socket_id, **parameters
@@ -236,8 +294,24 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         if permission_group_name:
             await self.channel_layer.group_add(permission_group_name, self.channel_name)
 
-        page_scope = PageScope(page_type=page_type.type, page_parameters=parameters)
+        # The page can be subscribed to again with different optional parameters, in
+        # which case the connection must leave the additional groups it no longer
+        # needs.
+        existing_page_scope = self.scope["pages"].get(page_scope)
+        if existing_page_scope:
+            for additional_group_name in existing_page_scope.additional_group_names:
+                if additional_group_name not in page_scope.additional_group_names:
+                    await self.channel_layer.group_discard(
+                        additional_group_name, self.channel_name
+                    )
+            self.scope["pages"].remove(existing_page_scope)
+
+        for additional_group_name in page_scope.additional_group_names:
+            await self.channel_layer.group_add(additional_group_name, self.channel_name)
+
         self.scope["pages"].add(page_scope)
+        if page_scope.additional_group_names:
+            await self._mark_additional_groups_subscribed(force=True)
 
         await self.send_json(
             {"type": "page_add", "page": page_type.type, "parameters": parameters}
@@ -269,6 +343,15 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
 
         page_scope = PageScope(page_type=page_type.type, page_parameters=parameters)
 
+        # The additional groups depend on the optional parameters the page was
+        # subscribed with, so they must be taken from the subscribed page.
+        subscribed_page_scope = self.scope["pages"].get(page_scope)
+        if subscribed_page_scope:
+            for additional_group_name in subscribed_page_scope.additional_group_names:
+                await self.channel_layer.group_discard(
+                    additional_group_name, self.channel_name
+                )
+
         self.scope["pages"].remove(page_scope)
 
         permission_group_name = page_type.get_permission_channel_group_name(
@@ -415,11 +498,24 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         payload = event["payload"]
         ignore_web_socket_id = event["ignore_web_socket_id"]
         exclude_user_ids = set(event.get("exclude_user_ids", None) or [])
+        exclude_group_names = event.get("exclude_group_names", None) or []
         user_id = self.scope["user"].id
 
         if user_id in exclude_user_ids:
             return
 
+        await self._mark_additional_groups_subscribed()
+
+        # The members of these groups receive an alternative payload via the group
+        # itself.
+        pages = self.scope.get("pages")
+        if (
+            exclude_group_names
+            and pages
+            and pages.is_in_additional_group(exclude_group_names)
+        ):
+            return
+
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
             await self.send_json(payload)
 
@@ -440,3 +536,31 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             await self._remove_page_scopes_associated_with_perm_group(
                 event["permission_group_name"]
             )
+
+    async def _mark_additional_groups_subscribed(self, force: bool = False):
+        """
+        Marks the additional groups of the subscribed pages as having members, so
+        that the alternative payloads for them are generated. Because the marks
+        expire, they're refreshed while the connection receives events. Until then,
+        the connection receives the regular payloads.
+
+        :param force: Whether the groups must be marked even if they have been marked
+            recently.
+        """
+
+        pages = self.scope.get("pages")
+        group_names = pages.get_additional_group_names() if pages else []
+        if not group_names:
+            return
+
+        now = time.monotonic()
+        if (
+            not force
+            and self.additional_groups_marked_at is not None
+            and now - self.additional_groups_marked_at
+            < ADDITIONAL_GROUP_SUBSCRIBERS_CACHE_TIMEOUT / 2
+        ):
+            return
+
+        self.additional_groups_marked_at = now
+        await sync_to_async(mark_additional_groups_subscribed)(group_names)
@@ -1,8 +1,47 @@
-from typing import Optional
+from typing import Dict, List, Optional
+
+from django.core.cache import cache
 
 from baserow.core.registry import Instance, Registry
 from baserow.ws.tasks import broadcast_to_channel_group
 
+ADDITIONAL_GROUP_SUBSCRIBERS_CACHE_TIMEOUT = 60 * 60
+
+
+def get_additional_group_subscribers_cache_key(group_name: str) -> str:
+    return f"ws_additional_group_subscribers_{group_name}"
+
+
+def mark_additional_groups_subscribed(group_names: List[str]):
+    """
+    Remembers that connections have been added to the provided additional groups, so
+    that the alternative payloads for those groups are only generated if someone can
+    receive them. The marks expire, the connections are expected to mark their groups
+    again while they're subscribed.
+
+    :param group_names: The names of the additional groups that have members.
+    """
+
+    cache.set_many(
+        {
+            get_additional_group_subscribers_cache_key(group_name): True
+            for group_name in group_names
+        },
+        timeout=ADDITIONAL_GROUP_SUBSCRIBERS_CACHE_TIMEOUT,
+    )
+
+
+def has_additional_group_subscribers(group_name: str) -> bool:
+    """
+    Cheaply checks whether connections have recently been added to the provided
+    additional group. If not, the members of the group receive the regular payload.
+
+    :param group_name: The name of the additional group to check.
+    :return: True if the alternative payload for the group must be generated.
+    """
+
+    return cache.get(get_additional_group_subscribers_cache_key(group_name), False)
+
 
 class PageType(Instance):
     """
@@ -26,6 +65,14 @@ class PageType(Instance):
     dynamic groups.
     """
 
+    optional_parameters = []
+    """
+    A list of parameter name strings which the client can optionally provide when
+    subscribing to the page. They are only passed into the
+    `get_additional_group_names` method and don't change the page group, so they can
+    be used to let the client opt in to an alternative format of certain events.
+    """
+
     def can_add(self, user, web_socket_id, **kwargs):
         """
         Indicates whether the user can be added to the page group. Here can for
@@ -78,8 +125,27 @@ class PageType(Instance):
 
         return None
 
+    def get_additional_group_names(self, **kwargs) -> List[str]:
+        """
+        The generated names will be used by the core consumer to add the connected
+        client to additional channel groups next to the page group. This can for
+        example be used to send a different payload to the clients that have opted
+        in to it via one of the `optional_parameters`.
+
+        :param kwargs: The additional parameters, including the provided optional
+            parameters, and their values.
+        :return: The names of the additional groups the client must be added to.
+        """
+
+        return []
+
     def broadcast(
-        self, payload, ignore_web_socket_id=None, exclude_user_ids=None, **kwargs
+        self,
+        payload,
+        ignore_web_socket_id=None,
+        exclude_user_ids=None,
+        alternative_payloads: Optional[Dict[str, dict]] = None,
+        **kwargs,
     ):
         """
         Broadcasts a payload to everyone within the group.
@@ -93,15 +159,24 @@ class PageType(Instance):
         :param exclude_user_ids: A list of User ids which should be excluded from
             receiving the message.
         :type exclude_user_ids: Optional[list]
+        :param alternative_payloads: An optional mapping from one of the additional
+            group names to the payload that must be sent to the members of that group
+            instead of the `payload`. It should only contain the groups for which
+            `has_additional_group_subscribers` is true.
         :param kwargs: The additional parameters including their provided values.
         :type kwargs: dict
         """
 
+        extra_kwargs = {}
+        if alternative_payloads:
+            extra_kwargs["alternative_payloads"] = alternative_payloads
+
         broadcast_to_channel_group.delay(
             self.get_group_name(**kwargs),
             payload,
             ignore_web_socket_id,
             exclude_user_ids,
+            **extra_kwargs,
         )
 
 
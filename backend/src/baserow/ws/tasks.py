@@ -92,30 +92,18 @@ def broadcast_to_users(
     )
 
 
-@app.task(bind=True)
-def broadcast_to_permitted_users(
-    self,
-    workspace_id: int,
-    operation_type: str,
-    scope_name: str,
-    scope_id: int,
-    payload: Dict[str, any],
-    ignore_web_socket_id: Optional[int] = None,
-):
+def get_permitted_user_ids(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> List[int]:
     """
-    This task will broadcast a websocket message to all the users that are permitted
-    to perform the operation provided.
+    Returns the ids of the users in the workspace that are permitted to perform the
+    operation provided on the scope.
 
-    :param self:
     :param workspace_id: The workspace the users are in
     :param operation_type: The operation that should be checked for
     :param scope_name: The name of the scope that the operation is executed on
     :param scope_id: The id of the scope instance
-    :param payload: The message being sent
-    :param ignore_web_socket_id: An optional web socket id which will not be sent the
-        payload if provided. This is normally the web socket id that has originally
-        made the change request.
-    :return:
+    :return: The ids of the permitted users.
     """
 
     from baserow.core.handler import CoreHandler
@@ -143,7 +131,7 @@ def broadcast_to_permitted_users(
 
     scope = objects.get(id=scope_id)
 
-    user_ids = [
+    return [
         u.id
         for u in CoreHandler().check_permission_for_multiple_actors(
             users_in_workspace,
@@ -153,6 +141,47 @@ def broadcast_to_permitted_users(
         )
     ]
 
+
+@app.task(bind=True)
+def broadcast_to_permitted_users(
+    self,
+    workspace_id: int,
+    operation_type: str,
+    scope_name: str,
+    scope_id: int,
+    payload: Dict[str, any],
+    ignore_web_socket_id: Optional[int] = None,
+):
+    """
+    This task will broadcast a websocket message to all the users that are permitted
+    to perform the operation provided.
+
+    :param self:
+    :param workspace_id: The workspace the users are in
+    :param operation_type: The operation that should be checked for
+    :param scope_name: The name of the scope that the operation is executed on
+    :param scope_id: The id of the scope instance
+    :param payload: The message being sent
+    :param ignore_web_socket_id: An optional web socket id which will not be sent the
+        payload if provided. This is normally the web socket id that has originally
+        made the change request.
+    :return:
+    """
+
+    from baserow.core.cache import get_cached_permitted_user_ids
+
+    # Checking the permissions of every member of big workspaces is slow, so the
+    # permitted users are cached until the permissions of the workspace change.
+    user_ids = get_cached_permitted_user_ids(
+        workspace_id,
+        operation_type,
+        scope_name,
+        scope_id,
+        lambda: get_permitted_user_ids(
+            workspace_id, operation_type, scope_name, scope_id
+        ),
+    )
+
     broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
 
@@ -193,6 +222,7 @@ def broadcast_to_channel_group(
     payload,
     ignore_web_socket_id=None,
     exclude_user_ids=None,
+    alternative_payloads=None,
 ):
     """
     Broadcasts a JSON payload all the users within the channel workspace having the
@@ -210,12 +240,31 @@ def broadcast_to_channel_group(
     :param exclude_user_ids: A list of User ids which should be excluded from
         receiving the message.
     :type exclude_user_ids: Optional[list]
+    :param alternative_payloads: An optional mapping from channel group name to the
+        payload that must be sent to the members of that group instead of the
+        `payload`. The members of those groups don't receive the `payload`, so they
+        must also be a member of the `workspace` group.
+    :type alternative_payloads: Optional[dict]
     """
 
     from asgiref.sync import async_to_sync
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
+    alternative_payloads = alternative_payloads or {}
+
+    for group_name, alternative_payload in alternative_payloads.items():
+        async_to_sync(send_message_to_channel_group)(
+            channel_layer,
+            group_name,
+            {
+                "type": "broadcast_to_group",
+                "payload": alternative_payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+                "exclude_user_ids": exclude_user_ids,
+            },
+        )
+
     async_to_sync(send_message_to_channel_group)(
         channel_layer,
         workspace,
@@ -224,6 +273,7 @@ def broadcast_to_channel_group(
             "payload": payload,
             "ignore_web_socket_id": ignore_web_socket_id,
             "exclude_user_ids": exclude_user_ids,
+            "exclude_group_names": list(alternative_payloads.keys()),
         },
     )
 
@@ -1,11 +1,18 @@
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+from django.contrib.auth.models import AnonymousUser
+from django.test.utils import override_settings
+
 import pytest
 
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
@@ -243,6 +250,165 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db
+def test_get_data_source_dependencies(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    page = data_fixture.create_builder_page(user=user)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, table=table, row_id="1"
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, table=table, row_id=f"get('data_source.{data_source.id}.id')"
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page, table=table
+    )
+    data_fixture.create_local_baserow_table_service_filter(
+        service=data_source3.service,
+        field=field,
+        value=f"concat(get('data_source.{data_source2.id}.{field.db_column}'), "
+        f"get('data_source.{data_source3.id}.id'))",
+        value_is_formula=True,
+        order=0,
+    )
+    data_fixture.create_local_baserow_table_service_filter(
+        service=data_source3.service,
+        field=field,
+        value=f"get('data_source.{data_source.id}.id')",
+        value_is_formula=False,
+        order=1,
+    )
+
+    dependencies = DataSourceHandler().get_data_source_dependencies(
+        DataSourceHandler().get_data_sources(page)
+    )
+
+    assert dependencies == {
+        data_source.id: set(),
+        data_source2.id: {data_source.id},
+        data_source3.id: {data_source2.id},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS=4)
+def test_dispatch_data_sources_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[
+            ("Name", "text"),
+            ("My Color", "text"),
+        ],
+        rows=[
+            ["BMW", "Blue"],
+            ["Audi", "Orange"],
+            ["Volkswagen", "White"],
+        ],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[1].id)
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id="b"
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id=str(rows[2].id)
+    )
+
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+    data_sources = DataSourceHandler().get_data_sources(page)
+
+    result = DataSourceHandler().dispatch_data_sources(data_sources, dispatch_context)
+
+    assert list(result.keys()) == [
+        data_source.id,
+        data_source2.id,
+        data_source3.id,
+        data_source4.id,
+    ]
+    assert result[data_source.id][fields[0].db_column] == "Audi"
+    assert result[data_source2.id][fields[0].db_column] == "Audi"
+    assert isinstance(result[data_source3.id], Exception)
+    assert result[data_source4.id][fields[0].db_column] == "Volkswagen"
+    # The worker threads share the cache of the dispatch context.
+    assert dispatch_context.cache["data_source_contents"][data_source4.id] == (
+        result[data_source4.id]
+    )
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_BUILDER_PUBLIC_DATA_SOURCES_CACHE_TIMEOUT=60)
+def test_dispatch_public_data_source_is_cached_until_the_table_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(workspace=None)
+    integration = data_fixture.create_local_baserow_integration(
+        application=builder, authorized_user=user
+    )
+    page = data_fixture.create_builder_page(builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page, integration=integration, table=table
+    )
+    data_fixture.create_local_baserow_table_service_filter(
+        service=data_source.service,
+        field=fields[0],
+        value="'BMW'",
+        value_is_formula=True,
+        order=0,
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        page=page, integration=integration, table=table
+    )
+
+    def dispatch(data_source):
+        request = MagicMock()
+        request.user_source_user = AnonymousUser()
+        dispatch_context = BuilderDispatchContext(request, page, offset=0, count=20)
+        result = DataSourceHandler().dispatch_data_source(
+            DataSourceHandler().get_data_source_with_cache(page, data_source.id),
+            dispatch_context,
+        )
+        return [row[fields[0].db_column] for row in result["results"]]
+
+    assert dispatch(data_source) == ["BMW"]
+    assert dispatch(data_source2) == ["BMW", "Audi"]
+
+    # Changing the rows without sending the signals doesn't change the cached results.
+    table.get_model().objects.filter(id=rows[1].id).update(
+        **{fields[0].db_column: "BMW"}
+    )
+    assert dispatch(data_source) == ["BMW"]
+    assert dispatch(data_source2) == ["BMW", "Audi"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(
+            user, table, rows[0].id, {fields[0].db_column: "Volkswagen"}
+        )
+
+    assert dispatch(data_source) == ["BMW"]
+    assert dispatch(data_source2) == ["Volkswagen", "BMW"]
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
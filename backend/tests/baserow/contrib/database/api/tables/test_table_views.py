@@ -1,4 +1,3 @@
-import json
 from unittest.mock import patch
 
 from django.db import connection
@@ -16,6 +15,7 @@ from rest_framework.status import (
 
 from baserow.contrib.database.file_import.models import FileImportJob
 from baserow.contrib.database.table.models import Table
+from baserow.core.jobs.registries import job_type_registry
 from baserow.test_utils.helpers import (
     assert_serialized_rows_contain_same_values,
     independent_test_db_connection,
@@ -192,9 +192,11 @@ def test_create_table_with_data(
     assert job.database == database
 
     with patch_filefield_storage():
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
-            assert data == [
+        with job_type_registry.get("file_import").open_data_file(job) as (
+            _,
+            rows,
+        ):
+            assert list(rows) == [
                 ["A", "B", "C", "D"],
                 ["1-1", "1-2", "1-3", "1-4", "1-5"],
                 ["2-1", "2-2", "2-3"],
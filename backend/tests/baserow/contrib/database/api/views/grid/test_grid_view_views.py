@@ -4,6 +4,7 @@ from typing import Any, Dict, List
 
 from django.core.cache import cache
 from django.shortcuts import reverse
+from django.test.utils import override_settings
 
 import pytest
 from pytest_unordered import unordered
@@ -4237,6 +4238,52 @@ def test_grid_view_link_row_lookup_view(api_client, data_fixture):
     assert response_json["results"][0]["value"] == "Test 2"
 
 
+@pytest.mark.django_db
+def test_list_rows_estimate_count(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.bulk_create([model() for _ in range(3)])
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 3
+    assert "count_is_exact" not in response.json()
+
+    # Few rows are expected, so they're still counted exactly.
+    response = api_client.get(
+        f"{url}?estimate_count", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 3
+    assert response.json()["count_is_exact"] is True
+
+    response = api_client.get(
+        f"{url}?count&estimate_count", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.json() == {"count": 3, "count_is_exact": True}
+
+    with override_settings(BASEROW_ESTIMATED_COUNT_THRESHOLD=0):
+        response = api_client.get(
+            f"{url}?estimate_count&size=2&page=2", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert response_json["count_is_exact"] is False
+        assert len(response_json["results"]) == 1
+
+        response = api_client.get(
+            f"{url}?estimate_count&limit=2&offset=2",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert response_json["count_is_exact"] is False
+        assert len(response_json["results"]) == 1
+
+
 @pytest.mark.django_db
 def test_list_rows_include_fields(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
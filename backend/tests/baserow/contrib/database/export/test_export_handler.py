@@ -2,9 +2,10 @@ from datetime import timezone
 from io import BytesIO
 from typing import List
 from unittest.mock import patch
+from zipfile import ZipFile
 
 from django.db import connection
-from django.test.utils import CaptureQueriesContext
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils import timezone as django_timezone
 from django.utils.dateparse import parse_date, parse_datetime
 
@@ -21,6 +22,7 @@ from baserow.contrib.database.export.exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import ShardExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -703,6 +705,194 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.StreamingExportJobFileWriter."
+    "CHUNK_SIZE",
+    2,
+)
+def test_export_streams_rows_in_chunks_without_offset_or_count(
+    storage_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["b", "e", "a", "d", "c"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+
+    with CaptureQueriesContext(connection) as captured:
+        _, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n1,b\r\n2,e\r\n3,a\r\n4,d\r\n5,c\r\n"
+    assert contents == expected
+    row_queries = [
+        q["sql"] for q in captured.captured_queries if model._meta.db_table in q["sql"]
+    ]
+    assert not any("OFFSET" in sql for sql in row_queries)
+    assert not any("COUNT(" in sql for sql in row_queries)
+
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+    with CaptureQueriesContext(connection) as captured:
+        _, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    expected = bom + "id,text_field\r\n2,e\r\n4,d\r\n5,c\r\n1,b\r\n3,a\r\n"
+    assert contents == expected
+    row_queries = [
+        q["sql"] for q in captured.captured_queries if model._meta.db_table in q["sql"]
+    ]
+    assert not any("OFFSET" in sql for sql in row_queries)
+    assert not any("COUNT(" in sql for sql in row_queries)
+
+
+def _mock_storage_with_files(storage_mock):
+    files = {}
+
+    def open_file(name, mode="rb"):
+        if "w" in mode:
+            files[name] = BytesIO()
+            files[name].close = lambda: None
+            return files[name]
+        return BytesIO(files[name].getvalue())
+
+    storage_mock.open.side_effect = open_file
+    storage_mock.delete.side_effect = lambda name: files.pop(name, None)
+    return files
+
+
+@pytest.mark.django_db
+@override_settings(EXPORT_SHARD_COUNT=2, EXPORT_SHARD_MIN_ROWS=4)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_big_export_is_split_into_shards_which_are_zipped(storage_mock, data_fixture):
+    files = _mock_storage_with_files(storage_mock)
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+    model = table.get_model()
+    for value in ["b", "e", "a", "d", "c"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, grid_view, {"exporter_type": "csv", "export_charset": "utf-8"}
+    )
+    handler.run_export_job(job)
+    job.refresh_from_db()
+
+    assert job.state == EXPORT_JOB_FINISHED_STATUS
+    assert job.progress_percentage == 100.0
+    assert job.exported_file_name.endswith(".csv.zip")
+    # The part files have been deleted after zipping them.
+    assert list(files.keys()) == [
+        ExportHandler.export_file_path(job.exported_file_name)
+    ]
+
+    with ZipFile(files[ExportHandler.export_file_path(job.exported_file_name)]) as zip:
+        assert zip.namelist() == ["part-1.csv", "part-2.csv"]
+        bom = "\ufeff"
+        assert zip.read("part-1.csv").decode("utf-8") == (
+            bom + "id,text_field\r\n2,e\r\n1,b\r\n3,a\r\n"
+        )
+        assert zip.read("part-2.csv").decode("utf-8") == (
+            bom + "id,text_field\r\n4,d\r\n5,c\r\n"
+        )
+
+
+@pytest.mark.django_db
+@override_settings(EXPORT_SHARD_COUNT=2, EXPORT_SHARD_MIN_ROWS=10)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_small_export_is_not_split_into_shards(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for _ in range(5):
+        model.objects.create()
+
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+
+    assert job.exported_file_name.endswith(".csv")
+    assert contents == "\ufeffid\r\n1\r\n2\r\n3\r\n4\r\n5\r\n"
+
+
+@pytest.mark.django_db
+@override_settings(EXPORT_SHARD_COUNT=2, EXPORT_SHARD_MIN_ROWS=1)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_failing_export_shard_fails_the_job_and_cleans_up_the_parts(
+    storage_mock, data_fixture
+):
+    files = _mock_storage_with_files(storage_mock)
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    for _ in range(4):
+        model.objects.create()
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "csv", "export_charset": "utf-8"}
+    )
+    original_write_rows = ShardExportJobFileWriter.write_rows
+
+    def write_rows(self, queryset, write_row):
+        if self.shard_index == 1:
+            raise ValueError("Failed")
+        return original_write_rows(self, queryset, write_row)
+
+    with patch.object(ShardExportJobFileWriter, "write_rows", write_rows):
+        with pytest.raises(ValueError):
+            handler.run_export_job(job)
+
+    job.refresh_from_db()
+    assert job.state == EXPORT_JOB_FAILED_STATUS
+    assert job.error == "Failed"
+    assert files == {}
+
+
+@pytest.mark.django_db
+@override_settings(EXPORT_SHARD_COUNT=2, EXPORT_SHARD_MIN_ROWS=1)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_shard_fails_the_job_if_the_remaining_shards_are_not_tracked(
+    storage_mock, data_fixture
+):
+    files = _mock_storage_with_files(storage_mock)
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    for _ in range(4):
+        model.objects.create()
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "csv", "export_charset": "utf-8"}
+    )
+    with patch("baserow.contrib.database.export.tasks.run_export_job_shard.delay"):
+        handler.run_export_job(job)
+
+    job.refresh_from_db()
+    assert job.state == EXPORT_JOB_EXPORTING_STATUS
+    assert job.remaining_shards == 2
+
+    job.remaining_shards = None
+    job.save()
+    handler.run_export_job_shard(job, 0, 2, 1, 2)
+
+    job.refresh_from_db()
+    assert job.state == EXPORT_JOB_FAILED_STATUS
+    assert files == {}
+
+
 @pytest.mark.django_db
 def test_creating_job_with_view_that_is_not_in_the_table(
     data_fixture,
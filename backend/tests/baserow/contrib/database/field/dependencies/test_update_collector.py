@@ -402,3 +402,66 @@ def test_update_statements_only_update_rows_where_values_change(data_fixture):
     # Only row_4 and row_5 should be updated, the others already have the value "a"
     assert execute_update_statement(func_update_statement) == 2
     assert_all_rows_have_value("a")
+
+
+@pytest.mark.django_db
+def test_affected_rows_of_deep_paths_are_computed_once_and_reused(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    tables, primary_fields = [], []
+    for i in range(4):
+        table = data_fixture.create_database_table(database=database)
+        tables.append(table)
+        primary_fields.append(
+            data_fixture.create_text_field(name="primary", primary=True, table=table)
+        )
+
+    # Every table links to the previous one: table 1 -> 0, 2 -> 1 and 3 -> 2.
+    link_fields = [
+        FieldHandler().create_field(
+            user=user,
+            table=tables[i],
+            type_name="link_row",
+            link_row_table=tables[i - 1],
+            name="link",
+        )
+        for i in range(1, 4)
+    ]
+    models = [table.get_model(attribute_names=True) for table in tables]
+
+    rows_a, rows_b = [], []
+    for i, model in enumerate(models):
+        row_a = model.objects.create(primary="a")
+        row_b = model.objects.create(primary="b")
+        if i > 0:
+            row_a.link.add(rows_a[-1].id)
+            row_b.link.add(rows_b[-1].id)
+        rows_a.append(row_a)
+        rows_b.append(row_b)
+
+    field_cache = FieldCache()
+    update_collector = FieldUpdateCollector(tables[0], starting_row_ids=[rows_a[0].id])
+    update_collector.add_field_with_pending_update_statement(
+        primary_fields[2], Value("other"), via_path_to_starting_table=link_fields[:2]
+    )
+    update_collector.add_field_with_pending_update_statement(
+        primary_fields[3], Value("other"), via_path_to_starting_table=link_fields
+    )
+    for table in tables:
+        field_cache.cache_model(table.get_model())
+
+    # The affected rows of the third table are stored in a temporary table which
+    # is reused by the update of the fourth table, then it's dropped.
+    with django_assert_num_queries(4) as captured:
+        update_collector.apply_updates(field_cache)
+
+    assert "CREATE TEMPORARY TABLE" in captured.captured_queries[0]["sql"]
+    assert "DROP TABLE" in captured.captured_queries[-1]["sql"]
+
+    for row_a, row_b, expected in zip(rows_a, rows_b, ["a", "a", "other", "other"]):
+        row_a.refresh_from_db()
+        row_b.refresh_from_db()
+        assert row_a.primary == expected
+        assert row_b.primary == "b"
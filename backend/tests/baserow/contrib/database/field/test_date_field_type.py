@@ -76,6 +76,35 @@ def test_date_field_type_prepare_value(data_fixture):
     assert d.prepare_value_for_db(f, "2020-04-10") == date(2020, 4, 10)
 
 
+@pytest.mark.django_db
+def test_date_field_type_prepare_value_in_bulk(data_fixture):
+    d = DateFieldType()
+    f = data_fixture.create_date_field(date_include_time=False, date_format="EU")
+
+    prepared = d.prepare_value_for_db_in_bulk(
+        f,
+        {
+            0: "04/10/2020",
+            1: "TEST",
+            2: "04/10/2020",
+            3: None,
+            4: date(2020, 4, 10),
+            5: "TEST",
+        },
+        continue_on_error=True,
+    )
+
+    assert prepared[0] == date(2020, 10, 4)
+    assert isinstance(prepared[1], ValidationError)
+    assert prepared[2] == date(2020, 10, 4)
+    assert prepared[3] is None
+    assert prepared[4] == date(2020, 4, 10)
+    assert isinstance(prepared[5], ValidationError)
+
+    with pytest.raises(ValidationError):
+        d.prepare_value_for_db_in_bulk(f, {0: "04/10/2020", 1: "TEST"})
+
+
 @pytest.mark.django_db
 def test_date_field_type(data_fixture):
     user = data_fixture.create_user()
@@ -0,0 +1,225 @@
+from unittest.mock import patch
+
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
+    rebuild_field_dependencies,
+)
+from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
+from baserow.contrib.database.fields.field_cache import FieldCache, shared_field_cache
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.models import Table
+
+
+def get_dependant_ids(table, field, field_cache):
+    return [
+        dependant.id
+        for dependant, _, _ in FieldDependencyHandler.get_all_dependent_fields_with_type(
+            table.id, [field.id], field_cache, associated_relations_changed=True
+        )
+    ]
+
+
+@pytest.fixture
+def formula_tables(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    value_field = data_fixture.create_number_field(table=table_b, name="value")
+    formula_field = FieldHandler().create_field(
+        user,
+        table_a,
+        "formula",
+        name="lookup",
+        formula=f"sum(lookup('{link_field.name}', 'value'))",
+    )
+    shared_field_cache.clear()
+    return user, table_a, table_b, link_field, value_field, formula_field
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+def test_shared_field_cache_reuses_dependants(
+    formula_tables, django_assert_num_queries
+):
+    _, _, table_b, _, value_field, formula_field = formula_tables
+
+    field_cache = FieldCache(use_shared_cache=True)
+    assert get_dependant_ids(table_b, value_field, field_cache) == [formula_field.id]
+    assert field_cache.shared_cache_hits == 0
+    assert field_cache.shared_cache_misses > 0
+
+    # Only the versions of the involved tables must be checked. The dependants, the
+    # formula field and the link row field it looks up through are all hits.
+    field_cache = FieldCache(use_shared_cache=True)
+    with django_assert_num_queries(1):
+        assert get_dependant_ids(table_b, value_field, field_cache) == [
+            formula_field.id
+        ]
+    assert field_cache.shared_cache_hits == 3
+    assert field_cache.shared_cache_misses == 0
+
+    # Without opting in, the shared cache is never used.
+    field_cache = FieldCache()
+    assert get_dependant_ids(table_b, value_field, field_cache) == [formula_field.id]
+    assert field_cache.shared_cache_hits == 0
+    assert field_cache.shared_cache_misses == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+def test_shared_field_cache_is_invalidated_when_dependants_change(
+    data_fixture, formula_tables
+):
+    user, table_a, table_b, link_field, value_field, formula_field = formula_tables
+
+    assert get_dependant_ids(
+        table_b, value_field, FieldCache(use_shared_cache=True)
+    ) == [formula_field.id]
+
+    # A new dependant in another table must invalidate the cached dependants of the
+    # table it depends on.
+    second_formula_field = FieldHandler().create_field(
+        user,
+        table_a,
+        "formula",
+        name="lookup 2",
+        formula=f"max(lookup('{link_field.name}', 'value'))",
+    )
+    field_cache = FieldCache(use_shared_cache=True)
+    assert get_dependant_ids(table_b, value_field, field_cache) == [
+        formula_field.id,
+        second_formula_field.id,
+    ]
+    assert field_cache.shared_cache_hits == 0
+
+    # Changing the version of a table in the database, like another process would
+    # do, must invalidate the cached dependants.
+    assert get_dependant_ids(table_b, value_field, FieldCache(use_shared_cache=True))
+    Table.objects.filter(id=table_a.id).update(version="changed")
+    field_cache = FieldCache(use_shared_cache=True)
+    get_dependant_ids(table_b, value_field, field_cache)
+    assert field_cache.shared_cache_hits == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+@patch(
+    "baserow.contrib.database.fields.dependencies.dependency_rebuilder."
+    "invalidate_table_in_model_cache"
+)
+def test_rebuilding_dependencies_only_invalidates_tables_of_changed_dependencies(
+    mock_invalidate, formula_tables
+):
+    user, table_a, table_b, link_field, value_field, formula_field = formula_tables
+
+    rebuild_field_dependencies(formula_field, FieldCache())
+    mock_invalidate.assert_not_called()
+
+    # Removing the dependencies on the other table must invalidate it.
+    formula_field = FieldHandler().update_field(user, formula_field, formula="1")
+    mock_invalidate.assert_called_once_with(table_b.id)
+
+    mock_invalidate.reset_mock()
+    FieldHandler().update_field(
+        user, formula_field, formula=f"sum(lookup('{link_field.name}', 'value'))"
+    )
+    mock_invalidate.assert_called_once_with(table_b.id)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=0)
+@patch(
+    "baserow.contrib.database.fields.dependencies.dependency_rebuilder."
+    "invalidate_table_in_model_cache"
+)
+def test_rebuilding_dependencies_doesnt_invalidate_without_shared_field_cache(
+    mock_invalidate, formula_tables
+):
+    user, table_a, table_b, link_field, value_field, formula_field = formula_tables
+
+    FieldHandler().update_field(user, formula_field, formula="1")
+    mock_invalidate.assert_not_called()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+def test_shared_field_cache_reuses_specific_fields(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="text")
+    shared_field_cache.clear()
+
+    assert (
+        FieldCache(use_shared_cache=True).lookup_by_name(table, "text").id == field.id
+    )
+
+    field_cache = FieldCache(use_shared_cache=True)
+    with django_assert_num_queries(1):
+        assert field_cache.lookup_by_name(table, "text").id == field.id
+        assert field_cache.lookup_by_name(table, "text").id == field.id
+    assert field_cache.shared_cache_hits == 1
+
+    FieldHandler().update_field(user, field, name="x")
+    field_cache = FieldCache(use_shared_cache=True)
+    assert field_cache.lookup_by_name(table, "text") is None
+    assert field_cache.lookup_by_name(table, "x").id == field.id
+    assert field_cache.shared_cache_hits == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+def test_shared_field_cache_hands_out_copies_of_the_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text")
+    shared_field_cache.clear()
+
+    first_field = FieldCache(use_shared_cache=True).lookup_by_name(table, "text")
+    first_field.cached_attribute = "first"
+
+    field_cache = FieldCache(use_shared_cache=True)
+    second_field = field_cache.lookup_by_name(table, "text")
+    assert field_cache.shared_cache_hits == 1
+    assert second_field is not first_field
+    assert not hasattr(second_field, "cached_attribute")
+    second_field.cached_attribute = "second"
+
+    # Within an operation the same copy is used.
+    assert field_cache.lookup_specific(second_field) is second_field
+    third_field = FieldCache(use_shared_cache=True).lookup_by_name(table, "text")
+    assert not hasattr(third_field, "cached_attribute")
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=100)
+def test_updating_rows_uses_the_shared_field_cache(formula_tables):
+    user, table_a, table_b, link_field, value_field, formula_field = formula_tables
+    row_b = RowHandler().create_row(user, table_b, {value_field.db_column: 1})
+    row_a = RowHandler().create_row(user, table_a, {link_field.db_column: [row_b.id]})
+
+    for value in [2, 3]:
+        RowHandler().update_row_by_id(
+            user, table_b, row_b.id, {value_field.db_column: value}
+        )
+        row_a.refresh_from_db()
+        assert getattr(row_a, formula_field.db_column) == value
+
+    assert len(shared_field_cache) > 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SHARED_FIELD_CACHE_MAX_SIZE=0)
+def test_shared_field_cache_can_be_disabled(formula_tables):
+    _, _, table_b, _, value_field, formula_field = formula_tables
+
+    for _ in range(2):
+        field_cache = FieldCache(use_shared_cache=True)
+        assert get_dependant_ids(table_b, value_field, field_cache) == [
+            formula_field.id
+        ]
+        assert field_cache.shared_cache_hits == 0
+    assert len(shared_field_cache) == 0
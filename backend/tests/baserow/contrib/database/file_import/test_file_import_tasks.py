@@ -1,3 +1,5 @@
+import json
+
 from django.conf import settings
 from django.test.utils import override_settings
 from django.utils import timezone
@@ -29,6 +31,7 @@ from baserow.core.jobs.constants import (
     JOB_STARTED,
 )
 from baserow.core.jobs.models import Job
+from baserow.core.jobs.registries import job_type_registry
 from baserow.core.jobs.tasks import clean_up_jobs, run_async_job
 
 
@@ -499,6 +502,47 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_streams_line_delimited_data_file(
+    data_fixture, patch_filefield_storage
+):
+    row_count = 1024 + 5
+
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[(f"col1", "text"), (f"col2", "number")], rows=[], user=user
+    )
+
+    data = [[f"test {index}", index] for index in range(row_count)]
+    data[3] = ["test", "bad"]
+    data[1026] = ["test", 1, "too many values"]
+
+    job_type = job_type_registry.get("file_import")
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(table=table, data=[], user=user)
+        job_type.after_job_creation(job, {"data": data})
+
+        with job.data_file.open("rb") as fin:
+            lines = fin.read().splitlines()
+        assert json.loads(lines[0]) == {"row_count": row_count}
+        assert [json.loads(line) for line in lines[1:]] == data
+
+        with job_type.open_data_file(job) as (count, rows):
+            assert count == row_count
+            assert not isinstance(rows, list)
+            assert list(rows) == data
+
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    model = job.table.get_model()
+    assert model.objects.count() == row_count - 2
+    assert sorted(job.report["failing_rows"].keys()) == sorted(["3", "1026"])
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
 
+from django.db import transaction
+
 import pytest
 from freezegun import freeze_time
 
@@ -317,6 +319,103 @@ def test_row_history_handler_delete_entries_older_than(data_fixture):
     assert RowHistory.objects.count() == 2
 
 
+@pytest.mark.django_db
+@pytest.mark.row_history
+@pytest.mark.parametrize("batch_size", [2, 3, 0])
+def test_row_history_handler_delete_entries_older_than_in_batches(
+    settings, data_fixture, batch_size
+):
+    settings.BASEROW_ROW_HISTORY_CLEANUP_BATCH_SIZE = batch_size
+    table = data_fixture.create_database_table()
+    cutoff = datetime(2021, 1, 4, 0, 0, tzinfo=timezone.utc)
+    RowHistory.objects.bulk_create(
+        [
+            RowHistory(
+                table=table,
+                row_id=999,
+                action_uuid="uuid",
+                action_command_type="cmd",
+                action_type="type",
+                field_names=[],
+                fields_metadata={},
+                before_values={},
+                after_values={},
+                action_timestamp=datetime(2021, 1, day, 0, 0, tzinfo=timezone.utc),
+            )
+            for day in range(1, 7)
+        ]
+    )
+
+    assert RowHistoryHandler().delete_entries_older_than(cutoff) == 3
+    assert list(
+        RowHistory.objects.order_by("action_timestamp").values_list(
+            "action_timestamp__day", flat=True
+        )
+    ) == [4, 5, 6]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.row_history
+@pytest.mark.parametrize("write_batch_size", [1, 0])
+def test_big_updates_write_row_history_after_commit(
+    settings, data_fixture, write_batch_size
+):
+    settings.BASEROW_ROW_HISTORY_ASYNC_MIN_ROWS = 2
+    settings.BASEROW_ROW_HISTORY_WRITE_BATCH_SIZE = write_batch_size
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    row_one = model.objects.create(**{name_field.db_column: "Original 1"})
+    row_two = model.objects.create(**{name_field.db_column: "Original 2"})
+
+    with transaction.atomic():
+        UpdateRowsActionType.do(
+            user,
+            table,
+            [{"id": row_one.id, name_field.db_column: "New 1"}],
+            model,
+        )
+        # Small updates are still written immediately.
+        assert RowHistory.objects.count() == 1
+
+        with freeze_time("2021-01-01 12:00"):
+            UpdateRowsActionType.do(
+                user,
+                table,
+                [
+                    {"id": row_one.id, name_field.db_column: "New 2"},
+                    {"id": row_two.id, name_field.db_column: "New 3"},
+                ],
+                model,
+            )
+        assert RowHistory.objects.count() == 1
+
+    history_entries = RowHistory.objects.filter(
+        action_timestamp=datetime(2021, 1, 1, 12, 0, tzinfo=timezone.utc)
+    ).order_by("row_id")
+    assert [
+        (entry.row_id, entry.user_id, entry.before_values, entry.after_values)
+        for entry in history_entries
+    ] == [
+        (
+            row_one.id,
+            user.id,
+            {name_field.db_column: "New 1"},
+            {name_field.db_column: "New 2"},
+        ),
+        (
+            row_two.id,
+            user.id,
+            {name_field.db_column: "Original 2"},
+            {name_field.db_column: "New 3"},
+        ),
+    ]
+    assert history_entries[0].fields_metadata == {
+        name_field.db_column: {"type": "text", "id": name_field.id}
+    }
+
+
 @pytest.mark.django_db
 @pytest.mark.row_history
 def test_row_history_not_recorded_with_retention_zero_days(settings, data_fixture):
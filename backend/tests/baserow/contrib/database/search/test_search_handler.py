@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.db import connection
 from django.test.utils import override_settings
 
@@ -402,3 +403,118 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@override_settings(
+    TSV_UPDATE_CHUNK_SIZE=2,
+    TSV_UPDATE_PARALLEL_WORKERS=2,
+    TSV_UPDATE_PARALLEL_MIN_ROWS=4,
+)
+@pytest.mark.django_db(transaction=True)
+@patch(
+    "baserow.contrib.database.search.tasks.async_update_tsvector_columns_in_range.delay"
+)
+def test_update_tsvector_columns_fans_out_over_id_ranges(
+    mocked_delay, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"}) for i in range(5)
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        SearchHandler().update_tsvector_columns(table, False)
+
+    assert mocked_delay.call_count == 2
+    ranges = [call.args[2:4] for call in mocked_delay.call_args_list]
+    assert ranges == [(rows[0].id, rows[2].id), (rows[3].id, rows[4].id)]
+    run_id = mocked_delay.call_args_list[0].args[1]
+
+    for call in mocked_delay.call_args_list:
+        SearchHandler.update_tsvector_columns_in_range(table, *call.args[1:4])
+
+    for row in model.objects.all():
+        assert getattr(row, field.tsv_db_column) != ""
+        assert row.needs_background_update is False
+    assert (
+        cache.get(SearchHandler.get_parallel_update_remaining_key(table, run_id))
+        is None
+    )
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.search.handler.SearchHandler."
+    "_trigger_async_tsvector_task_if_needed"
+)
+def test_update_tsvector_columns_in_range_always_finishes_the_range_once(
+    mocked_trigger, data_fixture
+):
+    table = data_fixture.create_database_table()
+    remaining_key = SearchHandler.get_parallel_update_remaining_key(table, "run")
+    cache.set(remaining_key, 2)
+
+    # Overlapping runs must not block each other's ranges.
+    assert SearchHandler.get_parallel_update_lock_key(
+        table, "run", 1
+    ) != SearchHandler.get_parallel_update_lock_key(table, "other_run", 1)
+
+    # A failing range still counts as finished, otherwise the run never completes.
+    with patch.object(
+        SearchHandler,
+        "_update_tsvector_columns_in_range",
+        side_effect=ValueError("Failed"),
+    ):
+        with pytest.raises(ValueError):
+            SearchHandler.update_tsvector_columns_in_range(table, "run", 1, 10)
+    assert cache.get(remaining_key) == 1
+
+    # Executing the same range of the run again doesn't count it twice.
+    SearchHandler.update_tsvector_columns_in_range(table, "run", 1, 10)
+    assert cache.get(remaining_key) == 1
+    mocked_trigger.assert_not_called()
+
+    SearchHandler.update_tsvector_columns_in_range(table, "run", 11, 20)
+    assert cache.get(remaining_key) is None
+    mocked_trigger.assert_called_once_with(
+        table, update_tsvs_for_changed_rows_only=True
+    )
+
+
+@override_settings(TSV_UPDATE_CHUNK_SIZE=1)
+@pytest.mark.django_db
+def test_update_tsvector_columns_in_range_resumes_from_stored_progress(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "Test 1"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "Test 2"})
+    row_3 = model.objects.create(**{f"field_{field.id}": "Test 3"})
+
+    # A previous attempt already updated the first row before it was interrupted.
+    cache.set(
+        SearchHandler.get_parallel_update_progress_key(table, "run", row_1.id),
+        row_1.id,
+    )
+
+    updated = SearchHandler.update_tsvector_columns_in_range(
+        table, "run", row_1.id, row_3.id
+    )
+
+    assert updated == 2
+    rows = list(model.objects.order_by("id"))
+    assert getattr(rows[0], field.tsv_db_column) is None
+    assert getattr(rows[1], field.tsv_db_column) == "'2':2 'test':1"
+    assert getattr(rows[2], field.tsv_db_column) == "'3':2 'test':1"
+    assert (
+        cache.get(
+            SearchHandler.get_parallel_update_progress_key(table, "run", row_1.id)
+        )
+        is None
+    )
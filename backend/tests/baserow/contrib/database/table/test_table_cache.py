@@ -3,7 +3,11 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    get_cached_model_field_attrs,
+    local_model_cache,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +208,104 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE=128)
+def test_built_model_is_reused_from_local_model_cache(
+    data_fixture, django_assert_num_queries
+):
+    field = data_fixture.create_text_field()
+    table = field.table
+
+    model = table.get_model()
+
+    # Only the versions of the table must be checked.
+    with django_assert_num_queries(1):
+        assert table.get_model() is model
+    assert local_model_cache.get(table.id).model is model
+
+    # Filtered or differently named models are never stored.
+    assert table.get_model(field_ids=[field.id]) is not model
+    assert table.get_model(attribute_names=True) is not model
+
+    new_field = data_fixture.create_text_field(table=table)
+    assert local_model_cache.get(table.id) is None
+
+    new_model = table.get_model()
+    assert new_model is not model
+    assert new_field.db_column in [f.name for f in new_model._meta.fields]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE=128)
+def test_locally_cached_model_is_not_rebound_to_other_table_instances(data_fixture):
+    table = data_fixture.create_database_table(name="Table")
+    model = table.get_model()
+
+    other_instance = Table.objects.get(id=table.id)
+    assert other_instance.get_model() is model
+    # The shared model class must not be changed by the threads using it.
+    assert model.baserow_table is table
+
+    # A table attribute exposed via `baserow_table` that doesn't change the version
+    # builds a new model.
+    other_instance.name = "Renamed"
+    other_instance.save()
+    renamed_model = other_instance.get_model()
+    assert renamed_model is not model
+    assert renamed_model.baserow_table.name == "Renamed"
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE=128)
+def test_local_model_cache_is_invalidated_when_related_table_changes(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+
+    model_a = table_a.get_model()
+    assert table_a.get_model() is model_a
+    assert table_b.id in local_model_cache.get(table_a.id).table_versions
+
+    # The version of table b is changed in the database, as another process would
+    # do, without touching the local entry of table a.
+    Table.objects.filter(id=table_b.id).update(version="changed")
+
+    assert table_a.get_model() is not model_a
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE=2, BASEROW_LOCAL_MODEL_CACHE_MAX_FIELDS=3
+)
+def test_local_model_cache_is_bounded(data_fixture):
+    tables = [data_fixture.create_database_table() for _ in range(3)]
+    data_fixture.create_text_field(table=tables[2])
+    data_fixture.create_text_field(table=tables[2])
+    local_model_cache.clear()
+
+    tables[0].get_model()
+    tables[1].get_model()
+    tables[0].get_model()
+    # Table 1 is the least recently used one, so it's evicted first.
+    tables[2].get_model()
+
+    assert len(local_model_cache) == 2
+    assert local_model_cache.get(tables[1].id) is None
+    assert local_model_cache.get(tables[0].id) is not None
+
+    data_fixture.create_text_field(table=tables[2])
+    data_fixture.create_text_field(table=tables[2])
+    tables[2].get_model()
+
+    # A model having more fields than the maximum is never stored.
+    assert local_model_cache.get(tables[2].id) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_LOCAL_MODEL_CACHE_MAX_SIZE=0)
+def test_local_model_cache_can_be_disabled(data_fixture):
+    table = data_fixture.create_database_table()
+
+    assert table.get_model() is not table.get_model()
+    assert local_model_cache.get(table.id) is None
@@ -8,6 +8,7 @@ import pytest
 from freezegun import freeze_time
 
 from baserow.contrib.database.application_types import DatabaseApplicationType
+from baserow.contrib.database.export_serialized import SerializedRowsStream
 from baserow.contrib.database.fields.models import FormulaField, TextField
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
@@ -128,6 +129,143 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_import_export_database_with_streamed_rows(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    link_field = data_fixture.create_link_row_field(table=table, link_row_table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{text_field.db_column: "Line\nbreak"})
+    row_2 = model.objects.create(**{text_field.db_column: "Second"})
+    getattr(row_2, link_field.db_column).set([row_1.id])
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=True, stream_rows=True)
+    serialized = database_type.export_serialized(database, config)
+
+    serialized_rows = serialized["tables"][0]["rows"]
+    assert isinstance(serialized_rows, SerializedRowsStream)
+    assert len(serialized_rows) == 2
+    assert [row[text_field.db_column] for row in serialized_rows] == [
+        "Line\nbreak",
+        "Second",
+    ]
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        workspace, serialized, config, id_mapping, None, None
+    )
+
+    imported_table = imported_database.table_set.get()
+    imported_model = imported_table.get_model()
+    imported_text_field = f'field_{id_mapping["database_fields"][text_field.id]}'
+    imported_link_field = f'field_{id_mapping["database_fields"][link_field.id]}'
+    imported_rows = list(imported_model.objects.order_by("id"))
+    assert [getattr(row, imported_text_field) for row in imported_rows] == [
+        "Line\nbreak",
+        "Second",
+    ]
+    assert [
+        linked.id for linked in getattr(imported_rows[1], imported_link_field).all()
+    ] == [row_1.id]
+
+    assert config.streams == [serialized_rows]
+    config.close_streams()
+    assert config.streams == []
+
+
+@pytest.mark.django_db
+def test_duplicating_closes_the_serialized_rows_streams(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    table.get_model().objects.create(**{text_field.db_column: "Test"})
+
+    with patch.object(
+        SerializedRowsStream, "close", autospec=True, side_effect=lambda self: None
+    ) as mock_close:
+        TableHandler().duplicate_table(user, table)
+        assert mock_close.call_count == 1
+
+        # The database now contains the original and the duplicated table.
+        CoreHandler().duplicate_application(user, database)
+        assert mock_close.call_count == 3
+
+
+@pytest.mark.django_db
+def test_import_export_database_copying_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    number_field = data_fixture.create_number_field(table=table, name="number")
+    link_field = data_fixture.create_link_row_field(table=table, link_row_table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, name="formula", formula="field('text')", formula_type="text"
+    )
+    other_table = data_fixture.create_database_table(database=database)
+    select_field = data_fixture.create_single_select_field(table=other_table)
+    option = data_fixture.create_select_option(field=select_field, value="A")
+
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{text_field.db_column: "First", number_field.db_column: 1}
+    )
+    row_2 = model.objects.create(**{text_field.db_column: "Second"})
+    trashed_row = model.objects.create(trashed=True)
+    getattr(row_2, link_field.db_column).set([row_1.id])
+    getattr(trashed_row, link_field.db_column).set([row_1.id])
+    other_table.get_model().objects.create(**{select_field.db_column: option})
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(
+        include_permission_data=True, copy_rows_in_database=True
+    )
+    serialized = database_type.export_serialized(database, config)
+
+    serialized_table, serialized_other_table = serialized["tables"]
+    assert serialized_table["copy_rows_from_table_id"] == table.id
+    assert serialized_table["rows"] == []
+    # Select options get new ids, so those rows must still be serialized.
+    assert "copy_rows_from_table_id" not in serialized_other_table
+    assert len(serialized_other_table["rows"]) == 1
+
+    id_mapping = {}
+    imported_database = database_type.import_serialized(
+        workspace, serialized, config, id_mapping, None, None
+    )
+
+    imported_table, imported_other_table = imported_database.table_set.order_by("id")
+    imported_model = imported_table.get_model()
+
+    def column(field):
+        return f'field_{id_mapping["database_fields"][field.id]}'
+
+    imported_rows = list(imported_model.objects.order_by("id"))
+    assert [row.id for row in imported_rows] == [row_1.id, row_2.id]
+    assert [getattr(row, column(text_field)) for row in imported_rows] == [
+        "First",
+        "Second",
+    ]
+    assert getattr(imported_rows[0], column(number_field)) == 1
+    assert [r.id for r in getattr(imported_rows[1], column(link_field)).all()] == [
+        row_1.id
+    ]
+    # The formulas are calculated again after the import.
+    assert getattr(imported_rows[1], column(formula_field)) == "Second"
+    assert imported_model.objects_and_trash.count() == 2
+    assert imported_model.objects.create().id == row_2.id + 1
+
+    imported_other_row = imported_other_table.get_model().objects.get()
+    assert getattr(imported_other_row, column(select_field)).value == "A"
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
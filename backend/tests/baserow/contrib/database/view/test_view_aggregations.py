@@ -1,13 +1,20 @@
 import random
 from decimal import Decimal
 
+from django.test.utils import override_settings
+
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
+    FieldAggregationNotSupported,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +474,219 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+@override_settings(INCREMENTAL_VIEW_AGGREGATIONS_ENABLED=True)
+def test_cached_aggregations_are_updated_incrementally_on_row_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="0"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "sum",
+                "aggregation_raw_type": "sum",
+            }
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1, row_2, row_3 = row_handler.create_rows(
+        user,
+        table,
+        [
+            {number_field.db_column: 10},
+            {number_field.db_column: 20},
+            {number_field.db_column: 0},
+        ],
+        model=model,
+    )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 30
+    }
+
+    def assert_cached_value_is(expected):
+        values, need_computation = view_handler._get_aggregations_to_compute(
+            grid_view, GridViewType().get_aggregations(grid_view)
+        )
+        assert need_computation == {}
+        assert values == {number_field.db_column: expected}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {"id": row_1.id, number_field.db_column: 15},
+                {"id": row_3.id, number_field.db_column: 7},
+            ],
+            model=model,
+        )
+    assert_cached_value_is(42)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(user, table, [{number_field.db_column: 8}], model=model)
+    assert_cached_value_is(50)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [row_2.id], model=model)
+    assert_cached_value_is(30)
+
+    assert view_handler.get_field_aggregations(
+        user, grid_view, [(number_field, "sum")]
+    ) == {number_field.db_column: 30}
+
+
+@pytest.mark.django_db
+@override_settings(INCREMENTAL_VIEW_AGGREGATIONS_ENABLED=True)
+def test_cached_aggregations_of_fields_depending_on_a_self_link_are_recomputed(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    field_handler = FieldHandler()
+    link_field = field_handler.create_field(
+        user, table, "link_row", name="Link", link_row_table=table
+    )
+    lookup_field = field_handler.create_field(
+        user, table, "formula", name="Lookup", formula="sum(lookup('Link', 'Number'))"
+    )
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"}
+            for field in [number_field, lookup_field]
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1 = row_handler.create_row(
+        user, table, {number_field.db_column: 1}, model=model
+    )
+    row_2 = row_handler.create_row(
+        user,
+        table,
+        {number_field.db_column: 2, link_field.db_column: [row_1.id]},
+        model=model,
+    )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3,
+        lookup_field.db_column: 1,
+    }
+
+    # Changing the first row also changes the lookup of the second row.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, table, [{"id": row_1.id, number_field.db_column: 5}], model=model
+        )
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, GridViewType().get_aggregations(grid_view)
+    )
+    assert list(need_computation.keys()) == [lookup_field.db_column]
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 7,
+        lookup_field.db_column: 5,
+    }
+
+    # Deleting the first row changes the lookup of the second row.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [row_1.id], model=model)
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 2,
+        lookup_field.db_column: 0,
+    }
+
+
+@pytest.mark.django_db
+@override_settings(INCREMENTAL_VIEW_AGGREGATIONS_ENABLED=True)
+def test_cached_min_aggregation_is_recomputed_if_minimum_is_removed(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "min",
+                "aggregation_raw_type": "min",
+            }
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1, row_2 = row_handler.create_rows(
+        user,
+        table,
+        [{number_field.db_column: 1}, {number_field.db_column: 5}],
+        model=model,
+    )
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, table, [{"id": row_2.id, number_field.db_column: 3}], model=model
+        )
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, GridViewType().get_aggregations(grid_view)
+    )
+    assert need_computation == {}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [row_1.id], model=model)
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, GridViewType().get_aggregations(grid_view)
+    )
+    assert number_field.db_column in need_computation
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
+
+
+@pytest.mark.django_db
+def test_view_aggregation_types_update_value_incrementally():
+    count = view_aggregation_type_registry.get("not_empty_count")
+    assert count.update_value_incrementally(10, 2, 3) == 11
+    assert count.update_value_incrementally(10, None, 3) == 13
+
+    sum_type = view_aggregation_type_registry.get("sum")
+    assert sum_type.update_value_incrementally(Decimal("10"), None, Decimal("2")) == 12
+    assert sum_type.update_value_incrementally(None, None, Decimal("2")) == 2
+    assert sum_type.update_value_incrementally(Decimal("10"), Decimal("4"), None) == 6
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        sum_type.update_value_incrementally(Decimal("10"), Decimal("10"), None)
+
+    max_type = view_aggregation_type_registry.get("max")
+    assert max_type.update_value_incrementally(10, 5, 12) == 12
+    assert max_type.update_value_incrementally(None, None, 1) == 1
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        max_type.update_value_incrementally(10, 10, 2)
+
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        view_aggregation_type_registry.get("median").update_value_incrementally(1, 1, 1)
@@ -1854,6 +1854,45 @@ def test_public_view_row_checker_caches_when_only_unfiltered_fields_updated(
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_checks_all_views_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_a = model.objects.create(**{f"field_{text_field.id}": "a"})
+    row_b = model.objects.create(**{f"field_{text_field.id}": "b"})
+
+    views = []
+    for i in range(10):
+        view = data_fixture.create_grid_view(user, table=table, public=True)
+        data_fixture.create_view_filter(
+            view=view, field=text_field, type="equal", value="a" if i % 2 else "b"
+        )
+        views.append(view)
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+
+    with django_assert_num_queries(1):
+        public_views_rows = row_checker.get_public_views_where_rows_are_visible(
+            [row_a, row_b]
+        )
+
+    assert [(p.view.id, p.allowed_row_ids) for p in public_views_rows] == [
+        (view.id, {row_a.id} if i % 2 else {row_b.id}) for i, view in enumerate(views)
+    ]
+
+    views_with_row_a = [view.view_ptr.specific for i, view in enumerate(views) if i % 2]
+    with django_assert_num_queries(0):
+        assert row_checker.get_public_views_where_row_is_visible(row_a) == (
+            views_with_row_a
+        )
+
+
 @pytest.mark.django_db
 def test_public_view_row_checker_includes_public_views_with_no_filters_with_no_queries(
     data_fixture, django_assert_num_queries
@@ -2048,13 +2087,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
 
     view_ptr_specific = public_grid_view.view_ptr.specific
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific
         ]
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
@@ -2075,14 +2114,14 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking both public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking both public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
@@ -4294,3 +4333,65 @@ def test_get_queryset_apply_sorts(data_fixture):
 
     row_ids = [row.id for row in rows]
     assert row_ids == [row_3.id, row_2.id, row_1.id]
+
+
+@pytest.mark.django_db
+def test_get_queryset_only_field_ids(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(table=related_table, primary=True)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Link",
+        link_row_table=related_table,
+    )
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    data_fixture.create_view_sort(view=grid_view, field=number_field, order="DESC")
+    related_row = related_table.get_model().objects.create()
+    row_1, row_2, row_3 = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "a", number_field.db_column: 1},
+            {text_field.db_column: "b", number_field.db_column: 2},
+            {
+                text_field.db_column: "c",
+                number_field.db_column: 3,
+                link_row_field.db_column: [related_row.id],
+            },
+        ],
+    )
+
+    model = table.get_model()
+    queryset = ViewHandler().get_queryset(
+        grid_view, model=model, only_field_ids=[text_field.id]
+    )
+
+    # The link row field is not enhanced, so the related rows are not prefetched,
+    # but the filters and sorts on fields that are not selected still work.
+    with django_assert_num_queries(1):
+        rows = list(queryset)
+
+    assert [row.id for row in rows] == [row_3.id, row_2.id]
+    assert [getattr(row, text_field.db_column) for row in rows] == ["c", "b"]
+    assert number_field.db_column in rows[0].get_deferred_fields()
+    assert text_field.db_column not in rows[0].get_deferred_fields()
+
+    rows = list(
+        ViewHandler().get_queryset(
+            grid_view,
+            model=model,
+            only_field_ids=[text_field.id, link_row_field.id],
+        )
+    )
+    with django_assert_num_queries(0):
+        related_rows = getattr(rows[0], link_row_field.db_column).all()
+        assert [r.id for r in related_rows] == [related_row.id]
@@ -1,5 +1,8 @@
 from unittest.mock import patch
 
+from django.core.cache import cache
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
@@ -39,3 +42,98 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED=True,
+    BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS=0,
+)
+@patch("baserow.contrib.database.webhooks.tasks.dispatch_webhook_calls")
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_pooled_dispatch(
+    mock_call_webhook, mock_dispatch_webhook_calls, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    webhook_1 = data_fixture.create_table_webhook(
+        user=user, table=table, include_all_events=True
+    )
+    webhook_2 = data_fixture.create_table_webhook(
+        user=user, table=table, include_all_events=True
+    )
+
+    RowHandler().create_row(user=user, table=table, values={})
+
+    mock_call_webhook.delay.assert_not_called()
+    mock_dispatch_webhook_calls.delay.assert_called_once()
+    calls = mock_dispatch_webhook_calls.delay.call_args[1]["calls"]
+    assert {call["webhook_id"] for call in calls} == {webhook_1.id, webhook_2.id}
+    assert all(call["event_type"] == "rows.created" for call in calls)
+    assert len({call["event_id"] for call in calls}) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_POOLED_DISPATCH_ENABLED=True,
+    BASEROW_WEBHOOKS_COALESCE_WINDOW_SECONDS=5,
+    BASEROW_WEBHOOKS_COALESCE_MAX_EVENTS=10,
+)
+@patch("baserow.contrib.database.webhooks.dispatcher.send_webhook_calls")
+def test_signal_listener_coalesces_events_of_the_same_webhook(
+    mock_send_webhook_calls, data_fixture
+):
+    from baserow.contrib.database.webhooks.dispatcher import (
+        get_coalesce_buffer_cache_key,
+    )
+    from baserow.contrib.database.webhooks.tasks import flush_coalesced_webhook_calls
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    webhook = data_fixture.create_table_webhook(
+        user=user, table=table, include_all_events=True
+    )
+
+    handler = RowHandler()
+    # The eager flush task is patched so that the events stay in the buffer, like
+    # they would while the countdown hasn't expired.
+    with patch.object(flush_coalesced_webhook_calls, "apply_async") as mock_flush:
+        row_1 = handler.create_row(user=user, table=table, values={})
+        row_2 = handler.create_row(user=user, table=table, values={})
+        handler.delete_row_by_id(user=user, table=table, row_id=row_1.id)
+
+    mock_flush.assert_called_once_with(kwargs={"webhook_id": webhook.id}, countdown=5)
+    assert len(cache.get(get_coalesce_buffer_cache_key(webhook.id))) == 3
+
+    flush_coalesced_webhook_calls.delay(webhook_id=webhook.id)
+
+    assert cache.get(get_coalesce_buffer_cache_key(webhook.id)) is None
+    mock_send_webhook_calls.assert_called_once()
+    calls = mock_send_webhook_calls.call_args[0][0]
+    assert len(calls) == 2
+    assert calls[0]["event_type"] == "rows.created"
+    assert [item["id"] for item in calls[0]["payload"]["items"]] == [
+        row_1.id,
+        row_2.id,
+    ]
+    assert calls[0]["payload"]["event_id"] == calls[0]["event_id"]
+    assert calls[0]["headers"]["X-Baserow-Delivery"] == calls[0]["event_id"]
+    assert calls[1]["event_type"] == "rows.deleted"
+    assert calls[1]["payload"]["row_ids"] == [row_1.id]
+
+
+def test_merge_payloads():
+    from baserow.contrib.database.webhooks.registries import webhook_event_type_registry
+
+    payloads = [
+        {"event_id": "1", "items": [{"id": 1}], "old_items": [{"id": 1}]},
+        {"event_id": "2", "items": [{"id": 2}], "old_items": [{"id": 2}]},
+    ]
+    assert webhook_event_type_registry.get("rows.updated").merge_payloads(payloads) == {
+        "event_id": "1",
+        "items": [{"id": 1}, {"id": 2}],
+        "old_items": [{"id": 1}, {"id": 2}],
+    }
+    assert (
+        webhook_event_type_registry.get("row.updated").merge_payloads(payloads) is None
+    )
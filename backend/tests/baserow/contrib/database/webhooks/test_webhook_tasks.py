@@ -207,3 +207,93 @@ def test_can_call_webhook_to_localhost_when_private_addresses_allowed(
     assert not call.error
     assert call.response_status == 201
     assert webhook.active
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+def test_dispatch_webhook_calls_sends_calls_concurrently_with_one_session(
+    data_fixture,
+):
+    from baserow.contrib.database.webhooks.dispatcher import get_webhook_session
+    from baserow.contrib.database.webhooks.tasks import dispatch_webhook_calls
+
+    webhook_1 = data_fixture.create_table_webhook(failed_triggers=1)
+    webhook_2 = data_fixture.create_table_webhook()
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+    responses.add(responses.POST, "http://localhost2/", json={}, status=200)
+
+    session = get_webhook_session()
+    assert session is get_webhook_session()
+
+    with patch.object(session, "request", wraps=session.request) as mock_request:
+        dispatch_webhook_calls.delay(
+            calls=[
+                {
+                    "webhook_id": webhook.id,
+                    "event_id": event_id,
+                    "event_type": "rows.created",
+                    "method": "POST",
+                    "url": url,
+                    "headers": {"Baserow-header-1": "Value 1"},
+                    "payload": {"type": "rows.created"},
+                }
+                for webhook, event_id, url in [
+                    (
+                        webhook_1,
+                        "00000000-0000-0000-0000-000000000001",
+                        "http://localhost/",
+                    ),
+                    (
+                        webhook_2,
+                        "00000000-0000-0000-0000-000000000002",
+                        "http://localhost2/",
+                    ),
+                ]
+            ]
+        )
+
+    assert mock_request.call_count == 2
+    assert len(responses.calls) == 2
+    assert TableWebhookCall.objects.count() == 2
+    call_1 = TableWebhookCall.objects.get(webhook=webhook_1)
+    assert str(call_1.event_id) == "00000000-0000-0000-0000-000000000001"
+    assert call_1.called_url == "http://localhost/"
+    assert call_1.response_status == 200
+    assert "Baserow-header-1: Value 1" in call_1.request
+    webhook_1.refresh_from_db()
+    assert webhook_1.failed_triggers == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=1,
+    BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES=5,
+)
+def test_dispatch_webhook_calls_hands_failed_calls_over_to_call_webhook(
+    data_fixture,
+):
+    from baserow.contrib.database.webhooks.tasks import dispatch_webhook_calls
+
+    webhook = data_fixture.create_table_webhook()
+    responses.add(responses.POST, "http://localhost/", json={}, status=500)
+
+    call = {
+        "webhook_id": webhook.id,
+        "event_id": "00000000-0000-0000-0000-000000000000",
+        "event_type": "rows.created",
+        "method": "POST",
+        "url": "http://localhost/",
+        "headers": {},
+        "payload": {"type": "rows.created"},
+    }
+    with patch(
+        "baserow.contrib.database.webhooks.tasks.call_webhook.apply_async"
+    ) as mock_apply_async:
+        dispatch_webhook_calls.delay(calls=[call])
+
+    mock_apply_async.assert_called_once_with(kwargs=call, countdown=1, retries=1)
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 1
+    created_call = TableWebhookCall.objects.get()
+    assert created_call.response_status == 500
@@ -16,6 +16,7 @@ from baserow.contrib.database.rows.registries import (
     row_metadata_registry,
 )
 from baserow.test_utils.helpers import AnyInt, register_instance_temporarily
+from baserow.ws.registries import mark_additional_groups_subscribed
 
 
 @pytest.mark.django_db(transaction=True)
@@ -132,6 +133,58 @@ def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["metadata"] == {}
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_row_updated_delta(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_2 = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field_2.id}": "Unchanged"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "Same"})
+
+    # The delta isn't generated if no client subscribed with the delta row update
+    # format.
+    with transaction.atomic():
+        RowHandler().update_rows(
+            user, table, [{"id": row.id, f"field_{field.id}": "A"}]
+        )
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    assert "alternative_payloads" not in args[1]
+
+    mock_broadcast_to_channel_group.delay.reset_mock()
+    mark_additional_groups_subscribed([f"table-{table.id}-row-updates-delta"])
+    with transaction.atomic():
+        RowHandler().update_rows(
+            user,
+            table,
+            [
+                {"id": row.id, f"field_{field.id}": "Test"},
+                {"id": row_2.id, f"field_{field.id}": "Same"},
+            ],
+        )
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    # Only the changed values of the changed rows are sent to the clients that
+    # subscribed with the delta row update format.
+    assert args[1]["alternative_payloads"] == {
+        f"table-{table.id}-row-updates-delta": {
+            "type": "rows_updated_delta",
+            "table_id": table.id,
+            "rows": [{"id": row.id, f"field_{field.id}": "Test"}],
+            "metadata": {},
+        }
+    }
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture):
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from baserow.core.cache import (
+    PERMISSIONS_VERSION_CACHE_KEY,
+    get_many_from_workspace_permissions_cache,
+    get_permissions_version,
+    get_workspace_permissions_version,
+    invalidate_all_workspaces_permissions,
+)
+
+
+@pytest.mark.django_db
+@patch("baserow.core.cache.cache")
+def test_permissions_versions_fall_back_to_the_created_version_if_evicted(
+    mock_cache,
+):
+    # The created version is evicted before it could be read again.
+    mock_cache.get.side_effect = lambda key, default=None: default
+
+    version = get_workspace_permissions_version(1)
+    assert version is not None
+    assert mock_cache.add.call_args[0][1] == version
+
+    version = get_permissions_version()
+    assert version is not None
+    assert mock_cache.add.call_args[0][1] == version
+
+
+@patch("baserow.core.cache.cache")
+@patch("baserow.core.registries.plugin_registry.get_all")
+def test_permissions_version_expires_when_a_plugin_expects_changes(
+    mock_get_all, mock_cache
+):
+    mock_cache.get.return_value = None
+    plugin = MagicMock()
+    plugin.get_permissions_version_timeout.return_value = 0.2
+    mock_get_all.return_value = [MagicMock(), plugin]
+    mock_get_all.return_value[0].get_permissions_version_timeout.return_value = None
+
+    get_permissions_version()
+    mock_cache.add.assert_called_once_with(
+        PERMISSIONS_VERSION_CACHE_KEY, mock_cache.add.call_args[0][1], timeout=1
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_invalidate_all_workspaces_permissions(data_fixture):
+    workspace = data_fixture.create_workspace()
+    compute_missing = MagicMock(side_effect=lambda keys: {key: 1 for key in keys})
+
+    def get_cached():
+        return get_many_from_workspace_permissions_cache(
+            workspace.id, "test", ["key"], compute_missing, 60
+        )
+
+    assert get_cached() == {"key": 1}
+    assert get_cached() == {"key": 1}
+    assert compute_missing.call_count == 1
+
+    invalidate_all_workspaces_permissions()
+    assert get_cached() == {"key": 1}
+    assert compute_missing.call_count == 2
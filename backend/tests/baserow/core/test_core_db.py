@@ -1,4 +1,6 @@
-from unittest.mock import MagicMock
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
@@ -23,6 +25,8 @@ from baserow.core.db import (
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
+    bulk_copy_insert,
+    get_estimated_or_exact_count,
     specific_iterator,
     specific_queryset,
 )
@@ -646,3 +650,80 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+@pytest.mark.django_db
+def test_get_estimated_or_exact_count(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    model.objects.bulk_create([model() for _ in range(3)])
+
+    assert get_estimated_or_exact_count(model.objects.all(), 1000000) == (3, True)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {table.get_database_table_name()}")
+
+    count, is_exact = get_estimated_or_exact_count(model.objects.all(), 0)
+    assert is_exact is False
+    assert count == 3
+
+
+@pytest.mark.django_db
+def test_bulk_copy_insert(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    model = table.get_model()
+
+    texts = ["tab\there", "new\nline\r", "back\\slash", "\\N", "", None]
+    inserted_batches = []
+    count = bulk_copy_insert(
+        model,
+        (
+            model(
+                id=index + 10,
+                order=index + 1,
+                **{
+                    text_field.db_column: text,
+                    number_field.db_column: Decimal("1.25") * index,
+                    boolean_field.db_column: index % 2 == 0,
+                    date_field.db_column: datetime(2023, 1, 1, 12, tzinfo=timezone.utc),
+                },
+            )
+            for index, text in enumerate(texts)
+        ),
+        batch_size=4,
+        on_batch_inserted=inserted_batches.append,
+    )
+
+    assert count == 6
+    assert inserted_batches == [4, 2]
+    rows = list(model.objects.order_by("id"))
+    assert [row.id for row in rows] == list(range(10, 16))
+    assert [getattr(row, text_field.db_column) for row in rows] == texts
+    assert getattr(rows[2], number_field.db_column) == Decimal("2.50")
+    assert getattr(rows[2], boolean_field.db_column) is True
+    assert getattr(rows[1], boolean_field.db_column) is False
+    assert getattr(rows[0], date_field.db_column) == datetime(
+        2023, 1, 1, 12, tzinfo=timezone.utc
+    )
+
+    # Instances without id get one from the sequence.
+    bulk_copy_insert(model, [model(order=10)])
+    assert model.objects.count() == 7
+
+
+@pytest.mark.django_db
+def test_bulk_copy_insert_falls_back_to_bulk_create_for_unsupported_values():
+    with patch.object(
+        Settings.objects, "bulk_create", wraps=Settings.objects.bulk_create
+    ) as bulk_create:
+        with patch("baserow.core.db._to_copy_text", side_effect=TypeError):
+            bulk_copy_insert(Settings, [Settings(instance_id="copy")])
+
+    bulk_create.assert_called_once()
+    assert Settings.objects.filter(instance_id="copy").exists()
@@ -3,6 +3,7 @@ from pyinstrument import Profiler
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db
@@ -177,3 +178,41 @@ def test_updating_many_rows_in_public_filtered_views(
          [11 frames hidden]  django
 
     """
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_public_view_row_checker_query_count_is_flat_with_many_views(data_fixture):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        columns=[("text", "text")], rows=[[str(i)] for i in range(100)], user=user
+    )
+    model = table.get_model()
+
+    for num_public_views in [1, 10, 50]:
+        while len(table.view_set.filter(public=True)) < num_public_views:
+            view = data_fixture.create_grid_view(user=user, table=table, public=True)
+            data_fixture.create_view_filter(
+                view=view, field=fields[0], type="contains", value="1"
+            )
+
+        row_checker = ViewHandler().get_public_views_row_checker(
+            table, model, only_include_views_which_want_realtime_events=True
+        )
+        profiler = Profiler()
+        profiler.start()
+        with CaptureQueriesContext(connection) as captured:
+            row_checker.get_public_views_where_rows_are_visible(rows)
+        profiler.stop()
+        print(
+            f"{num_public_views} public views: "
+            f"{len(captured.captured_queries)} queries"
+        )
+        print(profiler.output_text(unicode=True, color=True))
+        assert len(captured.captured_queries) == 1
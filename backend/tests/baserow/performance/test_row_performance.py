@@ -0,0 +1,188 @@
+import os
+
+from django.urls import reverse
+
+import pytest
+from rest_framework.status import HTTP_200_OK
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.test_utils.benchmark import benchmark, create_benchmark_tables
+
+# The size of the generated tables can be changed using environment variables, for
+# example `BASEROW_BENCHMARK_ROWS=100000`.
+ROWS = int(os.getenv("BASEROW_BENCHMARK_ROWS", 1000))
+WIDTH = int(os.getenv("BASEROW_BENCHMARK_WIDTH", 20))
+LINK_DEPTH = int(os.getenv("BASEROW_BENCHMARK_LINK_DEPTH", 2))
+BATCH_SIZE = int(os.getenv("BASEROW_BENCHMARK_BATCH_SIZE", 200))
+PARAMS = {"rows": ROWS, "width": WIDTH, "link_depth": LINK_DEPTH}
+
+
+def get_rows_values(benchmark_table, count, offset=0):
+    rows_values = []
+    for index in range(offset, offset + count):
+        values = {}
+        for i, field in enumerate(benchmark_table.fields[1:]):
+            values[field.db_column] = [f"new {index}-{i}", index, index % 2 == 1][i % 3]
+        rows_values.append(values)
+    return rows_values
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args. Set the BASEROW_BENCHMARK_OUTPUT environment variable to a file
+# path to store the results, so that they can be compared with another commit.
+def test_create_rows_performance(data_fixture):
+    user = data_fixture.create_user()
+    benchmark_table = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )[0]
+    table = benchmark_table.table
+
+    with benchmark("create_rows", batch_size=1, **PARAMS) as single:
+        RowHandler().create_rows(user, table, get_rows_values(benchmark_table, 1))
+
+    with benchmark("create_rows", batch_size=BATCH_SIZE, **PARAMS) as batch:
+        RowHandler().create_rows(
+            user, table, get_rows_values(benchmark_table, BATCH_SIZE)
+        )
+
+    # Creating rows in bulk must not execute a query per row.
+    assert batch.query_count == single.query_count
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test.
+def test_update_rows_performance(data_fixture):
+    user = data_fixture.create_user()
+    benchmark_table = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )[0]
+    table = benchmark_table.table
+    row_ids = list(
+        benchmark_table.model.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    def get_values(count):
+        rows_values = get_rows_values(benchmark_table, count)
+        for row_id, values in zip(row_ids, rows_values):
+            values["id"] = row_id
+        return rows_values
+
+    with benchmark("update_rows", batch_size=1, **PARAMS) as single:
+        RowHandler().update_rows(user, table, get_values(1))
+
+    with benchmark("update_rows", batch_size=BATCH_SIZE, **PARAMS) as batch:
+        RowHandler().update_rows(user, table, get_values(BATCH_SIZE))
+
+    # Updating rows in bulk must not execute a query per row.
+    assert batch.query_count == single.query_count
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test.
+def test_delete_rows_performance(data_fixture):
+    user = data_fixture.create_user()
+    benchmark_table = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )[0]
+    table = benchmark_table.table
+    row_ids = list(
+        benchmark_table.model.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    with benchmark("delete_rows", batch_size=1, **PARAMS) as single:
+        RowHandler().delete_rows(user, table, row_ids[:1])
+
+    with benchmark("delete_rows", batch_size=BATCH_SIZE, **PARAMS) as batch:
+        RowHandler().delete_rows(user, table, row_ids[1 : BATCH_SIZE + 1])
+
+    # Deleting rows in bulk must not execute a query per row.
+    assert batch.query_count == single.query_count
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test.
+def test_import_rows_performance(data_fixture):
+    user = data_fixture.create_user()
+    benchmark_table = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )[0]
+    table = benchmark_table.table
+    # The imported values are matched with the writable fields by position, the
+    # link or number value field is created after the other fields.
+    fields = sorted(benchmark_table.fields, key=lambda f: (f.order, f.id))
+    data = []
+    for index, values in enumerate(get_rows_values(benchmark_table, ROWS)):
+        row = [values.get(field.db_column, f"Row {index}") for field in fields]
+        row.append([] if benchmark_table.link_field is not None else index)
+        data.append(row)
+
+    with benchmark("import_rows", **PARAMS) as result:
+        RowHandler().import_rows(user, table, data)
+
+    # The rows are imported in batches, so the number of queries must stay well
+    # below the number of rows.
+    assert result.query_count < ROWS
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test.
+def test_list_grid_view_rows_performance(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    benchmark_table = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )[0]
+    table = benchmark_table.table
+    number_field = benchmark_table.fields[2] if WIDTH >= 2 else None
+    grid_view = data_fixture.create_grid_view(table=table)
+    if number_field is not None:
+        data_fixture.create_view_filter(
+            view=grid_view, field=number_field, type="higher_than", value="10"
+        )
+        data_fixture.create_view_sort(view=grid_view, field=number_field, order="DESC")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    for name, query in [
+        ("list_grid_view_rows", {}),
+        ("list_grid_view_rows_search", {"search": "Row 1"}),
+    ]:
+        with benchmark(name, **PARAMS):
+            response = api_client.get(
+                url, {"limit": 200, **query}, HTTP_AUTHORIZATION=f"JWT {token}"
+            )
+        assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test.
+def test_formula_dependency_propagation_performance(data_fixture):
+    user = data_fixture.create_user()
+    benchmark_tables = create_benchmark_tables(
+        data_fixture, user, WIDTH, ROWS, LINK_DEPTH
+    )
+    last_table = benchmark_tables[-1]
+    row_ids = list(last_table.model.objects.order_by("id").values_list("id", flat=True))
+
+    # Every changed value in the last table must be propagated through the
+    # `FieldUpdateCollector` to all the other tables in the chain.
+    with benchmark("propagate_dependencies", batch_size=BATCH_SIZE, **PARAMS):
+        RowHandler().update_rows(
+            user,
+            last_table.table,
+            [
+                {"id": row_id, last_table.value_field.db_column: index * 2}
+                for index, row_id in enumerate(row_ids[:BATCH_SIZE])
+            ],
+        )
+
+    first_table = benchmark_tables[0]
+    assert first_table.model.objects.filter(
+        **{f"{first_table.value_field.db_column}__isnull": False}
+    ).exists()
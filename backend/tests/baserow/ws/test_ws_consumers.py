@@ -1,17 +1,27 @@
 from unittest.mock import AsyncMock, Mock
 
+from django.core.cache import cache
+
 import pytest
+from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
 from baserow.ws.auth import ANONYMOUS_USER_TOKEN
 from baserow.ws.consumers import CoreConsumer, PageContext, PageScope, SubscribedPages
-from baserow.ws.registries import PageType, page_registry
+from baserow.ws.registries import (
+    PageType,
+    get_additional_group_subscribers_cache_key,
+    has_additional_group_subscribers,
+    page_registry,
+)
+from baserow.ws.tasks import send_message_to_channel_group
 
 
 class AcceptingTestPageType(PageType):
     type = "test_page_type"
     parameters = ["test_param"]
+    optional_parameters = ["test_format"]
 
     def can_add(self, user, web_socket_id, test_param, **kwargs):
         return True
@@ -22,6 +32,9 @@ class AcceptingTestPageType(PageType):
     def get_permission_channel_group_name(self, test_param, **kwargs):
         return f"permissions-test-page-{test_param}"
 
+    def get_additional_group_names(self, test_param, test_format=None, **kwargs):
+        return [f"test-page-{test_param}-{test_format}"] if test_format else []
+
 
 class NotAcceptingTestPageType(AcceptingTestPageType):
     type = "test_page_type_not_accepting"
@@ -149,6 +162,69 @@ async def test_core_consumer_add_to_page_success(data_fixture, test_page_types):
     await communicator.disconnect()
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.websockets
+async def test_core_consumer_add_to_page_with_optional_parameters(
+    data_fixture, test_page_types
+):
+    channel_layer = get_channel_layer()
+    user_1, token_1 = data_fixture.create_user_and_token()
+    communicator = WebsocketCommunicator(
+        application,
+        f"ws/core/?jwt_token={token_1}",
+        headers=[(b"origin", b"http://localhost")],
+    )
+    await communicator.connect()
+    await communicator.receive_json_from()
+
+    cache.delete(get_additional_group_subscribers_cache_key("test-page-1-compact"))
+    await communicator.send_json_to(
+        {"page": "test_page_type", "test_param": 1, "test_format": "compact"}
+    )
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response["type"] == "page_add"
+    assert response["parameters"] == {"test_param": 1}
+    # The alternative payloads for the additional group must now be generated.
+    assert has_additional_group_subscribers("test-page-1-compact")
+
+    event = {
+        "type": "broadcast_to_group",
+        "payload": {"test": "full"},
+        "ignore_web_socket_id": None,
+        "exclude_group_names": ["test-page-1-compact"],
+    }
+    compact_event = {
+        "type": "broadcast_to_group",
+        "payload": {"test": "compact"},
+        "ignore_web_socket_id": None,
+    }
+
+    # The members of the additional group only receive the alternative payload.
+    await send_message_to_channel_group(channel_layer, "test-page-1", event)
+    await communicator.receive_nothing(timeout=0.1)
+    await send_message_to_channel_group(
+        channel_layer, "test-page-1-compact", compact_event
+    )
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response == {"test": "compact"}
+
+    # Subscribing again without the optional parameter leaves the additional group.
+    await communicator.send_json_to({"page": "test_page_type", "test_param": 1})
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response["type"] == "page_add"
+
+    await send_message_to_channel_group(
+        channel_layer, "test-page-1-compact", compact_event
+    )
+    await communicator.receive_nothing(timeout=0.1)
+    await send_message_to_channel_group(channel_layer, "test-page-1", event)
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response == {"test": "full"}
+
+    await communicator.disconnect()
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.websockets
@@ -1,13 +1,20 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
+from baserow.contrib.database.table.operations import ReadDatabaseTableOperationType
 from baserow.ws.tasks import (
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
+    broadcast_to_permitted_users,
     broadcast_to_users,
     broadcast_to_users_individual_payloads,
     force_disconnect_users,
@@ -507,3 +514,40 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.tasks.broadcast_to_users")
+def test_broadcast_to_permitted_users_caches_permitted_users(
+    mock_broadcast_to_users, data_fixture, settings
+):
+    settings.BASEROW_PERMITTED_USERS_CACHE_TIMEOUT = 60
+    user_1 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user_1)
+    table = data_fixture.create_database_table(user=user_1)
+    table.database.workspace = workspace
+    table.database.save()
+    args = (
+        workspace.id,
+        ReadDatabaseTableOperationType.type,
+        "database_table",
+        table.id,
+        {"message": "test"},
+    )
+
+    broadcast_to_permitted_users(*args)
+    assert mock_broadcast_to_users.call_args[0][0] == [user_1.id]
+
+    # The permitted users are cached, so the permissions are not checked again.
+    with CaptureQueriesContext(connection) as captured:
+        broadcast_to_permitted_users(*args)
+    assert len(captured.captured_queries) == 0
+    assert mock_broadcast_to_users.call_args[0][0] == [user_1.id]
+
+    # Adding a user to the workspace invalidates the cached permitted users.
+    user_2 = data_fixture.create_user()
+    data_fixture.create_user_workspace(user=user_2, workspace=workspace)
+    broadcast_to_permitted_users(*args)
+    assert sorted(mock_broadcast_to_users.call_args[0][0]) == sorted(
+        [user_1.id, user_2.id]
+    )
@@ -1,6 +1,7 @@
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
@@ -8,6 +9,7 @@ from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
 from baserow_premium.license.handler import LicenseHandler
 
+from baserow.core.cache import get_many_from_workspace_permissions_cache
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.mixins import TrashableModelMixin
@@ -295,7 +297,9 @@ class RoleAssignmentHandler:
     ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
         """
         Returns the role assignments for for all given actors who are all of the
-        actor_subject_type.
+        actor_subject_type. The roles per scope of every actor are cached until the
+        permissions of the workspace or the licenses of the instance change, so only
+        the actors that are not cached yet are queried.
 
         :param workspace: The workspace in which we want the role assignments for.
         :param actor_subject_type: The type of the actors.
@@ -305,6 +309,62 @@ class RoleAssignmentHandler:
             the object hierarchy, the earlier the tuple is in the list.
         """
 
+        actor_by_key = {
+            f"{actor_subject_type.type}_{actor.id}_{include_trash}": actor
+            for actor in actors
+        }
+
+        def compute_missing(keys):
+            roles_per_scope_per_actor = self._get_roles_per_scope_for_actors(
+                workspace,
+                actor_subject_type,
+                [actor_by_key[key] for key in keys],
+                include_trash=include_trash,
+            )
+            # Only the ids of the roles are cached because they're in the role
+            # cache anyway, and the workspace is replaced by the provided one.
+            return {
+                key: [
+                    (
+                        None if scope == workspace else scope,
+                        [role.id for role in roles],
+                    )
+                    for scope, roles in roles_per_scope_per_actor[actor_by_key[key]]
+                ]
+                for key in keys
+            }
+
+        cached_roles_per_scope = get_many_from_workspace_permissions_cache(
+            workspace.id,
+            "roles_per_scope",
+            list(actor_by_key.keys()),
+            compute_missing,
+            settings.BASEROW_PERMISSIONS_CACHE_TIMEOUT,
+        )
+
+        roles_per_scope_per_actor = defaultdict(list)
+        for key, roles_per_scope in cached_roles_per_scope.items():
+            roles_per_scope_per_actor[actor_by_key[key]] = [
+                (
+                    workspace if scope is None else scope,
+                    [self.get_role_by_id(role_id) for role_id in role_ids],
+                )
+                for scope, role_ids in roles_per_scope
+            ]
+        return roles_per_scope_per_actor
+
+    def _get_roles_per_scope_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
+        """
+        Computes the role assignments for for all given actors who are all of the
+        actor_subject_type using the database.
+        """
+
         content_types = ContentType.objects.get_for_models(
             actor_subject_type.model_class, Team, Workspace
         )
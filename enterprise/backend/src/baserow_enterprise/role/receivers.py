@@ -1,14 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from baserow.core.cache import invalidate_workspace_permissions
 from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
+from baserow_enterprise.role.models import RoleAssignment
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
@@ -16,7 +18,7 @@ from baserow_enterprise.signals import (
     team_deleted,
     team_restored,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
 
 User = get_user_model()
 
@@ -66,6 +68,34 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(post_save, sender=RoleAssignment)
+@receiver(post_delete, sender=RoleAssignment)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_workspace_permissions_when_role_assignment_or_team_changed(
+    sender, instance, **kwargs
+):
+    # Role assignments are also deleted in bulk when their subject or scope is
+    # deleted, without sending the `role_assignment_deleted` signal.
+    invalidate_workspace_permissions(instance.workspace_id)
+
+
+@receiver(post_save, sender=TeamSubject)
+@receiver(post_delete, sender=TeamSubject)
+def invalidate_workspace_permissions_when_team_subject_changed(
+    sender, instance, **kwargs
+):
+    # The team might already be deleted if the subject is deleted because of it, in
+    # which case the team itself invalidates the workspace.
+    workspace_id = (
+        Team.objects_and_trash.filter(id=instance.team_id)
+        .values_list("workspace_id", flat=True)
+        .first()
+    )
+    if workspace_id is not None:
+        invalidate_workspace_permissions(workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
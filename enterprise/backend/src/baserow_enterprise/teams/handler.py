@@ -11,6 +11,7 @@ from django.db.models.functions import Coalesce
 from baserow_premium.license.handler import LicenseHandler
 
 from baserow.contrib.database.tokens.models import Token
+from baserow.core.cache import invalidate_workspace_permissions
 from baserow.core.models import Workspace
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import atomic_if_not_already
@@ -424,6 +425,9 @@ class TeamHandler:
                 subj_kwargs["pk"] = pk_override
             bulk_teamsubjects.append(TeamSubject(**subj_kwargs))
 
+        # The bulk create doesn't send the `post_save` signal that invalidates the
+        # cached permissions of the workspace.
+        invalidate_workspace_permissions(team.workspace_id)
         return TeamSubject.objects.bulk_create(bulk_teamsubjects)
 
     def create_subject(
@@ -946,6 +946,86 @@ def test_get_roles_per_scope_trashed_teams(data_fixture, enterprise_data_fixture
     ]
 
 
+@pytest.mark.django_db(transaction=True)
+def test_get_roles_per_scope_is_cached_until_permissions_change(
+    data_fixture, enterprise_data_fixture, settings
+):
+    settings.BASEROW_PERMISSIONS_CACHE_TIMEOUT = 60
+    user = data_fixture.create_user()
+    user2 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user, members=[user2])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    builder_role = Role.objects.get(uid="BUILDER")
+    viewer_role = Role.objects.get(uid="VIEWER")
+
+    RoleAssignmentHandler().assign_role(
+        user2, workspace, role=viewer_role, scope=database
+    )
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user2) == [
+        (workspace, [builder_role]),
+        (database, [viewer_role]),
+    ]
+
+    with CaptureQueriesContext(connection) as captured:
+        roles_per_scope = RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, UserSubjectType(), [user, user2]
+        )
+    # Only the roles of the first user must be computed.
+    assert len(captured.captured_queries) > 0
+    assert roles_per_scope[user2] == [
+        (workspace, [builder_role]),
+        (database, [viewer_role]),
+    ]
+
+    with CaptureQueriesContext(connection) as captured:
+        RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, UserSubjectType(), [user, user2]
+        )
+    assert len(captured.captured_queries) == 0
+
+    # Assigning a role invalidates the cache of the workspace.
+    RoleAssignmentHandler().assign_role(
+        user2, workspace, role=builder_role, scope=table
+    )
+    assert RoleAssignmentHandler().get_roles_per_scope(workspace, user2) == [
+        (workspace, [builder_role]),
+        (database, [viewer_role]),
+        (table, [builder_role]),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_roles_per_scope_cache_is_invalidated_when_licenses_change(
+    data_fixture, enterprise_data_fixture, settings
+):
+    settings.BASEROW_PERMISSIONS_CACHE_TIMEOUT = 60
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    admin_role = Role.objects.get(uid="ADMIN")
+
+    roles_per_scope = RoleAssignmentHandler().get_roles_per_scope_for_actors(
+        workspace, UserSubjectType(), [user]
+    )
+    assert roles_per_scope[user] == [(workspace, [admin_role])]
+
+    with CaptureQueriesContext(connection) as captured:
+        RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, UserSubjectType(), [user]
+        )
+    assert len(captured.captured_queries) == 0
+
+    # Changing a license invalidates the cache of all workspaces.
+    enterprise_data_fixture.enable_enterprise().save()
+
+    with CaptureQueriesContext(connection) as captured:
+        roles_per_scope = RoleAssignmentHandler().get_roles_per_scope_for_actors(
+            workspace, UserSubjectType(), [user]
+        )
+    assert len(captured.captured_queries) > 0
+    assert roles_per_scope[user] == [(workspace, [admin_role])]
+
+
 @pytest.mark.disabled_in_ci
 # You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
 # intellij by editing the run config for this test and adding --run-disabled-in-ci -s
@@ -6,6 +6,7 @@ import pytest
 
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.table.models import Table
+from baserow.core.cache import get_workspace_permissions_version
 from baserow.core.handler import CoreHandler
 from baserow.core.models import WorkspaceUser
 from baserow_enterprise.role.handler import RoleAssignmentHandler
@@ -165,3 +166,32 @@ def test_send_permissions_updated_only_if_permissions_were_updated(
     )
 
     mock_permissions_updated.send.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_role_and_team_changes_invalidate_workspace_permissions(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin)
+    database = data_fixture.create_database_application(workspace=workspace)
+    user = data_fixture.create_user(workspace=workspace)
+    role_viewer = Role.objects.get(uid="VIEWER")
+
+    version = get_workspace_permissions_version(workspace.id)
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=role_viewer, scope=database
+    )
+    assert get_workspace_permissions_version(workspace.id) != version
+
+    version = get_workspace_permissions_version(workspace.id)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+    assert get_workspace_permissions_version(workspace.id) != version
+
+    version = get_workspace_permissions_version(workspace.id)
+    enterprise_data_fixture.create_subject(team, user)
+    assert get_workspace_permissions_version(workspace.id) != version
+
+    version = get_workspace_permissions_version(workspace.id)
+    RoleAssignmentHandler().remove_role(user, workspace, scope=database)
+    assert get_workspace_permissions_version(workspace.id) != version
@@ -0,0 +1,20 @@
+from rest_framework import fields
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+)
+
+
+class CompressibleExporterOptionsSerializer(BaseExporterOptionsSerializer):
+    compress = fields.BooleanField(
+        default=False,
+        help_text="Whether or not to gzip compress the export file.",
+    )
+
+
+class JsonExporterOptionsSerializer(CompressibleExporterOptionsSerializer):
+    json_compact = fields.BooleanField(
+        default=False,
+        help_text="Whether or not to write the JSON without any indentation and "
+        "whitespace, which results in a smaller file.",
+    )
@@ -8,6 +8,7 @@ class BaserowPremiumConfig(AppConfig):
 
     def ready(self):
         # noinspection PyUnresolvedReferences
+        import baserow_premium.license.receivers  # noqa: F401
         import baserow_premium.row_comments.receivers  # noqa: F401
         from baserow_premium.api.user.user_data_types import ActiveLicensesDataType
         from baserow_premium.row_comments.row_metadata_types import (
@@ -43,7 +44,12 @@ class BaserowPremiumConfig(AppConfig):
 
         action_type_registry.register(GenerateFormulaWithAIActionType())
 
-        from .export.exporter_types import JSONTableExporter, XMLTableExporter
+        from .export.exporter_types import (
+            JSONTableExporter,
+            NDJSONTableExporter,
+            ParquetTableExporter,
+            XMLTableExporter,
+        )
         from .plugins import PremiumPlugin
         from .views.decorator_types import (
             BackgroundColorDecoratorType,
@@ -59,7 +65,9 @@ class BaserowPremiumConfig(AppConfig):
         plugin_registry.register(PremiumPlugin())
 
         table_exporter_registry.register(JSONTableExporter())
+        table_exporter_registry.register(NDJSONTableExporter())
         table_exporter_registry.register(XMLTableExporter())
+        table_exporter_registry.register(ParquetTableExporter())
 
         row_metadata_registry.register(RowCommentCountMetadataType())
         row_metadata_registry.register(RowCommentsNotificationModeMetadataType())
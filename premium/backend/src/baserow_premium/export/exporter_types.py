@@ -1,7 +1,17 @@
+import io
 import json
 from collections import OrderedDict
-from typing import List, Type
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Tuple, Type
 
+from django.db import models
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from baserow_premium.api.export.serializers import (
+    CompressibleExporterOptionsSerializer,
+    JsonExporterOptionsSerializer,
+)
 from baserow_premium.license.handler import LicenseHandler
 
 from baserow.contrib.database.api.export.serializers import (
@@ -9,11 +19,17 @@ from baserow.contrib.database.api.export.serializers import (
 )
 from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
 from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.fields.field_types import FileFieldType
+from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.view_types import GridViewType
 
 from ..license.features import PREMIUM
 from .utils import get_unique_name, safe_xml_tag_name, to_xml
 
+# The highest decimal precision supported by arrow, numbers with more digits are
+# exported as text.
+MAX_ARROW_DECIMAL_PRECISION = 76
+
 
 class PremiumTableExporter(TableExporter):
     def before_job_create(self, user, table, view, export_options):
@@ -27,10 +43,80 @@ class PremiumTableExporter(TableExporter):
         super().before_job_create(user, table, view, export_options)
 
 
-class JSONQuerysetSerializer(QuerysetSerializer):
+class CompressiblePremiumTableExporter(PremiumTableExporter):
+    def get_file_extension(self, export_options: Dict[str, Any]) -> str:
+        extension = super().get_file_extension(export_options)
+        if export_options.get("compress", False):
+            extension += ".gz"
+        return extension
+
+
+class BufferedJSONQuerysetSerializer(QuerysetSerializer):
+    """
+    Base class for the serializers writing every row as a JSON object. The rows are
+    encoded with a single encoder and written to the file in chunks of roughly
+    `write_buffer_size` characters instead of with multiple writes per row.
+    """
+
     can_handle_rich_value = True
+    write_buffer_size = 64 * 1024
+
+    def get_row_data(self, row) -> Dict[str, Any]:
+        data = {}
+        for field_serializer in self.field_serializers:
+            _, field_name, field_value = field_serializer(row)
+            field_name = get_unique_name(data, field_name, separator=" ")
+            data[field_name] = field_value
+        return data
+
+    def write_json_rows(
+        self,
+        file_writer: FileWriter,
+        encoder: json.JSONEncoder,
+        row_separator: str,
+        export_charset: str = "utf-8",
+        separate_last_row: bool = False,
+    ):
+        """
+        Writes every row in the queryset as a JSON object followed by the
+        `row_separator`.
 
-    def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
+        :param file_writer: The file writer to use to do the writing.
+        :param encoder: The encoder used to convert the rows to JSON.
+        :param row_separator: The string written between the rows.
+        :param export_charset: The charset to write to the file using.
+        :param separate_last_row: Whether or not the separator must also be written
+            after the last row.
+        """
+
+        buffer = []
+        buffer_size = 0
+
+        def write_row(row, last_row):
+            nonlocal buffer_size
+
+            value = encoder.encode(self.get_row_data(row))
+            if not last_row or separate_last_row:
+                value += row_separator
+            buffer.append(value)
+            buffer_size += len(value)
+
+            if last_row or buffer_size >= self.write_buffer_size:
+                file_writer.write("".join(buffer), encoding=export_charset)
+                buffer.clear()
+                buffer_size = 0
+
+        file_writer.write_rows(self.queryset, write_row)
+
+
+class JSONQuerysetSerializer(BufferedJSONQuerysetSerializer):
+    def write_to_file(
+        self,
+        file_writer: FileWriter,
+        export_charset="utf-8",
+        json_compact=False,
+        compress=False,
+    ):
         """
         Writes the queryset to the provided file in json format. Will generate
         semi-structured json based on the fields in the queryset.
@@ -44,26 +130,23 @@ class JSONQuerysetSerializer(QuerysetSerializer):
 
         :param file_writer: The file writer to use to do the writing.
         :param export_charset: The charset to write to the file using.
+        :param json_compact: Whether or not to encode the rows without indentation
+            and whitespace.
+        :param compress: Whether or not to gzip compress the file.
         """
 
-        file_writer.write("[\n", encoding=export_charset)
-
-        def write_row(row, last_row):
-            data = {}
-            for field_serializer in self.field_serializers:
-                _, field_name, field_csv_value = field_serializer(row)
-                field_name = get_unique_name(data, field_name, separator=" ")
-                data[field_name] = field_csv_value
+        if json_compact:
+            encoder = json.JSONEncoder(separators=(",", ":"))
+        else:
+            encoder = json.JSONEncoder(indent=4)
 
-            file_writer.write(json.dumps(data, indent=4), encoding=export_charset)
-            if not last_row:
-                file_writer.write(",\n", encoding=export_charset)
-
-        file_writer.write_rows(self.queryset, write_row)
-        file_writer.write("\n]\n", encoding=export_charset)
+        with file_writer.gzip_compressed() if compress else nullcontext():
+            file_writer.write("[\n", encoding=export_charset)
+            self.write_json_rows(file_writer, encoder, ",\n", export_charset)
+            file_writer.write("\n]\n", encoding=export_charset)
 
 
-class JSONTableExporter(PremiumTableExporter):
+class JSONTableExporter(CompressiblePremiumTableExporter):
     type = "json"
 
     @property
@@ -72,7 +155,7 @@ class JSONTableExporter(PremiumTableExporter):
 
     @property
     def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
-        return BaseExporterOptionsSerializer
+        return JsonExporterOptionsSerializer
 
     @property
     def can_export_table(self) -> bool:
@@ -87,6 +170,53 @@ class JSONTableExporter(PremiumTableExporter):
         return ".json"
 
 
+class NDJSONQuerysetSerializer(BufferedJSONQuerysetSerializer):
+    def write_to_file(
+        self, file_writer: FileWriter, export_charset="utf-8", compress=False
+    ):
+        """
+        Writes the queryset to the provided file in newline delimited json format.
+        Every row in the queryset is written as a compact json object on its own
+        line, so that the file can be processed line by line:
+        {...}
+        {...}
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: The charset to write to the file using.
+        :param compress: Whether or not to gzip compress the file.
+        """
+
+        encoder = json.JSONEncoder(separators=(",", ":"))
+        with file_writer.gzip_compressed() if compress else nullcontext():
+            self.write_json_rows(
+                file_writer, encoder, "\n", export_charset, separate_last_row=True
+            )
+
+
+class NDJSONTableExporter(CompressiblePremiumTableExporter):
+    type = "ndjson"
+
+    @property
+    def queryset_serializer_class(self):
+        return NDJSONQuerysetSerializer
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return CompressibleExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".ndjson"
+
+
 class XMLQuerysetSerializer(QuerysetSerializer):
     can_handle_rich_value = True
 
@@ -150,3 +280,182 @@ class XMLTableExporter(PremiumTableExporter):
     @property
     def file_extension(self) -> str:
         return ".xml"
+
+
+class ArrowOutputStream(io.RawIOBase):
+    """
+    A minimal writable file object forwarding everything written by pyarrow to the
+    file writer, so that the parquet file is written to the storage while it's
+    being generated.
+    """
+
+    def __init__(self, file_writer: FileWriter):
+        self._file_writer = file_writer
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, value) -> int:
+        value = bytes(value)
+        self._file_writer.write_bytes(value)
+        self._position += len(value)
+        return len(value)
+
+    def tell(self) -> int:
+        return self._position
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    row_group_size = 10000
+
+    def __init__(self, queryset, ordered_field_objects):
+        super().__init__(queryset, ordered_field_objects)
+        self.field_objects = list(ordered_field_objects)
+
+    def get_column_type_and_converter(
+        self, field_object: FieldObject
+    ) -> Tuple[pa.DataType, Callable[[Any], Any]]:
+        """
+        Returns the arrow type of the column of the provided field and a function
+        converting the value of a row to a value of that type. Numbers, dates,
+        durations and booleans keep their type, values containing multiple items
+        like link rows and multiple select options become list columns and all
+        other values are exported as text.
+
+        :param field_object: The field object to get the column type for.
+        :return: The arrow type and the function converting the row value.
+        """
+
+        field_type = field_object["type"]
+        model_field = self.queryset.model._meta.get_field(field_object["name"])
+        # The values of formulas are stored in a column matching their type.
+        model_field = getattr(model_field, "expression_field", model_field)
+
+        def export_value(value, rich_value=False):
+            return field_type.get_export_value(
+                value, field_object, rich_value=rich_value
+            )
+
+        if (
+            model_field.many_to_many
+            or isinstance(field_type, FileFieldType)
+            or getattr(field_object["field"], "formula_type", None) == "array"
+        ):
+
+            def to_list(value):
+                return [
+                    json.dumps(item) if isinstance(item, (dict, list)) else str(item)
+                    for item in export_value(value, rich_value=True) or []
+                ]
+
+            return pa.list_(pa.string()), to_list
+
+        if isinstance(model_field, models.BooleanField):
+            return pa.bool_(), bool
+        if isinstance(model_field, (models.IntegerField, models.AutoField)):
+            return pa.int64(), int
+        if (
+            isinstance(model_field, models.DecimalField)
+            and model_field.max_digits is not None
+            and model_field.max_digits <= MAX_ARROW_DECIMAL_PRECISION
+        ):
+            decimal_type = (
+                pa.decimal256 if model_field.max_digits > 38 else pa.decimal128
+            )
+            return (
+                decimal_type(model_field.max_digits, model_field.decimal_places),
+                lambda value: value,
+            )
+        if isinstance(model_field, models.DateTimeField):
+            return pa.timestamp("us", tz="UTC"), lambda value: value
+        if isinstance(model_field, models.DateField):
+            return pa.date32(), lambda value: value
+        if isinstance(model_field, models.DurationField):
+            return pa.duration("us"), lambda value: value
+
+        def to_text(value):
+            value = export_value(value)
+            return None if value is None else str(value)
+
+        return pa.string(), to_text
+
+    def write_to_file(self, file_writer: FileWriter, **kwargs):
+        """
+        Writes the queryset to the provided file in the parquet format. Every field
+        becomes a typed column. The rows are converted to columns in batches of
+        `row_group_size` rows, which are written as separate row groups, so that
+        only one batch is kept in memory.
+
+        :param file_writer: The file writer to use to do the writing.
+        """
+
+        names = {"id": None}
+        columns = [("id", pa.int64(), int)]
+        for field_object in self.field_objects:
+            name = get_unique_name(names, field_object["field"].name, separator=" ")
+            names[name] = None
+            columns.append(
+                (
+                    field_object["name"],
+                    *self.get_column_type_and_converter(field_object),
+                )
+            )
+
+        schema = pa.schema(
+            [
+                (name, column_type)
+                for name, (_, column_type, _) in zip(names.keys(), columns)
+            ]
+        )
+        batch = [[] for _ in columns]
+
+        def write_batch():
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array(values, type=column_type)
+                        for values, (_, column_type, _) in zip(batch, columns)
+                    ],
+                    schema=schema,
+                )
+            )
+            for values in batch:
+                values.clear()
+
+        def write_row(row, last_row):
+            for values, (attribute, _, converter) in zip(batch, columns):
+                value = getattr(row, attribute)
+                values.append(None if value is None else converter(value))
+
+            if last_row or len(batch[0]) >= self.row_group_size:
+                write_batch()
+
+        with pq.ParquetWriter(
+            pa.PythonFile(ArrowOutputStream(file_writer), mode="w"), schema
+        ) as writer:
+            file_writer.write_rows(self.queryset, write_row)
+
+
+class ParquetTableExporter(PremiumTableExporter):
+    type = "parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return BaseExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
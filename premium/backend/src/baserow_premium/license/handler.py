@@ -30,6 +30,7 @@ from requests.exceptions import RequestException
 from rest_framework.status import HTTP_200_OK
 
 from baserow.api.user.registries import user_data_registry
+from baserow.core.cache import invalidate_all_workspaces_permissions
 from baserow.core.exceptions import IsNotAdminError
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Workspace
@@ -178,6 +179,31 @@ class LicenseHandler:
             )
         return public_key
 
+    @classmethod
+    def get_seconds_until_next_validity_change(cls) -> Optional[float]:
+        """
+        Returns the number of seconds until one of the licenses becomes valid or
+        expires, which changes the available features without the licenses being
+        changed.
+
+        :return: The number of seconds or None if no license will become valid or
+            expire.
+        """
+
+        current_time = now()
+        seconds = []
+        for license_object in License.objects.all():
+            try:
+                moments = [license_object.valid_from, license_object.valid_through]
+            except (InvalidLicenseError, UnsupportedLicenseError):
+                continue
+            seconds.extend(
+                (moment - current_time).total_seconds()
+                for moment in moments
+                if moment > current_time
+            )
+        return min(seconds, default=None)
+
     @classmethod
     def decode_license(cls, license_payload: bytes) -> dict:
         """
@@ -664,6 +690,8 @@ class LicenseHandler:
                 LicenseUser(license=license_object, user=user) for user in users_to_add
             ]
             LicenseUser.objects.bulk_create(user_licenses)
+            # The model signals aren't sent by `bulk_create`.
+            invalidate_all_workspaces_permissions()
 
             if license_object.is_active:
                 al = user_data_registry.get_by_type(ActiveLicensesDataType)
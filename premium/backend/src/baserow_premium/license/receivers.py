@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from baserow_premium.license.models import License, LicenseUser
+
+from baserow.core.cache import invalidate_all_workspaces_permissions
+
+
+@receiver(post_save, sender=License)
+@receiver(post_delete, sender=License)
+@receiver(post_save, sender=LicenseUser)
+@receiver(post_delete, sender=LicenseUser)
+def invalidate_permissions_when_licenses_changed(sender, **kwargs):
+    # The licenses enable features like the role based permissions, so they can
+    # change the permissions in all the workspaces.
+    invalidate_all_workspaces_permissions()
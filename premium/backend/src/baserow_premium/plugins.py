@@ -1,3 +1,5 @@
+from typing import Optional
+
 from django.urls import include, path
 
 from baserow_premium.api import urls as api_urls
@@ -16,3 +18,10 @@ class PremiumPlugin(Plugin):
 
     def get_license_plugin(self, cache_queries: bool = False) -> LicensePlugin:
         return LicensePlugin(cache_queries)
+
+    def get_permissions_version_timeout(self) -> Optional[float]:
+        from baserow_premium.license.handler import LicenseHandler
+
+        # The features of a license, like the role based permissions, become
+        # available or unavailable when it becomes valid or expires.
+        return LicenseHandler.get_seconds_until_next_validity_change()
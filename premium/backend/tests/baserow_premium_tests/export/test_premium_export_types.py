@@ -1,11 +1,18 @@
-from datetime import timezone
+import gzip
+from datetime import date, datetime, timedelta, timezone
 from io import BytesIO
 from unittest.mock import patch
 
 from django.test.utils import override_settings
 from django.utils.dateparse import parse_date, parse_datetime
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from baserow_premium.export.exporter_types import (
+    NDJSONQuerysetSerializer,
+    ParquetQuerysetSerializer,
+)
 from baserow_premium.license.exceptions import FeaturesNotAvailableError
 
 from baserow.contrib.database.export.handler import ExportHandler
@@ -293,6 +300,93 @@ def test_if_duplicate_field_names_json_export(storage_mock, premium_data_fixture
     )
 
 
+def _create_table_with_two_rows(premium_data_fixture):
+    user = premium_data_fixture.create_user(has_active_premium_license=True)
+    table = premium_data_fixture.create_database_table(user=user)
+    text_field = premium_data_fixture.create_text_field(table=table, name="name")
+    number_field = premium_data_fixture.create_number_field(table=table, name="n")
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "a", number_field.db_column: 1},
+            {text_field.db_column: "ü"},
+        ],
+    )
+    return user, table
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_compact_json(storage_mock, premium_data_fixture):
+    user, table = _create_table_with_two_rows(premium_data_fixture)
+    job, contents = run_export_job_with_mock_storage(
+        table, None, storage_mock, user, {"exporter_type": "json", "json_compact": True}
+    )
+    assert job.exported_file_name.endswith(".json")
+    assert (
+        contents
+        == """[
+{"id":1,"name":"a","n":1},
+{"id":2,"name":"\\u00fc","n":""}
+]
+"""
+    )
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_ndjson(storage_mock, premium_data_fixture):
+    user, table = _create_table_with_two_rows(premium_data_fixture)
+    job, contents = run_export_job_with_mock_storage(
+        table, None, storage_mock, user, {"exporter_type": "ndjson"}
+    )
+    assert job.exported_file_name.endswith(".ndjson")
+    assert (
+        contents
+        == """{"id":1,"name":"a","n":1}
+{"id":2,"name":"\\u00fc","n":""}
+"""
+    )
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_gzip_compressed_ndjson_in_multiple_writes(
+    storage_mock, premium_data_fixture
+):
+    user, table = _create_table_with_two_rows(premium_data_fixture)
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "ndjson", "compress": True}
+    )
+    with patch.object(NDJSONQuerysetSerializer, "write_buffer_size", 1):
+        handler.run_export_job(job)
+
+    assert job.exported_file_name.endswith(".ndjson.gz")
+    assert gzip.decompress(stub_file.getvalue()).decode("utf-8") == (
+        '{"id":1,"name":"a","n":1}\n{"id":2,"name":"\\u00fc","n":""}\n'
+    )
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_cannot_export_ndjson_without_premium_license(
+    storage_mock, premium_data_fixture
+):
+    with pytest.raises(FeaturesNotAvailableError):
+        run_export_over_interesting_test_table(
+            premium_data_fixture, storage_mock, {"exporter_type": "ndjson"}
+        )
+
+
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
 @patch("baserow.contrib.database.export.handler.default_storage")
@@ -579,6 +673,62 @@ def strip_indents_and_newlines(xml):
     return "".join([line.strip() for line in xml.split("\n")])
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_every_interesting_different_field_to_parquet(
+    storage_mock, premium_data_fixture
+):
+    table, user, _, _, context = setup_interesting_test_table(
+        premium_data_fixture,
+        user_kwargs={"has_active_premium_license": True, "email": "user@example.com"},
+    )
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "parquet"}
+    )
+    with patch.object(ParquetQuerysetSerializer, "row_group_size", 1):
+        handler.run_export_job(job)
+
+    assert job.exported_file_name.endswith(".parquet")
+    parquet_file = pq.ParquetFile(BytesIO(stub_file.getvalue()))
+    # Every row is written in a separate row group.
+    assert parquet_file.metadata.num_row_groups == parquet_file.metadata.num_rows
+    exported = parquet_file.read()
+    schema = exported.schema
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("text").type == pa.string()
+    assert schema.field("positive_int").type == pa.decimal256(50, 0)
+    assert schema.field("positive_decimal").type == pa.decimal256(51, 1)
+    assert schema.field("rating").type == pa.int64()
+    assert schema.field("boolean").type == pa.bool_()
+    assert schema.field("datetime_us").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("date_us").type == pa.date32()
+    assert schema.field("duration_hm").type == pa.duration("us")
+    assert schema.field("link_row").type == pa.list_(pa.string())
+    assert schema.field("multiple_select").type == pa.list_(pa.string())
+    assert schema.field("file").type == pa.list_(pa.string())
+    assert schema.field("lookup").type == pa.list_(pa.string())
+    assert schema.field("formula_bool").type == pa.bool_()
+
+    rows = exported.to_pylist()
+    assert rows[0]["id"] == 1
+    assert rows[0]["text"] is None
+    assert rows[0]["link_row"] == []
+    assert rows[1]["text"] == "text"
+    assert rows[1]["boolean"] is True
+    assert rows[1]["positive_int"] == 1
+    assert rows[1]["date_us"] == date(2020, 2, 1)
+    assert rows[1]["datetime_us"] == datetime(2020, 2, 1, 1, 23, tzinfo=timezone.utc)
+    assert rows[1]["duration_hm"] == timedelta(hours=1, minutes=1)
+    assert rows[1]["link_row"] == ["linked_row_1", "linked_row_2", ""]
+    assert rows[1]["single_select"] == "A"
+    assert rows[1]["formula_bool"] is True
+
+
 def run_export_over_interesting_test_table(
     premium_data_fixture, storage_mock, options, user_kwargs=None, user=None
 ):
@@ -1,4 +1,5 @@
 import base64
+from datetime import timezone
 from unittest.mock import patch
 
 from django.db import transaction
@@ -27,6 +28,7 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from freezegun import freeze_time
 from rest_framework.status import HTTP_200_OK
 
+from baserow.core.cache import get_permissions_version
 from baserow.core.exceptions import IsNotAdminError
 
 VALID_ONE_SEAT_LICENSE = (
@@ -1002,3 +1004,49 @@ def test_add_active_licenses_to_settings(api_client, data_fixture):
         response_json = response.json()
         assert len(response_json.keys()) > 1
         assert response_json["instance_wide_licenses"] == {"enterprise": True}
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DEBUG=True)
+def test_license_changes_invalidate_the_permissions_of_all_workspaces(data_fixture):
+    user = data_fixture.create_user()
+
+    version = get_permissions_version()
+    license = License.objects.create(license=VALID_TWO_SEAT_LICENSE.decode())
+    assert get_permissions_version() != version
+
+    version = get_permissions_version()
+    LicenseUser.objects.create(license=license, user=user)
+    assert get_permissions_version() != version
+
+    version = get_permissions_version()
+    license.delete()
+    assert get_permissions_version() != version
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_get_seconds_until_next_validity_change(data_fixture):
+    assert LicenseHandler.get_seconds_until_next_validity_change() is None
+
+    license = License.objects.create(license=VALID_TWO_SEAT_LICENSE.decode())
+    License.objects.create(license="invalid")
+
+    with freeze_time("2021-08-01 12:00") as frozen_time:
+        assert (
+            LicenseHandler.get_seconds_until_next_validity_change()
+            == (
+                license.valid_from - frozen_time().replace(tzinfo=timezone.utc)
+            ).total_seconds()
+        )
+
+    with freeze_time("2021-09-01 12:00") as frozen_time:
+        assert (
+            LicenseHandler.get_seconds_until_next_validity_change()
+            == (
+                license.valid_through - frozen_time().replace(tzinfo=timezone.utc)
+            ).total_seconds()
+        )
+
+    with freeze_time("2021-10-01 12:00"):
+        assert LicenseHandler.get_seconds_until_next_validity_change() is None
@@ -1,7 +1,9 @@
 import { PremiumPlugin } from '@baserow_premium/plugins'
 import {
   JSONTableExporter,
+  NDJSONTableExporter,
   XMLTableExporter,
+  ParquetTableExporter,
 } from '@baserow_premium/tableExporterTypes'
 import {
   DashboardType,
@@ -93,7 +95,9 @@ export default (context) => {
   app.$registry.register('admin', new WorkspacesAdminType(context))
   app.$registry.register('admin', new LicensesAdminType(context))
   app.$registry.register('exporter', new JSONTableExporter(context))
+  app.$registry.register('exporter', new NDJSONTableExporter(context))
   app.$registry.register('exporter', new XMLTableExporter(context))
+  app.$registry.register('exporter', new ParquetTableExporter(context))
   app.$registry.register('field', new AIFieldType(context))
   app.$registry.register('field', new PremiumFormulaFieldType(context))
   app.$registry.register('view', new KanbanViewType(context))
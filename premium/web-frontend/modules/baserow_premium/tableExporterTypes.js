@@ -1,7 +1,9 @@
 import { TableExporterType } from '@baserow/modules/database/exporterTypes'
 import { GridViewType } from '@baserow/modules/database/viewTypes'
 import TableJSONExporter from '@baserow_premium/components/exporter/TableJSONExporter'
+import TableNDJSONExporter from '@baserow_premium/components/exporter/TableNDJSONExporter'
 import TableXMLExporter from '@baserow_premium/components/exporter/TableXMLExporter'
+import TableParquetExporter from '@baserow_premium/components/exporter/TableParquetExporter'
 import PremiumModal from '@baserow_premium/components/PremiumModal'
 import PremiumFeatures from '@baserow_premium/features'
 
@@ -46,6 +48,33 @@ export class JSONTableExporter extends PremiumTableExporterType {
   }
 }
 
+export class NDJSONTableExporter extends PremiumTableExporterType {
+  static getType() {
+    return 'ndjson'
+  }
+
+  getIconClass() {
+    return 'baserow-icon-file-code'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('premium.exporterType.ndjson')
+  }
+
+  getFormComponent() {
+    return TableNDJSONExporter
+  }
+
+  getCanExportTable() {
+    return true
+  }
+
+  getSupportedViews() {
+    return [GridViewType.getType()]
+  }
+}
+
 export class XMLTableExporter extends PremiumTableExporterType {
   static getType() {
     return 'xml'
@@ -72,3 +101,30 @@ export class XMLTableExporter extends PremiumTableExporterType {
     return [GridViewType.getType()]
   }
 }
+
+export class ParquetTableExporter extends PremiumTableExporterType {
+  static getType() {
+    return 'parquet'
+  }
+
+  getIconClass() {
+    return 'baserow-icon-file-code'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('premium.exporterType.parquet')
+  }
+
+  getFormComponent() {
+    return TableParquetExporter
+  }
+
+  getCanExportTable() {
+    return true
+  }
+
+  getSupportedViews() {
+    return [GridViewType.getType()]
+  }
+}